@@ -9,6 +9,7 @@ export default function App() {
   const {
     articles,
     loading,
+    loadingMore,
     error,
     searchTerm,
     setSearchTerm,
@@ -18,6 +19,8 @@ export default function App() {
     setSortBy,
     categories,
     stats,
+    hasMore,
+    loadMore,
   } = useArticles();
 
   const [selectedArticle, setSelectedArticle] = useState(null);
@@ -40,8 +43,8 @@ export default function App() {
           <h2 className="text-2xl font-bold text-red-600 mb-4">❌ Erreur</h2>
           <p className="text-gray-700 mb-2">{error}</p>
           <p className="text-gray-500">
-            Assurez-vous que le fichier articles.json est présent dans le
-            dossier public.
+            Assurez-vous que le fichier data/index.json (ou l'ancien
+            articles.json) est présent dans le dossier public.
           </p>
         </div>
       </div>
@@ -95,6 +98,18 @@ export default function App() {
             ))}
           </div>
         )}
+
+        {hasMore && (
+          <div className="text-center mt-8">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="bg-blue-600 hover:bg-blue-700 disabled:opacity-60 text-white px-6 py-2 rounded-lg font-medium transition-colors duration-200"
+            >
+              {loadingMore ? "Chargement..." : "Charger plus d'articles"}
+            </button>
+          </div>
+        )}
       </main>
 
       {selectedArticle && (
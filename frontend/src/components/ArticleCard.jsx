@@ -6,6 +6,9 @@ export default function ArticleCard({ article, onClick }) {
     e.target.style.display = 'none';
   };
 
+  //-- les cartes des fichiers de partitions n'ont que le nombre d'images
+  const imagesCount = article.images_count ?? (article.images ? article.images.length : 0);
+
   return (
     <div 
       className="bg-white rounded-xl overflow-hidden shadow-sm hover:shadow-lg transition-all duration-300 cursor-pointer transform hover:-translate-y-1 h-full flex flex-col"
@@ -45,9 +48,9 @@ export default function ArticleCard({ article, onClick }) {
         
         <div className="flex justify-between items-center mt-auto">
           <div className="flex items-center gap-2">
-            {article.images && article.images.length > 0 && (
+            {imagesCount > 0 && (
               <span className="text-xs text-gray-500 flex items-center gap-1">
-                📷 {article.images.length}
+                📷 {imagesCount}
               </span>
             )}
           </div>
@@ -1,7 +1,22 @@
-import React from 'react';
+import React, { useState, useEffect } from 'react';
 import { formatDate, capitalize } from '../utils/dateUtils';
+import { loadArticle } from '../utils/articlesApi';
+
+export default function ArticleDetail({ article: card, onClose }) {
+  //-- la carte suffit pour l'en-tête ; contenu et images viennent du fichier de la partition
+  const [loaded, setLoaded] = useState(null);
+  const [loadError, setLoadError] = useState(null);
+
+  useEffect(() => {
+    if (!card) return;
+    let cancelled = false;
+    setLoadError(null);
+    loadArticle(card)
+      .then(full => { if (!cancelled) setLoaded(full); })
+      .catch(err => { if (!cancelled) setLoadError(err.message); });
+    return () => { cancelled = true; };
+  }, [card]);
 
-export default function ArticleDetail({ article, onClose }) {
   const handleImageError = (e) => {
     e.target.style.display = 'none';
   };
@@ -12,7 +27,11 @@ export default function ArticleDetail({ article, onClose }) {
     }
   };
 
-  if (!article) return null;
+  if (!card) return null;
+
+  const full = loaded && loaded.url === card.url ? loaded : null;
+  const article = full || card;
+  const contentLoading = !full && !loadError;
 
   return (
     <div className="fixed inset-0 bg-black bg-opacity-70 flex items-start justify-center z-50 overflow-y-auto p-4" onClick={handleBackdropClick}>
@@ -80,8 +99,14 @@ export default function ArticleDetail({ article, onClose }) {
 
             <div className="mb-8">
               <h3 className="text-xl font-bold text-gray-900 mb-4 pb-2 border-b-2 border-gray-200">Contenu de l'article</h3>
+              {contentLoading && (
+                <p className="text-gray-500 italic">Chargement du contenu...</p>
+              )}
+              {loadError && (
+                <p className="text-red-600">{loadError}</p>
+              )}
               <div className="prose max-w-none">
-                {article.content.split('\n').map((paragraph, index) => (
+                {(article.content || '').split('\n').map((paragraph, index) => (
                   paragraph.trim() && (
                     <p key={index} className="text-gray-700 leading-relaxed mb-4 text-justify">{paragraph.trim()}</p>
                   )
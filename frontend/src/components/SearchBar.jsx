@@ -6,7 +6,7 @@ export default function SearchBar({ searchTerm, onSearchChange, articlesCount })
       <div className="relative max-w-2xl mx-auto">
         <input
           type="text"
-          placeholder="Rechercher dans les articles..."
+          placeholder="Rechercher par titre, auteur ou résumé..."
           value={searchTerm}
           onChange={(e) => onSearchChange(e.target.value)}
           className="w-full px-4 py-3 pr-12 text-gray-900 placeholder-gray-500 bg-white border-2 border-gray-200 rounded-full shadow-sm focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500 transition-all duration-200"
@@ -1,93 +1,171 @@
-import { useState, useEffect, useMemo } from 'react';
+import { useState, useEffect, useMemo, useCallback, useRef } from 'react';
+import { buildSearchText, searchTerms } from '../utils/searchUtils';
+import { loadIndex, loadListing } from '../utils/articlesApi';
+import { useDebouncedValue } from './useDebouncedValue';
+
+//-- nombre d'articles chargés en plus à chaque page
+const PAGE_SIZE = 60;
+//-- la recherche part après cette pause dans la saisie (ms), à partir de MIN_SEARCH_LENGTH caractères
+const SEARCH_DELAY = 300;
+const MIN_SEARCH_LENGTH = 2;
 
 export const useArticles = () => {
+  const [index, setIndex] = useState(null);
   const [articles, setArticles] = useState([]);
+  const [loaded, setLoaded] = useState(() => new Set());
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedCategory, setSelectedCategory] = useState('all');
   const [sortBy, setSortBy] = useState('date');
+  //-- partitions déjà demandées (chargées ou en cours)
+  const requested = useRef(new Set());
 
-  //-- Charger les articles
+  //-- Charger l'index des partitions
   useEffect(() => {
-    const loadArticles = async () => {
-      try {
-        setLoading(true);
-        const response = await fetch('/articles.json');
-        if (!response.ok) {
-          throw new Error('Erreur lors du chargement des articles');
-        }
-        const data = await response.json();
-        setArticles(data);
-      } catch (err) {
+    loadIndex()
+      .then(setIndex)
+      .catch(err => {
         setError(err.message);
-      } finally {
         setLoading(false);
-      }
-    };
+      });
+  }, []);
+
+  //-- Partitions de la catégorie sélectionnée pas encore chargées (mois les plus récents d'abord)
+  const pendingPartitions = useMemo(() => {
+    if (!index) return [];
+    return index.partitions.filter(partition =>
+      !loaded.has(partition.listing) &&
+      (selectedCategory === 'all' || partition.category === selectedCategory)
+    );
+  }, [index, loaded, selectedCategory]);
+
+  //-- Charger les cartes de ces partitions
+  const loadPartitions = useCallback(async (partitions) => {
+    const wanted = partitions.filter(partition => !requested.current.has(partition.listing));
+    if (!wanted.length) return;
+    wanted.forEach(partition => requested.current.add(partition.listing));
 
-    loadArticles();
+    try {
+      setLoadingMore(true);
+      const listings = await Promise.all(wanted.map(loadListing));
+      setArticles(previous => previous.concat(...listings));
+      setLoaded(previous => {
+        const next = new Set(previous);
+        wanted.forEach(partition => next.add(partition.listing));
+        return next;
+      });
+    } catch (err) {
+      wanted.forEach(partition => requested.current.delete(partition.listing));
+      setError(err.message);
+    } finally {
+      setLoadingMore(false);
+      setLoading(false);
+    }
   }, []);
 
+  //-- Page suivante : les partitions suivantes, jusqu'à PAGE_SIZE articles de plus
+  const loadMore = useCallback(() => {
+    const page = [];
+    let count = 0;
+    for (const partition of pendingPartitions) {
+      if (count >= PAGE_SIZE) break;
+      page.push(partition);
+      count += partition.count;
+    }
+    return loadPartitions(page);
+  }, [pendingPartitions, loadPartitions]);
+
+  //-- Premier affichage et changement de catégorie : au moins une page d'articles
+  const loadedInCategory = useMemo(() => {
+    if (selectedCategory === 'all') return articles.length;
+    return articles.filter(article => article.category_scraped === selectedCategory).length;
+  }, [articles, selectedCategory]);
+
+  useEffect(() => {
+    if (!index) return;
+    if (loadedInCategory < PAGE_SIZE && pendingPartitions.length) {
+      loadMore();
+    } else {
+      setLoading(false);
+    }
+  }, [index, loadedInCategory, pendingPartitions, loadMore]);
+
+  //-- Recherche : elle porte sur toutes les cartes de la catégorie, chargées une fois la saisie
+  //-- terminée (pas à chaque frappe)
+  const debouncedSearch = useDebouncedValue(searchTerm, SEARCH_DELAY);
+  const terms = useMemo(() => {
+    const words = searchTerms(debouncedSearch);
+    return words.join('').length >= MIN_SEARCH_LENGTH ? words : [];
+  }, [debouncedSearch]);
+  const hasSearch = terms.length > 0;
+  useEffect(() => {
+    if (hasSearch && pendingPartitions.length) {
+      loadPartitions(pendingPartitions);
+    }
+  }, [hasSearch, pendingPartitions, loadPartitions]);
+
+  //-- Texte de recherche de chaque article (sans accents), calculé une fois au chargement
+  const searchTexts = useMemo(() => {
+    const texts = new Map();
+    articles.forEach(article => texts.set(article, buildSearchText(article)));
+    return texts;
+  }, [articles]);
+
   //-- Filtrer et trier les articles
   const filteredArticles = useMemo(() => {
     let filtered = articles;
 
-    //-- Filtrage par terme de recherche
-    if (searchTerm) {
-      filtered = filtered.filter(article =>
-        article.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        article.content.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        article.author.toLowerCase().includes(searchTerm.toLowerCase())
-      );
+    //-- Filtrage par terme de recherche : chaque mot doit apparaître
+    if (terms.length) {
+      filtered = filtered.filter(article => {
+        const text = searchTexts.get(article);
+        return terms.every(term => text.includes(term));
+      });
     }
 
     //-- Filtrage par catégorie
     if (selectedCategory !== 'all') {
-      filtered = filtered.filter(article => 
+      filtered = filtered.filter(article =>
         article.category_scraped === selectedCategory
       );
     }
 
-    //-- Tri
-    filtered.sort((a, b) => {
+    //-- Tri (sur une copie : la liste chargée garde son ordre)
+    return [...filtered].sort((a, b) => {
       switch (sortBy) {
         case 'date':
-          return b.publication_date.localeCompare(a.publication_date);
+          return (b.publication_date || '').localeCompare(a.publication_date || '');
         case 'title':
-          return a.title.localeCompare(b.title);
+          return (a.title || '').localeCompare(b.title || '');
         case 'author':
-          return a.author.localeCompare(b.author);
+          return (a.author || '').localeCompare(b.author || '');
         default:
           return 0;
       }
     });
+  }, [articles, searchTexts, terms, selectedCategory, sortBy]);
 
-    return filtered;
-  }, [articles, searchTerm, selectedCategory, sortBy]);
-
-  //-- Obtenir les catégories uniques
+  //-- Catégories et stats de toute la base (index), pas seulement des articles chargés
   const categories = useMemo(() => {
-    const uniqueCategories = [...new Set(articles.map(article => article.category_scraped))];
-    return uniqueCategories.sort();
-  }, [articles]);
+    return index ? Object.keys(index.stats.by_category).sort() : [];
+  }, [index]);
 
-  //-- Stats
   const stats = useMemo(() => {
+    const indexStats = index ? index.stats : { total: 0, by_category: {}, authors: 0, with_images: 0 };
     return {
-      total: articles.length,
-      byCategory: categories.reduce((acc, category) => {
-        acc[category] = articles.filter(article => article.category_scraped === category).length;
-        return acc;
-      }, {}),
-      authors: [...new Set(articles.map(article => article.author))].length,
-      withImages: articles.filter(article => article.images && article.images.length > 0).length
+      total: indexStats.total,
+      byCategory: indexStats.by_category,
+      authors: indexStats.authors,
+      withImages: indexStats.with_images
     };
-  }, [articles, categories]);
+  }, [index]);
 
   return {
     articles: filteredArticles,
     loading,
+    loadingMore,
     error,
     searchTerm,
     setSearchTerm,
@@ -97,6 +175,8 @@ export const useArticles = () => {
     setSortBy,
     categories,
     stats,
-    totalArticles: articles.length
+    hasMore: pendingPartitions.length > 0,
+    loadMore,
+    totalArticles: stats.total
   };
 };
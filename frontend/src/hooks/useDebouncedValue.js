@@ -0,0 +1,13 @@
+import { useState, useEffect } from 'react';
+
+//-- valeur mise à jour seulement après delay ms sans changement (fin de saisie)
+export const useDebouncedValue = (value, delay) => {
+  const [debounced, setDebounced] = useState(value);
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebounced(value), delay);
+    return () => clearTimeout(timer);
+  }, [value, delay]);
+
+  return debounced;
+};
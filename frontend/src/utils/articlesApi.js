@@ -0,0 +1,86 @@
+//-- fichiers publiés par le backend (utils/frontend_shards.py) : index.json, listing/, content/
+const DATA_URL = '/data';
+//-- ancien fichier complet, lu si les fichiers découpés n'existent pas encore
+const LEGACY_URL = '/articles.json';
+
+//-- réponses déjà demandées : un fichier de partition ne change jamais (signature dans son nom)
+const requests = new Map();
+
+const isJson = (response) =>
+  response.ok && (response.headers.get('content-type') || '').includes('json');
+
+const fetchJson = (url) => {
+  if (!requests.has(url)) {
+    const request = fetch(url).then(response => {
+      if (!isJson(response)) {
+        throw new Error(`Erreur lors du chargement de ${url}`);
+      }
+      return response.json();
+    });
+    //-- une erreur ne reste pas en cache : le fichier sera redemandé
+    request.catch(() => requests.delete(url));
+    requests.set(url, request);
+  }
+  return requests.get(url);
+};
+
+//-- index au format de index.json construit depuis l'ancien articles.json (une partition par catégorie)
+const legacyIndex = (articles) => {
+  const partitions = new Map();
+  articles.forEach(article => {
+    const category = article.category_scraped || null;
+    if (!partitions.has(category)) {
+      partitions.set(category, { category, month: null, listing: `${LEGACY_URL}#${category}`, cards: [] });
+    }
+    partitions.get(category).cards.push(article);
+  });
+
+  const byCategory = {};
+  partitions.forEach(partition => {
+    if (partition.category) {
+      byCategory[partition.category] = partition.cards.length;
+    }
+  });
+
+  return {
+    stats: {
+      total: articles.length,
+      by_category: byCategory,
+      authors: new Set(articles.map(article => article.author).filter(Boolean)).size,
+      with_images: articles.filter(article => article.images && article.images.length > 0).length
+    },
+    partitions: [...partitions.values()].map(partition => ({ ...partition, count: partition.cards.length }))
+  };
+};
+
+//-- index des partitions (catégorie, mois) et statistiques : seul fichier lu au premier affichage
+export const loadIndex = async () => {
+  const response = await fetch(`${DATA_URL}/index.json`, { cache: 'no-cache' });
+  if (isJson(response)) {
+    return response.json();
+  }
+
+  const legacy = await fetch(LEGACY_URL);
+  if (!isJson(legacy)) {
+    throw new Error('Erreur lors du chargement des articles');
+  }
+  return legacyIndex(await legacy.json());
+};
+
+//-- cartes d'une partition, avec le fichier où trouver le contenu complet de chaque article
+export const loadListing = async (partition) => {
+  if (partition.cards) {
+    return partition.cards;
+  }
+  const cards = await fetchJson(`${DATA_URL}/${partition.listing}`);
+  return cards.map(card => ({ ...card, contentFile: partition.content }));
+};
+
+//-- article complet d'une carte (contenu, images), chargé à l'ouverture
+export const loadArticle = async (card) => {
+  if (!card.contentFile) {
+    return card;
+  }
+  const articles = await fetchJson(`${DATA_URL}/${card.contentFile}`);
+  return articles[card.url] || card;
+};
@@ -0,0 +1,17 @@
+//-- minuscules sans accents ni ligatures (comme utils/search_index.py)
+export const foldText = (text) =>
+  (text || '')
+    .toLowerCase()
+    .replace(/œ/g, 'oe')
+    .replace(/æ/g, 'ae')
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '');
+
+//-- texte recherché d'une carte : titre, auteur et résumé (tronqué). Le contenu complet
+//-- n'est pas dans les cartes, il n'est chargé qu'à l'ouverture d'un article
+export const buildSearchText = (article) =>
+  [article.title, article.author, article.summary].map(foldText).join('\n');
+
+//-- termes de la recherche (tous doivent être présents)
+export const searchTerms = (searchTerm) =>
+  foldText(searchTerm).split(/\s+/).filter(Boolean);
@@ -1,20 +1,87 @@
 import sys
 import os
+import threading
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+from typing import List, Dict, Optional
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.list_scraper import ListScraper
 from src.article_scraper import ArticleScraper
-from utils.data_manager import DataManager
+from src.feed_scraper import FeedScraper
+from src.crawl_frontier import CrawlFrontier, canonicalize_url
+from src.reparser import reparse_archive, compare_parsers
+from src.pipeline import ScrapePipeline
+from utils.data_manager import create_data_manager, STORAGE_BACKENDS
+from utils.exporters import EXPORT_FORMATS, parse_since
+from utils.rate_limiter import RateLimiter
+from utils.http_client import HttpClient
+from utils.http_cache import HttpCache
+from utils.html_archive import HtmlArchive
+from utils.html_parser import DEFAULT_BACKEND, set_default_backend, get_default_backend
+from utils.selector_stats import SelectorStats
+from utils.text_cleaner import date_pattern_stats
 
 
 class BlogScrapingManager:
-    def __init__(self):
-        self.list_scraper = ListScraper()
-        self.article_scraper = ArticleScraper()
-        self.data_manager = DataManager()
+    def __init__(self, max_workers: int = 1, max_per_host: int = 2, discovery_window: int = 1,
+                 engine: str = 'threads', parse_workers: Optional[int] = None,
+                 requests_per_second: float = 1.0, burst: int = 1,
+                 timeout: float = 30.0, pool_size: Optional[int] = None,
+                 use_cache: bool = True, cache_size_mb: float = 500,
+                 use_archive: bool = True, parser: Optional[str] = None,
+                 restricted_parse: bool = False, learn_selectors: bool = False,
+                 storage: str = 'json'):
+        # limiteur de débit partagé par les deux scrapers (un seau par site)
+        self.rate_limiter = RateLimiter(requests_per_second, burst)
+        # cache HTTP sur disque : les relances ne retéléchargent que ce qui a changé
+        self.use_cache = use_cache
+        self.cache_size_mb = cache_size_mb
+        self.http_cache = None
+        # archive compressée des pages téléchargées, pour ré-extraire sans re-crawler
+        self.use_archive = use_archive
+        self.archive = None
+        # client HTTP partagé : une session et un pool de connexions pour tous les scrapers
+        # (cache et archive branchés par _open_page_stores avant le premier téléchargement)
+        self.http_client = HttpClient(
+            rate_limiter=self.rate_limiter,
+            pool_size=pool_size or max(10, max_workers),
+            timeout=(min(5.0, timeout), timeout)
+        )
+        # backend de parsing HTML ('html.parser' ou 'lxml')
+        if parser:
+            set_default_backend(parser)
+        self.parser = get_default_backend()
+        if self.parser != DEFAULT_BACKEND:
+            print(f"Parser {self.parser} (expérimental): les champs peuvent différer de {DEFAULT_BACKEND} "
+                  f"sur du HTML mal formé (vérifier avec check-parser {self.parser})")
+        # parsing restreint aux zones lues par les extracteurs (<main>, <article>)
+        self.restricted_parse = restricted_parse
+        self.list_scraper = ListScraper(http_client=self.http_client, parser=self.parser,
+                                        restricted=restricted_parse)
+        # sélecteurs gagnants par site et par champ (data/selector_stats.json) : ceux qui ne
+        # gagnent jamais sont essayés en dernier (optionnel, --learn-selectors)
+        self.selector_stats = SelectorStats() if learn_selectors else None
+        self.article_scraper = ArticleScraper(http_client=self.http_client, parser=self.parser,
+                                              restricted=restricted_parse, selector_stats=self.selector_stats)
+        self.feed_scraper = FeedScraper(http_client=self.http_client, parser=self.parser)
+        # stockage des articles : 'json' (articles.json) ou 'jsonl' (journal en ajout seul)
+        self.data_manager = create_data_manager(storage)
+        
+        # Nombre de threads pour le scraping des articles (1 = séquentiel)
+        self.max_workers = max_workers
+        # Nombre max de requêtes simultanées vers un même site
+        self.max_per_host = max_per_host
+        # Nombre de pages de liste récupérées en parallèle (1 = séquentiel)
+        self.discovery_window = discovery_window
+        # 'threads' (téléchargement + parsing dans le même thread) ou 'pipeline'
+        # (téléchargement, parsing multi-processus et sauvegarde par lots séparés)
+        self.engine = engine
+        self.parse_workers = parse_workers
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
         
         # URLs des différentes catégories du Blog du Modérateur
         self.categories_urls = {
@@ -25,16 +92,45 @@ class BlogScrapingManager:
             'e-commerce': 'https://www.blogdumoderateur.com/e-commerce/',
             'tech': 'https://www.blogdumoderateur.com/tech/',
         }
+        # Index des sitemaps (Yoast) ; seuls les sitemaps d'articles sont lus
+        self.sitemap_url = 'https://www.blogdumoderateur.com/sitemap_index.xml'
     
-    def scrape_category(self, category_name: str, max_pages: int = 2, delay: float = 1.0):
+    def _open_page_stores(self):
+        """
+        Ouvre le cache HTTP et l'archive pour les commandes qui téléchargent des pages :
+        les autres (stats, export, search...) ne créent pas data/http_cache ni data/archive
         """
-        Scrape une catégorie spécifique
+        if self.use_cache and self.http_cache is None:
+            self.http_cache = HttpCache(max_size_mb=self.cache_size_mb)
+            self.http_client.cache = self.http_cache
+        if self.use_archive and self.archive is None:
+            self.archive = HtmlArchive()
+            self.http_client.archive = self.archive
+    
+    def set_delay(self, delay: Optional[float]):
         """
+        Règle le délai moyen entre deux requêtes vers un même site (0 = pas de limite)
+        """
+        if delay is not None:
+            self.rate_limiter.configure(requests_per_second=1.0 / delay if delay > 0 else 0)
+    
+    def scrape_category(self, category_name: str, max_pages: int = 2, delay: Optional[float] = None,
+                        max_workers: Optional[int] = None, incremental: bool = False,
+                        source: str = 'html'):
+        """
+        Scrape une catégorie spécifique.
+        delay remplace le débit du limiteur s'il est fourni.
+        En mode incrémental, seuls les articles absents de la base sont scrapés.
+        source: 'html' (pages de la catégorie) ou 'feed' (flux RSS de la catégorie).
+        """
+        self.set_delay(delay)
+        
         if category_name not in self.categories_urls:
             print(f"Catégorie '{category_name}' non trouvée. Catégories disponibles: {list(self.categories_urls.keys())}")
             return
         
-        url = self.categories_urls[category_name]
+        self._open_page_stores()
+        scraper, url = self._discovery_source(category_name, source)
         print(f"Démarrage du scraping de la catégorie '{category_name}'")
         print(f"URL: {url}")
         print(f"Pages à scraper: {max_pages}")
@@ -42,10 +138,20 @@ class BlogScrapingManager:
         
         # Liste des articles
         print("récupération de la liste des articles...")
-        articles_previews = self.list_scraper.fetch_articles_list(url, max_pages)
+        known_urls = self.data_manager.get_known_urls() if incremental else None
+        articles_previews = scraper.fetch_articles_list(
+            url, max_pages, known_urls=known_urls, window=self.discovery_window
+        )
+        if source != 'html':
+            articles_previews = self.feed_scraper.filter_unchanged(
+                articles_previews, self.data_manager.get_scraped_timestamps()
+            )
         
         if not articles_previews:
-            print("Aucun article trouvé dans cette catégorie")
+            if incremental:
+                print("Aucun nouvel article dans cette catégorie")
+            else:
+                print("Aucun article trouvé dans cette catégorie")
             return
         
         print(f"Trouvé {len(articles_previews)} articles à scraper")
@@ -53,32 +159,18 @@ class BlogScrapingManager:
         
         # Scrap le contenu complet de chaque article
         print("scraping du contenu complet des articles...")
-        scraped_articles = []
+        workers = self.max_workers if max_workers is None else max_workers
         
-        for i, preview in enumerate(articles_previews, 1):
-            print(f"Scraping article {i}/{len(articles_previews)}: {preview.get('title', 'Sans titre')}")
-            
-            try:
-                full_article = self.article_scraper.scrape_article_content(preview['url'])
-                
-                if full_article:
-                    # fusionner les données complètes
-                    full_article.update({
-                        'category_scraped': category_name,  
-                        'preview_data': preview  
-                    })
-                    scraped_articles.append(full_article)
-                    print(f"  ✓ Article scraped avec succès")
-                else:
-                    print(f"  X Échec du scraping")
-                
-                # délai entre les requêtes
-                if delay > 0:
-                    time.sleep(delay)
-                    
-            except Exception as e:
-                print(f"  X Erreur lors du scraping: {e}")
-                continue
+        if self.engine == 'pipeline':
+            scraped_articles = self._scrape_with_pipeline(
+                articles_previews, [[category_name]] * len(articles_previews), workers
+            )
+            print("="*50)
+            print(f"Scraping terminé. {len(scraped_articles)}/{len(articles_previews)} articles récupérés")
+            return scraped_articles
+        
+        results = self._scrape_previews(articles_previews, category_name, workers)
+        scraped_articles = [article for article in results if article]
         
         print("="*50)
         print(f"Scraping terminé. {len(scraped_articles)}/{len(articles_previews)} articles récupérés")
@@ -91,37 +183,370 @@ class BlogScrapingManager:
         
         return scraped_articles
     
-    def scrape_all_categories(self, max_pages_per_category: int = 1, delay: float = 1.0):
+    def _discovery_source(self, category_name: str, source: str = 'html'):
+        """
+        Retourne le scraper de découverte et l'URL à lire pour une catégorie
+        """
+        url = self.categories_urls[category_name]
+        if source == 'feed':
+            return self.feed_scraper, url.rstrip('/') + '/feed/'
+        return self.list_scraper, url
+    
+    def scrape_sitemap(self, max_articles: Optional[int] = None, incremental: bool = False):
+        """
+        Scrape les articles listés dans les sitemaps du site.
+        Les articles dont le lastmod est antérieur au dernier scraping sont ignorés.
+        """
+        self._open_page_stores()
+        print("Démarrage du scraping via le sitemap")
+        print(f"URL: {self.sitemap_url}")
+        print("="*50)
+        
+        previews = self.feed_scraper.fetch_sitemap(
+            self.sitemap_url, include=lambda loc: 'post-sitemap' in loc, max_urls=max_articles
+        )
+        known_urls = self.data_manager.get_known_urls()
+        if incremental:
+            previews = [p for p in previews if p['url'] not in known_urls]
+        previews = self.feed_scraper.filter_unchanged(previews, self.data_manager.get_scraped_timestamps())
+        
+        if not previews:
+            print("Aucun article nouveau ou modifié dans le sitemap")
+            return []
+        
+        print(f"{len(previews)} articles à scraper")
+        print("="*50)
+        
+        scraped_articles = []
+        for preview, article in zip(previews, self._scrape_previews(previews, None, self.max_workers)):
+            if not article:
+                continue
+            # les nouveaux articles sont rattachés à la catégorie du site correspondante
+            if preview['url'] not in known_urls:
+                slug = (article.get('category') or '').lower().replace(' ', '-')
+                article['category_scraped'] = slug if slug in self.categories_urls else 'divers'
+            scraped_articles.append(article)
+        
+        print("="*50)
+        print(f"Scraping terminé. {len(scraped_articles)}/{len(previews)} articles récupérés")
+        
+        if scraped_articles:
+            print("sauvegarde des données...")
+            total_articles = self.data_manager.save_articles(scraped_articles)
+            print(f"Articles sauvegardés. Total dans la base: {total_articles}")
+        
+        return scraped_articles
+    
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        """
+        Retourne le sémaphore limitant les requêtes simultanées vers l'hôte de l'URL
+        """
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(max(1, self.max_per_host))
+            return self._host_slots[host]
+    
+    def _fetch_article(self, preview: Dict, label: str) -> Optional[Dict]:
+        """
+        Scrape le contenu complet d'un article (None en cas d'échec)
+        """
+        print(f"Scraping article {label}: {preview.get('title', 'Sans titre')}")
+        
+        try:
+            with self._host_slot(preview['url']):
+                full_article = self.article_scraper.scrape_article_content(preview['url'])
+            
+            if full_article:
+                print(f"  ✓ Article scraped avec succès")
+                return full_article
+            
+            print(f"  X Échec du scraping")
+            
+        except Exception as e:
+            print(f"  X Erreur lors du scraping: {e}")
+        
+        return None
+    
+    def _merge_preview(self, article: Dict, preview: Dict, categories: List[str]) -> Dict:
+        """
+        Fusionne les données de la preview et les catégories où l'article a été vu
+        """
+        if not categories:
+            article['preview_data'] = preview
+            return article
+        
+        article.update({
+            'category_scraped': categories[0],
+            'categories_scraped': list(categories),
+            'preview_data': preview
+        })
+        return article
+    
+    def _scrape_one(self, preview: Dict, category_name: str, index: int,
+                    total: int) -> Optional[Dict]:
+        """
+        Scrape un article à partir de sa preview et fusionne les données
+        """
+        full_article = self._fetch_article(preview, f"{index}/{total}")
+        if full_article:
+            return self._merge_preview(full_article, preview, [category_name] if category_name else [])
+        return None
+    
+    def _scrape_with_pipeline(self, previews: List[Dict], categories: List[List[str]],
+                              max_workers: int) -> List[Dict]:
+        """
+        Scrape les previews avec le pipeline téléchargement / parsing / sauvegarde par lots
+        """
+        pipeline = ScrapePipeline(
+            self.http_client, self.data_manager,
+            fetch_workers=max(max_workers, self.max_per_host),
+            parse_workers=self.parse_workers,
+            host_slot=self._host_slot,
+            parser=self.parser,
+            restricted=self.restricted_parse,
+            selector_stats=self.selector_stats
+        )
+        results = pipeline.run(
+            previews,
+            prepare=lambda i, article: self._merge_preview(article, previews[i], categories[i])
+        )
+        return [article for article in results if article]
+    
+    def _scrape_previews(self, previews: List[Dict], category_name: Optional[str],
+                         max_workers: int) -> List[Optional[Dict]]:
+        """
+        Scrape les articles des previews, en parallèle si max_workers > 1.
+        Les résultats sont retournés dans l'ordre des previews (None en cas d'échec).
+        """
+        total = len(previews)
+        
+        if max_workers <= 1:
+            return [self._scrape_one(preview, category_name, i, total)
+                    for i, preview in enumerate(previews, 1)]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map conserve l'ordre des previews
+            return list(executor.map(
+                lambda item: self._scrape_one(item[1], category_name, item[0], total),
+                enumerate(previews, 1)
+            ))
+    
+    def scrape_all_categories(self, max_pages_per_category: int = 1, delay: Optional[float] = None,
+                              incremental: bool = False, source: str = 'html'):
         """
         Scrape toutes les catégories
         """
+        self.set_delay(delay)
+        self._open_page_stores()
+        
         print("Démarrage du scraping de toutes les catégories")
         print(f"Catégories: {list(self.categories_urls.keys())}")
         print(f"Pages par catégorie: {max_pages_per_category}")
         print("="*60)
         
+        known_urls = self.data_manager.get_known_urls() if incremental else None
+        pipelined = self.engine == 'pipeline'
+        frontier, fetches = self._crawl_frontier(max_pages_per_category, known_urls, source,
+                                                 fetch=not pipelined)
+        
+        print("="*60)
+        print(f"{len(frontier)} articles uniques ({frontier.duplicates} doublons entre catégories ignorés)")
+        
+        if pipelined:
+            entries = list(frontier)
+            all_articles = self._scrape_with_pipeline(
+                [preview for _, preview, _ in entries],
+                [categories for _, _, categories in entries],
+                self.max_workers
+            )
+            print("="*60)
+            print(f"Scraping global terminé. Total d'articles récupérés: {len(all_articles)}")
+            return all_articles
+        
         all_articles = []
+        for key, preview, categories in frontier:
+            article = fetches[key].result()
+            if article:
+                all_articles.append(self._merge_preview(article, preview, categories))
         
-        for category_name in self.categories_urls.keys():
-            print(f"\nDémarrage de la catégorie: {category_name}")
-            articles = self.scrape_category(category_name, max_pages_per_category, delay)
-            if articles:
-                all_articles.extend(articles)
-            
-            # Pause entre les catégories
-            if delay > 0:
-                print(f"Pause de {delay * 2} secondes avant la prochaine catégorie...")
-                time.sleep(delay * 2)
+        if all_articles:
+            print("sauvegarde des données...")
+            total_articles = self.data_manager.save_articles(all_articles)
+            print(f"Articles sauvegardés. Total dans la base: {total_articles}")
         
         print("="*60)
         print(f"Scraping global terminé. Total d'articles récupérés: {len(all_articles)}")
         
         return all_articles
     
-    def show_stats(self):
+    def _crawl_frontier(self, max_pages: int, known_urls=None, source: str = 'html', fetch: bool = True):
+        """
+        Découvre les articles de toutes les catégories en parallèle et scrape chaque
+        article unique une seule fois, dès sa découverte (sauf si fetch est False).
+        Retourne la frontière et les futures des articles, indexées par URL canonique.
+        """
+        discovered = {}
+        fetches = {}
+        scraped_at = self.data_manager.get_scraped_timestamps() if source != 'html' else None
+        fetch_pool = ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.categories_urls)) as discovery_pool:
+                futures = {}
+                for name in self.categories_urls:
+                    scraper, url = self._discovery_source(name, source)
+                    futures[discovery_pool.submit(scraper.fetch_articles_list, url, max_pages,
+                                                  known_urls=known_urls, window=self.discovery_window)] = name
+                
+                for future in as_completed(futures):
+                    category_name = futures[future]
+                    try:
+                        discovered[category_name] = future.result()
+                        if scraped_at is not None:
+                            discovered[category_name] = self.feed_scraper.filter_unchanged(
+                                discovered[category_name], scraped_at
+                            )
+                    except Exception as e:
+                        print(f"Erreur lors de la découverte de la catégorie {category_name}: {e}")
+                        discovered[category_name] = []
+                    print(f"Catégorie {category_name}: {len(discovered[category_name])} articles trouvés")
+                    
+                    # les articles jamais vus partent au scraping sans attendre les autres catégories
+                    for preview in discovered[category_name]:
+                        key = canonicalize_url(preview['url'])
+                        if fetch and key not in fetches:
+                            fetches[key] = fetch_pool.submit(self._fetch_article, preview, f"#{len(fetches) + 1}")
+            
+            # la frontière suit l'ordre des catégories, quel que soit l'ordre de découverte
+            frontier = CrawlFrontier()
+            for category_name in self.categories_urls:
+                for preview in discovered.get(category_name, []):
+                    frontier.add(preview, category_name)
+            
+            # attendre la fin des scrapings
+            for future in fetches.values():
+                future.exception()
+        finally:
+            fetch_pool.shutdown(wait=True)
+        
+        return frontier, fetches
+    
+    def reparse(self, workers: Optional[int] = None):
+        """
+        Ré-extrait les articles de la base depuis l'archive, sans accès réseau
+        """
+        archive = HtmlArchive()
+        articles = reparse_archive(archive, self.data_manager.get_known_urls(), workers,
+                                   parser=self.parser, restricted=self.restricted_parse)
+        
+        print(f"Ré-extraction terminée. {len(articles)} articles ré-extraits")
+        if articles:
+            total_articles = self.data_manager.save_articles(articles)
+            print(f"Articles mis à jour. Total dans la base: {total_articles}")
+        
+        return articles
+    
+    def check_parser(self, parser: str, limit: Optional[int] = None):
+        """
+        Vérifie qu'un backend de parsing (en parsing restreint si activé) donne les mêmes
+        articles que html.parser en parsing complet sur l'archive
+        """
+        archive = HtmlArchive()
+        differences = compare_parsers(archive, parser, urls=self.data_manager.get_known_urls(), limit=limit,
+                                      restricted=self.restricted_parse)
+        
+        if not differences:
+            mode = " en parsing restreint" if self.restricted_parse else ""
+            print(f"✓ {parser}{mode} produit des articles identiques à html.parser")
+            return differences
+        
+        print(f"X {len(differences)} articles diffèrent:")
+        for url, fields in differences.items():
+            print(f"  - {url}: {', '.join(fields)}")
+        return differences
+    
+    def migrate_storage(self, source: str, target: str):
+        """
+        Copie tous les articles d'un stockage vers un autre (dates de scraping conservées)
+        """
+        if source == target or source not in STORAGE_BACKENDS or target not in STORAGE_BACKENDS:
+            print(f"Migration impossible: {source} -> {target} (stockages: {', '.join(STORAGE_BACKENDS)})")
+            return 0
+        
+        articles = create_data_manager(source).load_articles()
+        total = create_data_manager(target).import_articles(articles)
+        print(f"Migration {source} -> {target} terminée: {len(articles)} articles copiés, {total} dans la base {target}")
+        return total
+    
+    def export(self, fmt: str = 'csv', filename: Optional[str] = None, since: Optional[str] = None):
+        """
+        Exporte les articles en flux (csv, jsonl ou parquet), éventuellement seulement
+        ceux scrapés ou mis à jour depuis since
+        """
+        if fmt not in EXPORT_FORMATS:
+            print(f"Format d'export inconnu: {fmt} (formats: {', '.join(EXPORT_FORMATS)})")
+            return 0
+        if since is not None:
+            try:
+                since = parse_since(since)
+            except ValueError as e:
+                print(e)
+                return 0
+        
+        start = time.time()
+        count = self.data_manager.export_articles(fmt, filename, since)
+        print(f"Durée de l'export: {time.time() - start:.1f} s")
+        return count
+    
+    def report_date_patterns(self):
+        """
+        Signale les dates réduites à l'année (repli AAAA0101) lors des extractions de ce
+        lancement (celles des processus de parsing y sont remontées)
+        """
+        stats = date_pattern_stats()
+        fallback = stats.get('year_only', 0)
+        if fallback:
+            found = sum(count for pattern, count in stats.items() if pattern)
+            print(f"Attention: {fallback}/{found} dates réduites à l'année (AAAA0101), format de date non reconnu")
+    
+    def search(self, query: str, limit: int = 20):
+        """
+        Recherche plein texte dans les articles (titre, résumé, contenu, auteur)
+        """
+        start = time.time()
+        results = self.data_manager.search_articles(query=query)
+        elapsed = (time.time() - start) * 1000
+        
+        print(f"{len(results)} articles pour « {query} » ({elapsed:.1f} ms)")
+        for article in results[:limit]:
+            date = article.get('publication_date') or '--------'
+            print(f"  - [{date}] {article.get('title') or article['url']}")
+            print(f"    {article['url']}")
+        return results
+    
+    def show_latest(self, count: int = 10, category: Optional[str] = None):
+        """
+        Affiche les articles publiés le plus récemment (index trié des dates)
+        """
+        articles = self.data_manager.get_latest_articles(count, category)
+        
+        print(f"{len(articles)} articles les plus récents" + (f" ({category})" if category else ""))
+        for article in articles:
+            print(f"  - [{article['publication_date']}] {article.get('category') or '-'} | {article.get('title') or article['url']}")
+        return articles
+    
+    def show_stats(self, verify: bool = False):
         """
         Affiche les statistiques de la "base de données" : Json
+        verify : recalcule d'abord les statistiques depuis zéro pour contrôler les compteurs matérialisés
         """
+        if verify:
+            if self.data_manager.verify_stats():
+                print("✓ Statistiques matérialisées identiques au recalcul complet")
+            else:
+                print("X Statistiques matérialisées incorrectes, remplacées par le recalcul complet")
+        
         stats = self.data_manager.get_stats()
         
         print("STATISTIQUES DE LA 'BASE DE DONNÉES'")
@@ -137,46 +562,148 @@ class BlogScrapingManager:
             print(f"  - {category}: {count} articles")
 
 
+def parse_options(argv: List[str]):
+    """
+    Sépare les arguments positionnels des options de la forme --nom=valeur (ou --nom)
+    """
+    args = []
+    options = {}
+    
+    for arg in argv:
+        if arg.startswith('--'):
+            name, _, value = arg[2:].partition('=')
+            options[name] = value if value else True
+        else:
+            args.append(arg)
+    
+    return args, options
+
+
 def main():
     """
     Fonction principale avec interface en ligne de commande
     """
-    manager = BlogScrapingManager()
+    args, options = parse_options(sys.argv[1:])
+    manager = BlogScrapingManager(
+        max_workers=int(options.get('workers', 1)),
+        max_per_host=int(options.get('per-host', 2)),
+        discovery_window=int(options.get('discovery-window', 1)),
+        engine=options.get('engine', 'threads'),
+        parse_workers=int(options['parse-workers']) if 'parse-workers' in options else None,
+        requests_per_second=float(options.get('rps', 1.0)),
+        burst=int(options.get('burst', 1)),
+        timeout=float(options.get('timeout', 30.0)),
+        pool_size=int(options['pool-size']) if 'pool-size' in options else None,
+        use_cache='no-cache' not in options,
+        use_archive='no-archive' not in options,
+        parser=options.get('parser'),
+        restricted_parse='restricted-parse' in options,
+        learn_selectors='learn-selectors' in options,
+        storage=options.get('storage', 'json'),
+        cache_size_mb=float(options.get('cache-size', 500))
+    )
     
-    if len(sys.argv) < 2:
+    if len(args) < 1:
         print("Usage:")
         print("  python main.py <commande> [options]")
         print("\nCommandes disponibles:")
         print("  scrape <catégorie> [nombre de pages] - Scraper une catégorie spécifique")
         print("  scrape-all [nombre de pages]         - Scraper toutes les catégories")
-        print("  stats                      - Afficher les statistiques")
-        print("  export                     - Exporter vers CSV")
+        print("  scrape-sitemap [nombre d'articles]   - Scraper les articles nouveaux ou modifiés du sitemap")
+        print("  reparse [processus]        - Ré-extraire les articles depuis l'archive (sans réseau)")
+        print("  check-parser [backend] [n] - Comparer un backend de parsing à html.parser sur l'archive (échec si un champ diffère)")
+        print("  migrate <source> <cible>   - Copier les articles d'un stockage à l'autre (json, jsonl, sqlite)")
+        print("  search <requête> [n]       - Recherche plein texte classée par pertinence (n résultats, défaut: 20)")
+        print("  latest [n] [catégorie]     - Afficher les n articles publiés le plus récemment (défaut: 10)")
+        print("  stats [--verify]           - Afficher les statistiques (--verify: les recalculer depuis zéro pour contrôle)")
+        print("  export [fichier]           - Exporter les articles en flux (défaut: data/articles_export.csv)")
+        print("\nOptions:")
+        print("  --workers=N                - Nombre d'articles scrapés en parallèle (défaut: 1)")
+        print("  --per-host=N               - Requêtes simultanées max par site (défaut: 2)")
+        print("  --engine=threads|pipeline  - Moteur de scraping (pipeline: parsing multi-processus, sauvegarde par lots)")
+        print("  --parse-workers=N          - Processus de parsing du pipeline (défaut: nombre de cœurs)")
+        print("  --parser=html.parser|lxml  - Backend de parsing HTML (défaut: html.parser ; lxml expérimental, peut différer sur du HTML mal formé)")
+        print("  --restricted-parse         - Ne parser que <main> (listes) et <article> (articles)")
+        print("  --learn-selectors          - Essayer en dernier les sélecteurs de repli qui ne gagnent jamais sur le site")
+        print("  --discovery-window=N       - Pages de liste récupérées en parallèle (défaut: 1)")
+        print("  --rps=X                    - Requêtes par seconde max par site (défaut: 1, 0 = illimité)")
+        print("  --burst=N                  - Requêtes autorisées en rafale par site (défaut: 1)")
+        print("  --timeout=S                - Timeout des requêtes en secondes (défaut: 30)")
+        print("  --pool-size=N              - Connexions gardées ouvertes par site (défaut: max(10, workers))")
+        print("  --source=html|feed         - Découverte via les pages HTML ou les flux RSS (défaut: html)")
+        print("  --incremental              - Ne scraper que les articles absents de la base")
+        print("  --storage=TYPE             - Stockage des articles: json, jsonl (journal en ajout seul) ou sqlite (base indexée) (défaut: json)")
+        print("  --no-cache                 - Désactiver le cache HTTP (data/http_cache)")
+        print("  --no-archive               - Ne pas archiver les pages téléchargées (data/archive)")
+        print("  --cache-size=MB            - Taille max du cache HTTP (défaut: 500)")
+        print("  --format=csv|jsonl|parquet - Format d'export (parquet: pyarrow, sinon colonnaire gzip) (défaut: csv)")
+        print("  --since=DATE               - Export incrémental: articles scrapés ou mis à jour depuis DATE (ISO)")
         print("\nCatégories disponibles:")
         for cat in manager.categories_urls.keys():
             print(f"  - {cat}")
         return
     
-    command = sys.argv[1].lower()
+    command = args[0].lower()
     
     if command == "scrape":
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print("Usage: python main.py scrape <catégorie> [pages]")
             return
         
-        category = sys.argv[2]
-        max_pages = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+        category = args[1]
+        max_pages = int(args[2]) if len(args) > 2 else 2
         
-        manager.scrape_category(category, max_pages)
+        manager.scrape_category(category, max_pages, incremental='incremental' in options,
+                                source=options.get('source', 'html'))
+        manager.report_date_patterns()
     
     elif command == "scrape-all":
-        max_pages = int(sys.argv[2]) if len(sys.argv) > 2 else 1
-        manager.scrape_all_categories(max_pages)
+        max_pages = int(args[1]) if len(args) > 1 else 1
+        manager.scrape_all_categories(max_pages, incremental='incremental' in options,
+                                      source=options.get('source', 'html'))
+        manager.report_date_patterns()
+    
+    elif command == "scrape-sitemap":
+        max_articles = int(args[1]) if len(args) > 1 else None
+        manager.scrape_sitemap(max_articles, incremental='incremental' in options)
+        manager.report_date_patterns()
+    
+    elif command == "reparse":
+        workers = int(args[1]) if len(args) > 1 else None
+        manager.reparse(workers)
+        manager.report_date_patterns()
+    
+    elif command == "check-parser":
+        parser = args[1] if len(args) > 1 else 'lxml'
+        limit = int(args[2]) if len(args) > 2 else None
+        # code de sortie non nul au moindre champ différent (utilisable en CI)
+        if manager.check_parser(parser, limit):
+            sys.exit(1)
+    
+    elif command == "migrate":
+        if len(args) < 3:
+            print(f"Usage: python main.py migrate <source> <cible> (stockages: {', '.join(STORAGE_BACKENDS)})")
+            return
+        manager.migrate_storage(args[1], args[2])
+    
+    elif command == "search":
+        if len(args) < 2:
+            print("Usage: python main.py search <requête> [n]")
+            return
+        limit = int(args[2]) if len(args) > 2 else 20
+        manager.search(args[1], limit)
+    
+    elif command == "latest":
+        count = int(args[1]) if len(args) > 1 else 10
+        category = args[2] if len(args) > 2 else None
+        manager.show_latest(count, category)
     
     elif command == "stats":
-        manager.show_stats()
+        manager.show_stats(verify='verify' in options)
     
     elif command == "export":
-        manager.data_manager.export_to_csv()
+        filename = args[1] if len(args) > 1 else None
+        manager.export(options.get('format', 'csv'), filename, options.get('since'))
     
     else:
         print(f"Commande inconnue: {command}")
@@ -1,102 +1,72 @@
 import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
-import re
-from utils.text_cleaner import clean_text, extract_date
-from utils.image_handler import extract_image_info
+from urllib.parse import urlparse
+from utils.text_cleaner import clean_text, clean_texts, extract_date
+from utils.image_handler import extract_image_info, extract_images
+from utils.http_client import HttpClient
+from utils.html_parser import parse_html, find_region, region_document, outside_region
+from src.extraction_plan import ExtractionPlan
+
+
+# sélecteurs de repli, par ordre de priorité
+TITLE_SELECTORS = ['h1.entry-title', 'h1']
+SUMMARY_SELECTORS = ['div.entry-excerpt', 'div.entry-summary', 'div.excerpt', 'p.lead']
+DATE_SELECTORS = ['time[datetime]', '.entry-date', 'time.published', '.date']
+AUTHOR_SELECTORS = [
+    '.author-name',
+    '.entry-author',
+    '.byline .author',
+    'span[class*="author"]',
+    '.post-author',
+    'a[rel="author"]'
+]
+CONTENT_SELECTORS = [
+    '.entry-content',
+    '.post-content',
+    '.article-content',
+    'main article',
+    '.content'
+]
+
+# plan compilé : tous les sélecteurs sont résolus en un seul parcours de la page
+ARTICLE_PLAN = ExtractionPlan(
+    TITLE_SELECTORS
+    + ['article', 'div.entry-content']
+    + SUMMARY_SELECTORS
+    + ['nav.main-navigation', 'link[rel~="canonical"]', 'nav.breadcrumb', 'span.favtag', 'a[rel="category tag"]']
+    + ['span.posted-on'] + DATE_SELECTORS
+    + ['span.byline'] + AUTHOR_SELECTORS
+    + CONTENT_SELECTORS
+)
+
+# chaînes de repli de chaque champ : le premier élément est la structure du site
+CATEGORY_CHAIN = ['article', 'nav.main-navigation', 'nav.breadcrumb', 'span.favtag', 'a[rel="category tag"]']
+SUMMARY_CHAIN = ['div.entry-content'] + SUMMARY_SELECTORS
+DATE_CHAIN = ['span.posted-on'] + DATE_SELECTORS
+AUTHOR_CHAIN = ['span.byline'] + AUTHOR_SELECTORS
+
+# une étape de la chaîne ne s'applique pas à la page : on passe à la suivante
+_NO_MATCH = object()
 
 
 class ArticleScraper:
-    def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+    def __init__(self, http_client=None, parser=None, restricted=False, selector_stats=None):
+        # client HTTP partagé (pool de connexions, timeouts, limiteur de débit)
+        self.http_client = http_client or HttpClient()
+        # backend de parsing (utils.html_parser), None = backend par défaut
+        self.parser = parser
+        # parsing restreint à la zone <article> (et au <head>) quand c'est possible
+        self.restricted = restricted
+        # statistiques des sélecteurs gagnants (utils.selector_stats), None = ordre fixe
+        self.selector_stats = selector_stats
     
     def scrape_article_content(self, article_url):
         """
         Scrape le contenu complet d'un article à partir de son URL
         """
         try:
-            response = requests.get(article_url, headers=self.headers)
+            response = self.http_client.get(article_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # structure de l'article
-            article_data = {
-                'url': article_url,
-                'title': None,
-                'thumbnail': None,
-                'category': None,
-                'subcategory': None,
-                'summary': None,
-                'publication_date': None,
-                'author': None,
-                'content': None,
-                'images': []
-            }
-            
-            # récupérer le titre
-            title_tag = soup.find('h1', class_='entry-title')
-            if not title_tag:
-                title_tag = soup.find('h1')
-            article_data['title'] = clean_text(title_tag.get_text()) if title_tag else None
-            
-            # récupérer thumbnail
-            article_tag = soup.find('article')
-            if article_tag:
-                img_tag = article_tag.find('img', class_='wp-post-image')
-                if img_tag:
-                    article_data['thumbnail'] = extract_image_info(img_tag)['url']
-                else:
-                    images = article_tag.find_all('img')
-                    if len(images) > 1:
-                        article_data['thumbnail'] = extract_image_info(images[1])['url']
-                    elif len(images) == 1:
-                        article_data['thumbnail'] = extract_image_info(images[0])['url']
-            
-            # récupérer la catégorie et sous-catégorie
-            category_info = self._extract_categories(soup)
-            article_data['category'] = category_info['category']
-            article_data['subcategory'] = category_info['subcategory']
-
-            # récupérer le résumé/chapô
-            entry_content = soup.find('div', class_='entry-content')
-            if entry_content:
-                first_p = entry_content.find('p')
-                if first_p:
-                    summary_text = clean_text(first_p.get_text())
-                    if summary_text and len(summary_text) > 20:
-                        article_data['summary'] = summary_text
-            
-            # Fallback pour le résumé
-            if not article_data['summary']:
-                summary_selectors = [
-                    soup.find('div', class_='entry-excerpt'),
-                    soup.find('div', class_='entry-summary'),
-                    soup.find('div', class_='excerpt'),
-                    soup.find('p', class_='lead')
-                ]
-                
-                for summary_div in summary_selectors:
-                    if summary_div:
-                        summary_text = clean_text(summary_div.get_text())
-                        if summary_text and len(summary_text) > 20:
-                            article_data['summary'] = summary_text
-                            break
-            
-            # Extraire la date de publication
-            date_info = self._extract_publication_date(soup)
-            article_data['publication_date'] = date_info
-            
-            # Extraire l'auteur
-            article_data['author'] = self._extract_author(soup)
-            
-            # Extraire le contenu principal
-            content_data = self._extract_main_content(soup)
-            article_data['content'] = content_data['text']
-            article_data['images'] = content_data['images']
-            
-            return article_data
+            return self.parse_article(response.text, article_url)
             
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors du scraping de {article_url}: {e}")
@@ -105,14 +75,160 @@ class ArticleScraper:
             print(f"Erreur inattendue pour {article_url}: {e}")
             return None
     
-    def _extract_categories(self, soup):
+    def parse_article(self, html, article_url):
+        """
+        Extrait les données d'un article depuis son HTML (sans accès réseau) et compte
+        les sélecteurs gagnants dans les statistiques
+        """
+        article_data, hits = self.parse_article_hits(html, article_url)
+        self.record_hits(article_url, hits)
+        return article_data
+
+    def parse_article_hits(self, html, article_url):
+        """
+        Extrait les données d'un article et retourne (article, [(champ, sélecteur gagnant)]).
+        En mode restreint, seuls le <head> et le premier <article> sont parsés ; la page
+        complète est parsée si la zone manque ou si un élément hors de la zone pourrait
+        changer le résultat (_region_is_exact).
+        """
+        host = urlparse(article_url).netloc
+
+        if self.restricted:
+            bounds = find_region(html, 'article')
+            if bounds:
+                hits = []
+                nodes = ARTICLE_PLAN.lazy(parse_html(region_document(html, bounds), self.parser))
+                article_data = self._extract_article(nodes, article_url, host, hits)
+                if self._region_is_exact(html, bounds, nodes):
+                    return article_data, hits
+
+        hits = []
+        nodes = ARTICLE_PLAN.lazy(parse_html(html, self.parser))
+        return self._extract_article(nodes, article_url, host, hits), hits
+
+    def _region_is_exact(self, html, bounds, nodes):
+        """
+        Le résultat extrait de la zone est celui de la page complète si aucun sélecteur
+        consulté ne peut trouver hors de la zone un élément qui passerait avant celui de
+        la zone : ni avant l'<article> (l'élément ou l'un de ses ancêtres), ni après
+        quand la zone n'a aucun élément pour ce sélecteur.
+        Vérifié sur le HTML brut (ExtractionPlan.raw_matches), sans parser le reste.
+        """
+        before, after = outside_region(html, bounds)
+        _, before_elements = ARTICLE_PLAN.raw_matches(before, nodes.requested)
+        if before_elements:
+            return False
+
+        missing = [selector for selector in list(nodes.requested) if nodes.get(selector) is None]
+        after_subjects, _ = ARTICLE_PLAN.raw_matches(after, missing)
+        return not after_subjects
+
+    def record_hits(self, article_url, hits):
+        """
+        Compte les sélecteurs gagnants d'une extraction (parse_article_hits)
+        """
+        if self.selector_stats:
+            host = urlparse(article_url).netloc
+            for field, selector in hits:
+                self.selector_stats.record(host, field, selector)
+
+    def _first_match(self, field, chain, step, nodes, host, hits):
+        """
+        Essaie les étapes d'une chaîne de repli et retourne le premier résultat.
+        Avec des statistiques, les sélecteurs qui n'ont jamais gagné sur ce site sont
+        essayés en dernier (SelectorStats.order) ; le sélecteur retenu est ajouté à hits.
+        """
+        if self.selector_stats:
+            chain = self.selector_stats.order(host, field, chain)
+
+        for selector in chain:
+            value = step(selector, nodes)
+            if value is not _NO_MATCH:
+                hits.append((field, selector))
+                return value
+
+        return _NO_MATCH
+
+    def _extract_article(self, nodes, article_url, host, hits):
+        """
+        Extrait les champs de l'article depuis l'arbre parsé : nodes donne le premier
+        élément de chaque sélecteur (ARTICLE_PLAN.lazy), le parcours de la page
+        n'avançant que jusqu'aux éléments demandés
+        """
+        # structure de l'article
+        article_data = {
+            'url': article_url,
+            'title': None,
+            'thumbnail': None,
+            'category': None,
+            'subcategory': None,
+            'summary': None,
+            'publication_date': None,
+            'author': None,
+            'content': None,
+            'images': []
+        }
+        
+        # récupérer le titre
+        title = self._first_match('title', TITLE_SELECTORS, self._title_from, nodes, host, hits)
+        article_data['title'] = title if title is not _NO_MATCH else None
+        
+        # récupérer thumbnail
+        article_tag = nodes.get('article')
+        if article_tag:
+            img_tag = article_tag.find('img', class_='wp-post-image')
+            if img_tag:
+                article_data['thumbnail'] = extract_image_info(img_tag)['url']
+            else:
+                images = article_tag.find_all('img')
+                if len(images) > 1:
+                    article_data['thumbnail'] = extract_image_info(images[1])['url']
+                elif len(images) == 1:
+                    article_data['thumbnail'] = extract_image_info(images[0])['url']
+        
+        # récupérer la catégorie et sous-catégorie
+        category_info = self._first_match('category', CATEGORY_CHAIN, self._categories_from, nodes, host, hits)
+        if category_info is not _NO_MATCH:
+            article_data['category'] = category_info['category']
+            article_data['subcategory'] = category_info['subcategory']
+
+        # récupérer le résumé/chapô (premier paragraphe du contenu, sinon extrait)
+        summary = self._first_match('summary', SUMMARY_CHAIN, self._summary_from, nodes, host, hits)
+        if summary is not _NO_MATCH:
+            article_data['summary'] = summary
+        
+        # Extraire la date de publication
+        date_info = self._first_match('publication_date', DATE_CHAIN, self._date_from, nodes, host, hits)
+        article_data['publication_date'] = date_info if date_info is not _NO_MATCH else None
+        
+        # Extraire l'auteur
+        author = self._first_match('author', AUTHOR_CHAIN, self._author_from, nodes, host, hits)
+        article_data['author'] = author if author is not _NO_MATCH else None
+        
+        # Extraire le contenu principal
+        content_div = self._first_match('content', CONTENT_SELECTORS, self._content_from, nodes, host, hits)
+        content_data = self._extract_main_content(content_div if content_div is not _NO_MATCH else None)
+        article_data['content'] = content_data['text']
+        article_data['images'] = content_data['images']
+        
+        return article_data
+    
+    def _title_from(self, selector, nodes):
+        title_tag = nodes.get(selector)
+        if not title_tag:
+            return _NO_MATCH
+        return clean_text(title_tag.get_text())
+    
+    def _categories_from(self, selector, nodes):
         """Extrait la catégorie et sous-catégorie"""
         category_info = {'category': None, 'subcategory': None}
+        element = nodes.get(selector)
+        if not element:
+            return _NO_MATCH
         
         # extrait depuis les classes de l'article
-        article_tag = soup.find('article')
-        if article_tag:
-            classes = article_tag.get('class', [])
+        if selector == 'article':
+            classes = element.get('class', [])
             for cls in classes:
                 if cls.startswith('category-'):
                     category_name = cls.replace('category-', '').replace('-', ' ').title()
@@ -121,142 +237,108 @@ class ArticleScraper:
                     break
         
         # chercher dans la navigation principale
-        if not category_info['category']:
-            nav = soup.find('nav', class_='main-navigation')
-            if nav:
-                current_url = soup.find('link', rel='canonical')
-                if current_url:
-                    url = current_url.get('href', '')
-                    if '/web/' in url:
-                        category_info['category'] = 'Web'
-                    elif '/marketing/' in url:
-                        category_info['category'] = 'Marketing'
-                    elif '/social/' in url:
-                        category_info['category'] = 'Social'
-                    elif '/tech/' in url:
-                        category_info['category'] = 'Tech'
-                    
-                    if category_info['category']:
-                        category_info['subcategory'] = category_info['category']
+        elif selector == 'nav.main-navigation':
+            current_url = nodes.get('link[rel~="canonical"]')
+            if current_url:
+                url = current_url.get('href', '')
+                if '/web/' in url:
+                    category_info['category'] = 'Web'
+                elif '/marketing/' in url:
+                    category_info['category'] = 'Marketing'
+                elif '/social/' in url:
+                    category_info['category'] = 'Social'
+                elif '/tech/' in url:
+                    category_info['category'] = 'Tech'
+                
+                if category_info['category']:
+                    category_info['subcategory'] = category_info['category']
         
         # au pire checker dans les breadcrumbs (fallback)
-        if not category_info['category']:
-            breadcrumb = soup.find('nav', class_='breadcrumb')
-            if breadcrumb:
-                links = breadcrumb.find_all('a')
-                if len(links) >= 2:
-                    category_info['category'] = clean_text(links[-2].get_text())
-                    category_info['subcategory'] = clean_text(links[-1].get_text())
+        elif selector == 'nav.breadcrumb':
+            links = element.find_all('a')
+            if len(links) >= 2:
+                category_info['category'] = clean_text(links[-2].get_text())
+                category_info['subcategory'] = clean_text(links[-1].get_text())
         
         # ou encore dans les tags de catégorie
-        if not category_info['category']:
-            cat_tag = soup.find('span', class_='favtag')
-            if not cat_tag:
-                cat_tag = soup.find('a', rel='category tag')
-            if cat_tag:
-                category_info['category'] = clean_text(cat_tag.get_text())
-                category_info['subcategory'] = category_info['category']  # Par défaut identique
+        else:
+            category_info['category'] = clean_text(element.get_text())
+            category_info['subcategory'] = category_info['category']  # Par défaut identique
+            return category_info
+        
+        return category_info if category_info['category'] else _NO_MATCH
+    
+    def _summary_from(self, selector, nodes):
+        """Extrait le résumé : premier paragraphe du contenu ou zone d'extrait"""
+        element = nodes.get(selector)
+        if not element:
+            return _NO_MATCH
+        
+        if selector == 'div.entry-content':
+            element = element.find('p')
+            if not element:
+                return _NO_MATCH
         
-        return category_info
+        summary_text = clean_text(element.get_text())
+        if summary_text and len(summary_text) > 20:
+            return summary_text
+        return _NO_MATCH
     
-    def _extract_publication_date(self, soup):
+    def _date_from(self, selector, nodes):
         """Extrait et formate la date de publication au format AAAAMMJJ"""
+        date_element = nodes.get(selector)
         
         # structure du site piur la date
-        posted_on = soup.find('span', class_='posted-on')
-        if posted_on:
-            time_element = posted_on.find('time')
-            if time_element:
-                # via l'attribut datetime
-                datetime_attr = time_element.get('datetime')
-                if datetime_attr:
-                    return extract_date(datetime_attr)
-                
-                # via le texte
-                date_text = time_element.get_text(strip=True)
-                if date_text:
-                    return extract_date(date_text)
-        
-        # Fallback: autres sélecteurs possibles
-        date_selectors = [
-            'time[datetime]',
-            '.entry-date',
-            'time.published',
-            '.date'
-        ]
+        if date_element and selector == 'span.posted-on':
+            date_element = date_element.find('time')
         
-        for selector in date_selectors:
-            date_element = soup.select_one(selector)
-            if date_element:
-                # via l'attribut datetime
-                datetime_attr = date_element.get('datetime')
-                if datetime_attr:
-                    return extract_date(datetime_attr)
-                
-                # via depuis le texte
-                date_text = date_element.get_text(strip=True)
-                if date_text:
-                    return extract_date(date_text)
+        if date_element:
+            # via l'attribut datetime
+            datetime_attr = date_element.get('datetime')
+            if datetime_attr:
+                return extract_date(datetime_attr)
+            
+            # via le texte
+            date_text = date_element.get_text(strip=True)
+            if date_text:
+                return extract_date(date_text)
         
-        return None
+        return _NO_MATCH
     
-    def _extract_author(self, soup):
+    def _author_from(self, selector, nodes):
         """Extrait l'auteur de l'article"""
+        author_element = nodes.get(selector)
+        if not author_element:
+            return _NO_MATCH
+        
         # structure du site pour l'auteur        
-        byline = soup.find('span', class_='byline')
-        if byline:
-            author_link = byline.find('a')
-            if author_link:
-                # via l'attribut title
-                author_name = author_link.get('title')
-                if author_name:
-                    author_name = clean_text(author_name)
-                    if author_name and author_name.lower() not in ['par', 'by', 'author']:
-                        return author_name
-                
-                # via le texte du lien
-                author_name = clean_text(author_link.get_text())
+        if selector == 'span.byline':
+            author_link = author_element.find('a')
+            if not author_link:
+                return _NO_MATCH
+            
+            # via l'attribut title
+            author_name = author_link.get('title')
+            if author_name:
+                author_name = clean_text(author_name)
                 if author_name and author_name.lower() not in ['par', 'by', 'author']:
                     return author_name
+            author_element = author_link
         
-        # Fallback: autres sélecteurs possibles
-        author_selectors = [
-            '.author-name',
-            '.entry-author',
-            '.byline .author',
-            'span[class*="author"]',
-            '.post-author',
-            'a[rel="author"]'
-        ]
+        # via le texte
+        author_name = clean_text(author_element.get_text())
+        if author_name and author_name.lower() not in ['par', 'by', 'author']:
+            return author_name
         
-        for selector in author_selectors:
-            author_element = soup.select_one(selector)
-            if author_element:
-                author_name = clean_text(author_element.get_text())
-                if author_name and author_name.lower() not in ['par', 'by', 'author']:
-                    return author_name
-        
-        return None
+        return _NO_MATCH
+    
+    def _content_from(self, selector, nodes):
+        return nodes.get(selector) or _NO_MATCH
     
-    def _extract_main_content(self, soup):
+    def _extract_main_content(self, content_div):
         """Extrait le contenu principal et les images"""
         content_data = {'text': '', 'images': []}
         
-        # Chercher la zone de contenu principal
-        content_selectors = [
-            '.entry-content',
-            '.post-content',
-            '.article-content',
-            'main article',
-            '.content'
-        ]
-        
-        content_div = None
-        for selector in content_selectors:
-            content_div = soup.select_one(selector)
-            if content_div:
-                break
-        
         if not content_div:
             print("Zone de contenu principal non trouvée")
             return content_data
@@ -266,17 +348,14 @@ class ArticleScraper:
         
         # Récupérer tous les paragraphes et éléments de texte
         text_elements = content_div.find_all(['p', 'h2', 'h3', 'h4', 'li', 'blockquote'])
-        for element in text_elements:
-            text = clean_text(element.get_text())
+        for text in clean_texts(element.get_text() for element in text_elements):
             if text and len(text) > 10:  # Ignorer les textes très courts
                 paragraphs.append(text)
         
         content_data['text'] = '\n\n'.join(paragraphs)
         
         # Extraire toutes les images dans l'ordre d'apparition
-        images = content_div.find_all('img')
-        for img in images:
-            image_info = extract_image_info(img)
+        for image_info in extract_images(content_div):
             if image_info['url']:
                 content_data['images'].append(image_info)
         
@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+# paramètres de suivi qui ne changent pas la page
+TRACKING_PARAMS_PREFIXES = ('utm_', 'fbclid', 'gclid', 'mc_')
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Forme canonique d'une URL pour la déduplication :
+    schéma et hôte en minuscules, sans port par défaut, sans fragment,
+    sans paramètres de suivi et sans slash final.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS_PREFIXES)
+    ])
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+class CrawlFrontier:
+    """
+    Frontière de crawl globale : une entrée par article unique (URL canonique),
+    avec la première preview rencontrée et toutes les catégories où il apparaît.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.duplicates = 0
+
+    def add(self, preview: Dict, category: str) -> bool:
+        """
+        Ajoute une preview vue dans une catégorie. Retourne True si l'article est nouveau.
+        """
+        key = canonicalize_url(preview['url'])
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = {'preview': preview, 'categories': [category]}
+                return True
+
+            self.duplicates += 1
+            if category not in entry['categories']:
+                entry['categories'].append(category)
+            return False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Tuple[str, Dict, List[str]]]:
+        """Parcourt les entrées (clé, preview, catégories) dans l'ordre d'ajout"""
+        for key, entry in list(self._entries.items()):
+            yield key, entry['preview'], entry['categories']
@@ -0,0 +1,297 @@
+import re
+from functools import lru_cache
+from html import unescape
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from bs4.element import Tag
+
+
+# sous-ensemble de CSS supporté : tag, .classe, [attr], [attr="v"], [attr~="v"], [attr*="v"]
+# et le combinateur descendant (espace)
+_COMPOUND_RE = re.compile(r'^(?P<name>[a-zA-Z][\w-]*)?(?P<rest>.*)$')
+_PART_RE = re.compile(r'\.(?P<cls>[\w-]+)|\[(?P<attr>[\w-]+)(?:(?P<op>[~*]?=)"(?P<value>[^"]*)")?\]')
+_WHITESPACE_RE = re.compile(r'[ \t\r\n\f]+')
+# sélecteurs simples séparés par des espaces (hors crochets)
+_COMPOUNDS_RE = re.compile(r'(?:[^\s\[]|\[[^\]]*\])+')
+# attributs bruts d'une balise (valeurs entre guillemets comprises)
+_RAW_ATTRS = r'''(?:[^>"']|"[^"]*"|'[^']*')*'''
+_RAW_ATTR_RE = re.compile(r'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+)))?')
+
+
+class _Compound:
+    """Sélecteur simple (sans combinateur) : nom, classes et conditions sur les attributs"""
+
+    __slots__ = ('name', 'classes', 'attrs', 'needles')
+
+    def __init__(self, text: str):
+        match = _COMPOUND_RE.match(text)
+        self.name = match.group('name').lower() if match.group('name') else None
+        self.classes: Tuple[str, ...] = ()
+        self.attrs: List[Tuple[str, Optional[str], Optional[str]]] = []
+
+        rest = match.group('rest')
+        position = 0
+        while position < len(rest):
+            part = _PART_RE.match(rest, position)
+            if not part:
+                raise ValueError(f"Sélecteur non supporté: {text}")
+            if part.group('cls'):
+                self.classes += (part.group('cls'),)
+            else:
+                self.attrs.append((part.group('attr').lower(), part.group('op'), part.group('value')))
+            position = part.end()
+
+        # textes qui figurent forcément dans les attributs bruts d'une balise qui correspond
+        self.needles = tuple(cls.lower() for cls in self.classes) + tuple(attr for attr, _, _ in self.attrs)
+
+    def matches(self, tag) -> bool:
+        if self.name is not None and tag.name != self.name:
+            return False
+
+        if self.classes:
+            classes = tag.get('class')
+            if not classes:
+                return False
+            if isinstance(classes, str):
+                classes = _WHITESPACE_RE.split(classes)
+            for cls in self.classes:
+                if cls not in classes:
+                    return False
+
+        for attr, op, expected in self.attrs:
+            value = tag.get(attr)
+            if value is None:
+                return False
+            # comme soupsieve : les attributs multi-valués sont comparés joints par des espaces
+            if not isinstance(value, str):
+                value = ' '.join(value)
+            if op == '=' and value != expected:
+                return False
+            if op == '~=' and expected not in _WHITESPACE_RE.split(value):
+                return False
+            if op == '*=' and (not expected or expected not in value):
+                return False
+
+        return True
+
+
+def _raw_needle(needle: str) -> str:
+    """Regex : texte présent dans les attributs bruts, hors guillemets ou dans une valeur"""
+    # une entité peut aussi cacher un nom de classe : le décodage tranchera
+    needle = f"{re.escape(needle)}|&"
+    return rf'''(?=(?:[^>"']|"[^"]*"|'[^']*')*?(?:{needle}|"[^"]*(?:{needle})|'[^']*(?:{needle})))'''
+
+
+@lru_cache(maxsize=256)
+def _raw_tag_pattern(compounds: FrozenSet['_Compound']):
+    """
+    Balises ouvrantes du HTML brut qui peuvent correspondre à l'un des sélecteurs simples :
+    le nom de balise demandé, et dans les attributs la première classe ou le premier
+    attribut demandé. Commentaires et scripts sont consommés d'un bloc, comme par le
+    parser. Le filtrage se fait dans le moteur de regex, sans boucle Python sur toutes
+    les balises de la page.
+    """
+    alternatives = sorted({
+        (re.escape(compound.name) + r'(?=[\s/>])' if compound.name else r'[a-zA-Z][^\s/>]*')
+        + (_raw_needle(compound.needles[0]) if compound.needles else '')
+        for compound in compounds
+    })
+    if not alternatives:
+        return None
+    return re.compile(
+        rf'<!--.*?-->|<script\b.*?</script\s*>|<((?:{"|".join(alternatives)}))({_RAW_ATTRS})>',
+        re.I | re.S
+    )
+
+
+class _RawTag:
+    """Balise ouvrante lue dans le HTML brut : nom et attributs, sans arbre"""
+
+    __slots__ = ('name', 'attrs')
+
+    def __init__(self, name: str, attributes: str):
+        self.name = name.lower()
+        self.attrs = {}
+        for match in _RAW_ATTR_RE.finditer(attributes):
+            value = next((group for group in match.groups()[1:] if group is not None), '')
+            self.attrs[match.group(1).lower()] = unescape(value)
+
+    def get(self, attr: str, default=None):
+        return self.attrs.get(attr, default)
+
+
+class Rule:
+    """
+    Règle d'extraction compilée depuis un sélecteur CSS :
+    équivalente à soup.select_one(selector) une fois la page parcourue.
+    """
+
+    __slots__ = ('selector', 'subject', 'ancestors', 'compounds')
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        parts = [_Compound(part) for part in _COMPOUNDS_RE.findall(selector)]
+        self.compounds = tuple(parts)
+        self.subject = parts[-1]
+        # ancêtres, du plus proche au plus lointain
+        self.ancestors = list(reversed(parts[:-1]))
+
+    def matches(self, tag) -> bool:
+        if not self.subject.matches(tag):
+            return False
+
+        node = tag.parent
+        for compound in self.ancestors:
+            while node is not None and not (isinstance(node, Tag) and compound.matches(node)):
+                node = node.parent
+            if node is None:
+                return False
+            node = node.parent
+        return True
+
+    def may_match_raw(self, tag: _RawTag) -> Tuple[bool, bool]:
+        """
+        Sans arbre (ancêtres inconnus) : la balise peut-elle être le sujet du sélecteur,
+        et peut-elle en être un élément quelconque (sujet ou ancêtre) ?
+        """
+        subject = self.subject.matches(tag)
+        return subject, subject or any(compound.matches(tag) for compound in self.ancestors)
+
+
+class ExtractionPlan:
+    """
+    Plan d'extraction : un ensemble de sélecteurs déclarés une fois, compilés et
+    résolus ensemble en un seul parcours de l'arbre.
+
+    collect() retourne, pour chaque sélecteur, le premier élément correspondant dans
+    l'ordre du document (le même que select_one), quel que soit le nombre de
+    sélecteurs de repli déclarés.
+    """
+
+    def __init__(self, selectors: Iterable[str]):
+        self.rules: Dict[str, Rule] = {}
+        for selector in selectors:
+            if selector not in self.rules:
+                self.rules[selector] = Rule(selector)
+
+        # index des règles par nom de balise, par classe, ou à tester sur toute balise
+        self._by_name: Dict[str, List[Rule]] = {}
+        self._by_class: Dict[str, List[Rule]] = {}
+        self._generic: List[Rule] = []
+        for rule in self.rules.values():
+            if rule.subject.name:
+                self._by_name.setdefault(rule.subject.name, []).append(rule)
+            elif rule.subject.classes:
+                self._by_class.setdefault(rule.subject.classes[0], []).append(rule)
+            else:
+                self._generic.append(rule)
+
+    def _candidates(self, tag) -> Iterable[Rule]:
+        rules = self._by_name.get(tag.name, [])
+        if self._by_class:
+            classes = tag.get('class')
+            if classes:
+                if isinstance(classes, str):
+                    classes = _WHITESPACE_RE.split(classes)
+                for cls in classes:
+                    rules = rules + self._by_class.get(cls, [])
+        return rules + self._generic if self._generic else rules
+
+    def _match(self, node, found: Dict[str, Tag]) -> int:
+        """Enregistre les règles satisfaites par une balise, retourne le nombre de nouvelles"""
+        matched = 0
+        for rule in self._candidates(node):
+            if rule.selector not in found and rule.matches(node):
+                found[rule.selector] = node
+                matched += 1
+        return matched
+
+    def raw_matches(self, markup: str, selectors: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+        """
+        Lecture du HTML brut, sans construire d'arbre. Retourne, parmi les sélecteurs
+        demandés, ceux dont une balise de markup peut être le sujet, et ceux dont elle
+        peut être un élément quelconque (sujet ou ancêtre). Approximation par excès :
+        un sélecteur absent des deux ensembles ne trouve aucun élément dans markup.
+        """
+        rules = [self.rules[selector] for selector in selectors]
+        subjects: Set[str] = set()
+        elements: Set[str] = set()
+        pattern = _raw_tag_pattern(frozenset(compound for rule in rules for compound in rule.compounds))
+        if pattern is None:
+            return subjects, elements
+
+        for match in pattern.finditer(markup):
+            if len(subjects) == len(rules):
+                break
+            if match.group(1) is None:
+                continue
+            tag = _RawTag(match.group(1), match.group(2))
+            for rule in rules:
+                if rule.selector in subjects:
+                    continue
+                subject, element = rule.may_match_raw(tag)
+                if subject:
+                    subjects.add(rule.selector)
+                if element:
+                    elements.add(rule.selector)
+        return subjects, elements
+
+    def lazy(self, root) -> 'LazyNodes':
+        """
+        Comme collect(), mais le parcours n'avance qu'à la demande, jusqu'au premier
+        élément du sélecteur demandé
+        """
+        return LazyNodes(self, root)
+
+    def collect(self, root) -> Dict[str, Tag]:
+        """
+        Parcourt l'arbre une seule fois et retourne {sélecteur: premier élément trouvé}
+        """
+        found: Dict[str, Tag] = {}
+        remaining = len(self.rules)
+
+        for node in root.descendants:
+            if not isinstance(node, Tag):
+                continue
+            remaining -= self._match(node, found)
+            if not remaining:
+                break
+
+        return found
+
+
+class LazyNodes:
+    """
+    Résultat paresseux d'un plan d'extraction : get(selector) donne le même élément que
+    collect(), mais le parcours du document s'arrête dès qu'il est trouvé et reprend
+    là où il s'était arrêté au sélecteur suivant. Essayer d'abord les sélecteurs qui
+    correspondent tôt dans la page évite de la parcourir en entier.
+    """
+
+    def __init__(self, plan: ExtractionPlan, root):
+        self._plan = plan
+        self._found: Dict[str, Tag] = {}
+        # sélecteurs demandés par l'extraction, dans l'ordre
+        self.requested: Dict[str, None] = {}
+        self._remaining = len(plan.rules)
+        self._nodes = root.descendants
+
+    def get(self, selector: str, default=None):
+        self.requested[selector] = None
+        if selector in self._found:
+            return self._found[selector]
+        if selector not in self._plan.rules:
+            raise KeyError(f"Sélecteur absent du plan d'extraction: {selector}")
+
+        if self._nodes is not None:
+            for node in self._nodes:
+                if not isinstance(node, Tag):
+                    continue
+                self._remaining -= self._plan._match(node, self._found)
+                if selector in self._found:
+                    if not self._remaining:
+                        self._nodes = None
+                    return self._found[selector]
+            # document entièrement parcouru
+            self._nodes = None
+
+        return self._found.get(selector, default)
@@ -0,0 +1,206 @@
+import requests
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from src.list_scraper import ListScraper
+from utils.text_cleaner import clean_text
+
+
+def _local_name(tag: str) -> str:
+    """Nom d'une balise sans son espace de noms ({ns}item -> item)"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _child_text(element, name: str) -> Optional[str]:
+    """Texte du premier enfant direct portant ce nom (quel que soit l'espace de noms)"""
+    for child in element:
+        if _local_name(child.tag) == name:
+            return (child.text or '').strip() or None
+    return None
+
+
+def _chunks(content: bytes, size: int) -> Iterator[bytes]:
+    """Découpe un corps déjà reçu en morceaux pour le parser incrémental"""
+    view = memoryview(content)
+    for start in range(0, len(view), size):
+        yield view[start:start + size]
+
+
+def _iter_xml(chunks: Iterable[bytes], names: tuple) -> Iterator[ET.Element]:
+    """
+    Parse le XML au fil des morceaux reçus et produit chaque élément dont le nom
+    est dans `names` dès qu'il est complet, puis le libère.
+    """
+    parser = ET.XMLPullParser(events=('end',))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if _local_name(element.tag) in names:
+                yield element
+                element.clear()
+    parser.close()
+    for _, element in parser.read_events():
+        if _local_name(element.tag) in names:
+            yield element
+
+
+def parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """
+    Convertit une date W3C (lastmod, updated...) en datetime locale naïve
+    """
+    if not value:
+        return None
+    try:
+        date = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if date.tzinfo is not None:
+        date = date.astimezone().replace(tzinfo=None)
+    return date
+
+
+class FeedScraper(ListScraper):
+    """
+    Découverte des articles via les flux RSS/Atom et les sitemaps XML,
+    bien plus légers que les pages HTML des catégories.
+
+    Produit les mêmes previews que ListScraper (plus 'lastmod' quand il est connu) ;
+    la pagination, les fenêtres parallèles et le mode incrémental de
+    fetch_articles_list s'appliquent aux flux (pages ?paged=N de WordPress).
+
+    Le corps est reçu en entier par HttpClient (requête conditionnelle, éventuellement
+    servi par le cache HTTP), puis parcouru par morceaux : chaque élément est converti
+    et libéré dès qu'il est complet, sans construire l'arbre XML de tout le document.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def _fetch_page(self, url, page):
+        """
+        Récupère les previews d'une page de flux (None en cas d'erreur)
+        """
+        page_url = f"{url}?paged={page}" if page > 1 else url
+        print(f"Lecture du flux page {page}: {page_url}")
+
+        try:
+            response = self.http_client.get(page_url)
+            response.raise_for_status()
+            return list(self._extract_feed_items(_chunks(response.content, self.CHUNK_SIZE)))
+
+        except requests.exceptions.RequestException as e:
+            print(f"Erreur lors de la lecture du flux page {page}: {e}")
+            return None
+        except ET.ParseError as e:
+            print(f"Flux XML invalide page {page}: {e}")
+            return None
+
+    def _extract_feed_items(self, chunks: Iterable[bytes]) -> Iterator[Dict]:
+        """
+        Convertit les <item> RSS et <entry> Atom en previews
+        """
+        for element in _iter_xml(chunks, ('item', 'entry')):
+            preview = self._feed_item_to_preview(element)
+            if preview['url']:
+                yield preview
+
+    def _feed_item_to_preview(self, item) -> Dict:
+        preview = {
+            'url': None,
+            'title': None,
+            'preview_image': None,
+            'tag': None,
+            'preview_date': None,
+            'preview_summary': None,
+            'lastmod': None
+        }
+
+        if _local_name(item.tag) == 'entry':
+            # Atom : le lien "alternate" (ou le premier lien)
+            for child in item:
+                if _local_name(child.tag) == 'link' and child.get('rel', 'alternate') == 'alternate':
+                    preview['url'] = child.get('href')
+                    break
+            preview['preview_date'] = _child_text(item, 'published')
+            preview['lastmod'] = _child_text(item, 'updated')
+            summary = _child_text(item, 'summary')
+        else:
+            preview['url'] = _child_text(item, 'link')
+            preview['preview_date'] = _child_text(item, 'pubDate')
+            summary = _child_text(item, 'description')
+
+        title = _child_text(item, 'title')
+        preview['title'] = clean_text(title) if title else None
+        preview['tag'] = _child_text(item, 'category')
+        preview['preview_summary'] = clean_text(summary) if summary else None
+
+        # image : media:content, media:thumbnail ou enclosure de type image
+        for child in item:
+            name = _local_name(child.tag)
+            if name in ('content', 'thumbnail') and child.get('url'):
+                preview['preview_image'] = child.get('url')
+                break
+            if name == 'enclosure' and (child.get('type') or '').startswith('image'):
+                preview['preview_image'] = child.get('url')
+                break
+
+        return preview
+
+    def fetch_sitemap(self, sitemap_url: str, include: Optional[Callable[[str], bool]] = None,
+                      max_urls: Optional[int] = None) -> List[Dict]:
+        """
+        Récupère les URLs d'un sitemap (ou d'un index de sitemaps, parcouru récursivement)
+        avec leur date lastmod. `include` filtre les sitemaps enfants d'un index.
+        """
+        previews = []
+        pending = [sitemap_url]
+
+        while pending and (max_urls is None or len(previews) < max_urls):
+            url = pending.pop(0)
+            print(f"Lecture du sitemap: {url}")
+
+            try:
+                response = self.http_client.get(url)
+                response.raise_for_status()
+                for element in _iter_xml(_chunks(response.content, self.CHUNK_SIZE), ('url', 'sitemap')):
+                    loc = _child_text(element, 'loc')
+                    if not loc:
+                        continue
+                    if _local_name(element.tag) == 'sitemap':
+                        if include is None or include(loc):
+                            pending.append(loc)
+                        continue
+                    previews.append({
+                        'url': loc,
+                        'title': None,
+                        'preview_image': None,
+                        'tag': None,
+                        'preview_date': None,
+                        'preview_summary': None,
+                        'lastmod': _child_text(element, 'lastmod')
+                    })
+                    if max_urls is not None and len(previews) >= max_urls:
+                        break
+
+            except requests.exceptions.RequestException as e:
+                print(f"Erreur lors de la lecture du sitemap {url}: {e}")
+            except ET.ParseError as e:
+                print(f"Sitemap XML invalide {url}: {e}")
+
+        print(f"Trouvé {len(previews)} URLs dans le sitemap")
+        return previews
+
+    def filter_unchanged(self, previews: List[Dict], scraped_at: Dict[str, str]) -> List[Dict]:
+        """
+        Retire les previews dont le lastmod est antérieur au dernier scraping de l'article
+        """
+        changed = []
+        for preview in previews:
+            last_scraped = parse_lastmod(scraped_at.get(preview['url']))
+            lastmod = parse_lastmod(preview.get('lastmod'))
+            if last_scraped is None or lastmod is None or lastmod > last_scraped:
+                changed.append(preview)
+
+        skipped = len(previews) - len(changed)
+        if skipped:
+            print(f"{skipped} articles inchangés depuis le dernier scraping ignorés")
+        return changed
@@ -1,45 +1,125 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 from utils.image_handler import extract_image_info
+from utils.http_client import HttpClient
+from utils.html_parser import parse_html
+
+
+# en mode restreint, seuls les éléments <main> des pages de liste sont construits
+MAIN_ONLY = SoupStrainer('main')
 
 
 class ListScraper:
-    def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+    def __init__(self, http_client=None, parser=None, restricted=False):
+        # client HTTP partagé (pool de connexions, timeouts, limiteur de débit)
+        self.http_client = http_client or HttpClient()
+        # backend de parsing (utils.html_parser), None = backend par défaut
+        self.parser = parser
+        # parsing restreint à <main> (en-têtes, menus et pied de page ignorés)
+        self.restricted = restricted
     
-    def fetch_articles_list(self, url, max_pages=1):
+    def fetch_articles_list(self, url, max_pages=1, known_urls=None, window=1):
         """
-        Récupère la liste des articles depuis les pages de catégories
+        Récupère la liste des articles depuis les pages de catégories.
+        Si known_urls est fourni (mode incrémental), les articles déjà connus sont ignorés
+        et la pagination s'arrête dès qu'une page ne contient que des articles connus.
+        Avec window > 1, les pages sont récupérées par fenêtres de `window` requêtes en parallèle.
         """
+        if window > 1 and max_pages > 1:
+            return self._fetch_articles_list_parallel(url, max_pages, known_urls, window)
+        
         articles_urls = []
         
         for page in range(1, max_pages + 1):
-            page_url = f"{url}/page/{page}" if page > 1 else url
-            print(f"Scraping page {page}: {page_url}")
-            
-            try:
-                response = requests.get(page_url, headers=self.headers)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # trouver tous les articles sur la page
-                articles = self._extract_articles_from_page(soup)
-                
-                if not articles:
-                    print(f"Aucun article trouvé sur la page {page}")
-                    break
+            articles, stop = self._accept_page(page, self._fetch_page(url, page), known_urls)
+            articles_urls.extend(articles)
+            if stop:
+                break
+        
+        return articles_urls
+    
+    def _fetch_articles_list_parallel(self, url, max_pages, known_urls, window):
+        """
+        Récupère les pages de façon spéculative, `window` pages en avance.
+        Les résultats sont fusionnés dans l'ordre des pages et les requêtes restantes
+        sont annulées dès qu'une page marque la fin de la liste.
+        """
+        articles_urls = []
+        executor = ThreadPoolExecutor(max_workers=window)
+        futures = {}
+        next_page = 1
+        
+        try:
+            for page in range(1, max_pages + 1):
+                # garder `window` pages en vol
+                while next_page <= max_pages and next_page < page + window:
+                    futures[next_page] = executor.submit(self._fetch_page, url, next_page)
+                    next_page += 1
                 
+                articles, stop = self._accept_page(page, futures.pop(page).result(), known_urls)
                 articles_urls.extend(articles)
-                print(f"Trouvé {len(articles)} articles sur la page {page}")
-                
-            except requests.exceptions.RequestException as e:
-                print(f"Erreur lors du scraping de la page {page}: {e}")
-                break
+                if stop:
+                    break
+        finally:
+            # les pages au-delà de la fin ne sont pas attendues
+            executor.shutdown(wait=False, cancel_futures=True)
         
         return articles_urls
     
+    def _fetch_page(self, url, page):
+        """
+        Récupère les previews d'une page de liste (None en cas d'erreur, ex: 404 après la dernière page)
+        """
+        page_url = f"{url}/page/{page}" if page > 1 else url
+        print(f"Scraping page {page}: {page_url}")
+        
+        try:
+            response = self.http_client.get(page_url)
+            response.raise_for_status()
+            soup = self._parse_list_page(response.text)
+            
+            # trouver tous les articles sur la page
+            return self._extract_articles_from_page(soup)
+            
+        except requests.exceptions.RequestException as e:
+            print(f"Erreur lors du scraping de la page {page}: {e}")
+            return None
+    
+    def _parse_list_page(self, html):
+        """
+        Parse une page de liste, en se limitant à <main> en mode restreint
+        (parsing complet si la page n'a pas de <main>)
+        """
+        if self.restricted:
+            soup = parse_html(html, self.parser, parse_only=MAIN_ONLY)
+            if soup.find('main'):
+                return soup
+        return parse_html(html, self.parser)
+    
+    def _accept_page(self, page, articles, known_urls):
+        """
+        Filtre les previews d'une page et indique si la pagination doit s'arrêter
+        """
+        if articles is None:
+            return [], True
+        
+        if not articles:
+            print(f"Aucun article trouvé sur la page {page}")
+            return [], True
+        
+        if known_urls is not None:
+            new_articles = [a for a in articles if a['url'] not in known_urls]
+            if not new_articles:
+                print(f"Tous les articles de la page {page} sont déjà connus, arrêt de la pagination")
+                return [], True
+            if len(new_articles) < len(articles):
+                print(f"{len(articles) - len(new_articles)} articles déjà connus ignorés sur la page {page}")
+            articles = new_articles
+        
+        print(f"Trouvé {len(articles)} articles sur la page {page}")
+        return articles, False
+    
     def _extract_articles_from_page(self, soup):
         """
         Extrait les URLs des articles depuis une page de liste
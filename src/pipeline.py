@@ -0,0 +1,193 @@
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from src.article_scraper import ArticleScraper
+from utils.selector_stats import SelectorStats
+from utils.text_cleaner import merge_date_pattern_stats, take_date_pattern_stats
+
+
+# état propre à chaque processus de parsing (créé au premier appel)
+_worker_state = {}
+
+
+def _parse_fetched(job) -> Optional[Tuple[Dict, List, Dict]]:
+    """
+    Extrait un article depuis son HTML (exécuté dans un processus de parsing).
+    Retourne (article, sélecteurs gagnants, motifs de date) : le processus principal
+    les compte dans ses statistiques, seul à écrire le fichier.
+    """
+    url, html, parser, restricted, stats_file = job
+    key = (parser, restricted, stats_file)
+    if key not in _worker_state:
+        # les statistiques des sélecteurs sont lues au démarrage, puis tenues à jour
+        # localement en mémoire
+        stats = SelectorStats(stats_file, read_only=True) if stats_file else None
+        _worker_state[key] = ArticleScraper(parser=parser, restricted=restricted, selector_stats=stats)
+
+    try:
+        scraper = _worker_state[key]
+        article, hits = scraper.parse_article_hits(html, url)
+        scraper.record_hits(url, hits)
+        return article, hits, take_date_pattern_stats()
+    except Exception as e:
+        print(f"Erreur lors de l'extraction de {url}: {e}")
+        return None
+
+
+class ScrapePipeline:
+    """
+    Pipeline de scraping en trois étages :
+
+    1. téléchargement (threads) -> file bornée de pages HTML
+    2. parsing (ProcessPoolExecutor, un processus par cœur)
+    3. sauvegarde par lots via le DataManager
+
+    La file bornée et le nombre limité de parsings en cours font remonter la
+    pression : les téléchargements s'arrêtent quand le parsing ne suit plus.
+    """
+
+    def __init__(self, http_client, data_manager,
+                 fetch_workers: int = 4,
+                 parse_workers: Optional[int] = None,
+                 queue_size: int = 32,
+                 batch_size: int = 50,
+                 host_slot: Optional[Callable] = None,
+                 parser: Optional[str] = None,
+                 restricted: bool = False,
+                 selector_stats: Optional[SelectorStats] = None):
+        self.http_client = http_client
+        self.data_manager = data_manager
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        # fonction url -> context manager limitant les requêtes simultanées par hôte
+        self.host_slot = host_slot
+        # backend de parsing (utils.html_parser) utilisé par les processus
+        self.parser = parser
+        # parsing restreint à la zone <article> (voir ArticleScraper)
+        self.restricted = restricted
+        # statistiques des sélecteurs : le fichier est lu par les processus de parsing,
+        # les succès qu'ils renvoient sont comptés ici (None = ordre fixe)
+        self.selector_stats = selector_stats
+        self.selector_stats_file = selector_stats.stats_file if selector_stats else None
+
+    def _fetch(self, index: int, preview: Dict, pages: queue.Queue):
+        """Étage 1 : télécharge une page et la dépose dans la file (bloque si elle est pleine)"""
+        url = preview['url']
+        html = None
+        try:
+            with self.host_slot(url) if self.host_slot else nullcontext():
+                response = self.http_client.get(url)
+            response.raise_for_status()
+            html = response.text
+        except requests.exceptions.RequestException as e:
+            print(f"Erreur lors du scraping de {url}: {e}")
+        except Exception as e:
+            print(f"Erreur inattendue pour {url}: {e}")
+        pages.put((index, url, html))
+
+    def _record_hits(self, url: str, hits: List):
+        host = urlparse(url).netloc
+        for field, selector in hits:
+            self.selector_stats.record(host, field, selector)
+
+    def _dispatch(self, total: int, pages: queue.Queue, parsed: queue.Queue, pool: ProcessPoolExecutor):
+        """
+        Étage 2 : envoie les pages aux processus de parsing, avec un nombre borné de tâches en cours.
+        Chaque page donne exactement un résultat dans parsed (None en cas d'échec, y compris
+        si un processus de parsing meurt) : run() n'attend jamais un résultat qui ne viendra pas.
+        """
+        in_flight = threading.BoundedSemaphore(self.parse_workers * 2)
+
+        for _ in range(total):
+            index, url, html = pages.get()
+            if html is None:
+                parsed.put((index, None))
+                continue
+
+            in_flight.acquire()
+            try:
+                future = pool.submit(_parse_fetched, (url, html, self.parser, self.restricted, self.selector_stats_file))
+            except Exception as e:
+                # pool inutilisable (BrokenProcessPool après la mort d'un processus) : page en échec
+                in_flight.release()
+                print(f"Erreur lors de l'extraction de {url}: {e}")
+                parsed.put((index, None))
+                continue
+
+            def done(future, index=index):
+                in_flight.release()
+                try:
+                    result = future.result()
+                    article = None
+                    if result:
+                        article, hits, date_hits = result
+                        merge_date_pattern_stats(date_hits)
+                        if self.selector_stats:
+                            self._record_hits(article['url'], hits)
+                    parsed.put((index, article))
+                except Exception as e:
+                    print(f"Erreur lors de l'extraction: {e}")
+                    parsed.put((index, None))
+
+            future.add_done_callback(done)
+
+    def run(self, previews: List[Dict],
+            prepare: Optional[Callable[[int, Dict], Dict]] = None) -> List[Optional[Dict]]:
+        """
+        Scrape les previews et sauvegarde les articles par lots.
+        prepare(index, article) permet de compléter l'article avant sa sauvegarde.
+        Retourne les articles dans l'ordre des previews (None en cas d'échec).
+        """
+        total = len(previews)
+        results: List[Optional[Dict]] = [None] * total
+        if not total:
+            return results
+
+        pages = queue.Queue(maxsize=self.queue_size)
+        parsed = queue.Queue()
+        batch = []
+
+        print(f"Pipeline: {self.fetch_workers} téléchargements, {self.parse_workers} processus de parsing, "
+              f"sauvegarde par lots de {self.batch_size}")
+
+        # compteurs de motifs de date hérités du processus principal remis à zéro dans
+        # chaque processus de parsing : seules ses extractions remontent
+        with ProcessPoolExecutor(max_workers=self.parse_workers,
+                                 initializer=take_date_pattern_stats) as parse_pool, \
+                ThreadPoolExecutor(max_workers=self.fetch_workers) as fetch_pool:
+            dispatcher = threading.Thread(target=self._dispatch, args=(total, pages, parsed, parse_pool), daemon=True)
+            dispatcher.start()
+
+            for index, preview in enumerate(previews):
+                fetch_pool.submit(self._fetch, index, preview, pages)
+
+            # Étage 3 : sauvegarde par lots, au fil des articles extraits
+            for done_count in range(1, total + 1):
+                index, article = parsed.get()
+                if article:
+                    if prepare:
+                        article = prepare(index, article)
+                    results[index] = article
+                    batch.append(article)
+                    print(f"  ✓ [{done_count}/{total}] {article.get('title') or article['url']}")
+                else:
+                    print(f"  X [{done_count}/{total}] Échec du scraping de {previews[index]['url']}")
+
+                if len(batch) >= self.batch_size:
+                    self.data_manager.save_articles(batch)
+                    batch = []
+
+            dispatcher.join()
+
+        if batch:
+            self.data_manager.save_articles(batch)
+
+        return results
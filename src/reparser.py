@@ -0,0 +1,112 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+from src.article_scraper import ArticleScraper
+from utils.html_archive import HtmlArchive
+from utils.text_cleaner import merge_date_pattern_stats, take_date_pattern_stats
+
+
+# état propre à chaque processus de travail (créé au premier appel)
+_worker_state = {}
+
+
+def _worker_scraper(parser: Optional[str], restricted: bool = False) -> ArticleScraper:
+    """Scraper du processus courant pour un backend de parsing"""
+    key = ('scraper', parser, restricted)
+    if key not in _worker_state:
+        _worker_state[key] = ArticleScraper(parser=parser, restricted=restricted)
+    return _worker_state[key]
+
+
+def _worker_archive(archive_dir: str) -> HtmlArchive:
+    """Archive ouverte par le processus courant"""
+    key = ('archive', archive_dir)
+    if key not in _worker_state:
+        _worker_state[key] = HtmlArchive(archive_dir)
+    return _worker_state[key]
+
+
+def _parse_archived(job) -> Tuple[Optional[Dict], Dict]:
+    """
+    Relit une page archivée et en extrait l'article (exécuté dans un processus de travail).
+    Retourne (article, motifs de date) : les motifs sont comptés par le processus principal.
+    """
+    archive_dir, entry, parser, restricted = job
+    article = None
+    try:
+        html = _worker_archive(archive_dir).read_html(entry)
+        article = _worker_scraper(parser, restricted).parse_article(html, entry['url'])
+    except Exception as e:
+        print(f"Erreur lors de la ré-extraction de {entry['url']}: {e}")
+    return article, take_date_pattern_stats()
+
+
+def _compare_archived(job) -> Tuple[str, List[str]]:
+    """
+    Extrait une page archivée avec deux backends (le second éventuellement en parsing
+    restreint) et retourne les champs qui diffèrent
+    """
+    archive_dir, entry, parser, reference, restricted = job
+    try:
+        html = _worker_archive(archive_dir).read_html(entry)
+        expected = _worker_scraper(reference).parse_article(html, entry['url'])
+        actual = _worker_scraper(parser, restricted).parse_article(html, entry['url'])
+    except Exception as e:
+        return entry['url'], [f"erreur: {e}"]
+    return entry['url'], [field for field in expected if expected.get(field) != actual.get(field)]
+
+
+def _run(function, jobs, workers: int, chunksize: int) -> list:
+    """Exécute les tâches sur un pool de processus (ou localement avec un seul processus)"""
+    if workers <= 1:
+        return list(map(function, jobs))
+    # compteurs de motifs de date hérités du processus principal remis à zéro dans
+    # chaque processus : seules ses extractions remontent
+    with ProcessPoolExecutor(max_workers=workers, initializer=take_date_pattern_stats) as pool:
+        return list(pool.map(function, jobs, chunksize=chunksize))
+
+
+def _select_entries(archive: HtmlArchive, urls: Optional[Set[str]], limit: Optional[int] = None) -> List[Dict]:
+    entries = [entry for url, entry in archive.latest_entries().items() if urls is None or url in urls]
+    return entries[:limit] if limit else entries
+
+
+def reparse_archive(archive: HtmlArchive, urls: Optional[Set[str]] = None,
+                    workers: Optional[int] = None, chunksize: int = 16,
+                    parser: Optional[str] = None, restricted: bool = False) -> List[Dict]:
+    """
+    Ré-extrait les articles depuis la dernière version archivée de chaque URL,
+    sans accès réseau, sur tous les cœurs disponibles.
+    Si urls est fourni, seules ces URLs sont traitées.
+    """
+    entries = _select_entries(archive, urls)
+    jobs = [(archive.archive_dir, entry, parser, restricted) for entry in entries]
+    workers = workers or os.cpu_count() or 1
+
+    print(f"Ré-extraction de {len(jobs)} pages archivées sur {workers} processus")
+
+    articles = []
+    for article, date_hits in _run(_parse_archived, jobs, workers, chunksize):
+        merge_date_pattern_stats(date_hits)
+        if article:
+            articles.append(article)
+    return articles
+
+
+def compare_parsers(archive: HtmlArchive, parser: str, reference: str = 'html.parser',
+                    urls: Optional[Set[str]] = None, limit: Optional[int] = None,
+                    workers: Optional[int] = None, chunksize: int = 16,
+                    restricted: bool = False) -> Dict[str, List[str]]:
+    """
+    Vérifie sur le corpus archivé qu'un backend de parsing (éventuellement en parsing
+    restreint) produit exactement les mêmes champs que le backend de référence en
+    parsing complet. Retourne {url: [champs différents]} pour les écarts.
+    """
+    entries = _select_entries(archive, urls, limit)
+    jobs = [(archive.archive_dir, entry, parser, reference, restricted) for entry in entries]
+    workers = workers or os.cpu_count() or 1
+
+    mode = " (parsing restreint)" if restricted else ""
+    print(f"Comparaison {parser}{mode} / {reference} sur {len(jobs)} pages archivées")
+
+    return {url: fields for url, fields in _run(_compare_archived, jobs, workers, chunksize) if fields}
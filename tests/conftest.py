@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from utils.data_manager import create_data_manager  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Chaque test tourne dans un dossier temporaire : aucun chemin relatif n'écrit dans le dépôt"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def make_manager(tmp_path):
+    """Crée des gestionnaires de données dans tmp_path (data et frontend), fermés en fin de test"""
+    managers = []
+
+    def make(storage='json', name='data'):
+        manager = create_data_manager(storage, str(tmp_path / name), str(tmp_path / 'frontend' / 'public'))
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        if hasattr(manager, 'close'):
+            manager.close()
+
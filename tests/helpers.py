@@ -0,0 +1,41 @@
+def make_article(i, **fields):
+    """Article de test minimal (url unique), complété par fields"""
+    article = {
+        'url': f'https://www.blogdumoderateur.com/article-{i}/',
+        'title': f'Article {i}',
+        'author': f'Auteur {i % 5}',
+        'category': 'Web',
+        'category_scraped': 'web',
+        'publication_date': f'2024{1 + i % 12:02d}{1 + i % 28:02d}',
+        'summary': f'Résumé {i}',
+        'content': f'Contenu de l\'article {i}',
+        'images': [{'url': f'https://img/{i}.jpg', 'caption': ''}] if i % 3 else [],
+    }
+    article.update(fields)
+    return article
+
+
+def article_page(title='Titre de test', byline=None, author_name=None, date='2024-03-15T10:00:00+00:00',
+                 page_time=None, content='Premier paragraphe du contenu.', category='Web', extra_body=''):
+    """
+    Page d'article au format du Blog du Modérateur (champs optionnels pour tester les replis).
+    page_time : <time datetime> placé dans l'en-tête de page, avant <article>
+    """
+    header = f'<header class="site"><time datetime="{page_time}">date du site</time></header>' if page_time else ''
+    byline_html = f'<span class="byline">Par <a href="/auteur/" title="{byline}">{byline}</a></span>' if byline else ''
+    author_html = f'<div class="author-name">{author_name}</div>' if author_name else ''
+    date_html = f'<span class="posted-on"><time datetime="{date}">15 mars</time></span>' if date else ''
+    return f"""<!DOCTYPE html>
+<html><head><title>{title}</title>
+<link rel="canonical" href="https://www.blogdumoderateur.com/web/article-test/"></head>
+<body>{header}
+<main>
+<article>
+<span class="favtag">{category}</span>
+<h1 class="entry-title">{title}</h1>
+{date_html}{byline_html}{author_html}
+<div class="entry-content"><p>{content}</p><p>Second paragraphe.</p></div>
+</article>
+{extra_body}
+</main>
+</body></html>"""
@@ -0,0 +1,111 @@
+import json
+import os
+import random
+
+import pytest
+
+import src.article_scraper as article_scraper
+from src.article_scraper import ArticleScraper
+from tests.helpers import article_page
+
+URL = 'https://www.blogdumoderateur.com/web/article-test/'
+
+# pages au hasard (replis, images) et articles extraits par le scraper d'origine
+# (BeautifulSoup, un appel find/select par sélecteur et par image), avant le plan compilé
+with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'baseline_extraction.json'), encoding='utf-8') as f:
+    BASELINE = json.load(f)
+
+# éléments qui correspondent aux sélecteurs de repli, placés au hasard dans la page
+FRAGMENTS = [
+    '<h1 class="logo">Le site</h1>',
+    '<h1>Autre titre</h1>',
+    '<time datetime="2020-01-02T00:00:00">2 janvier</time>',
+    '<span class="date">3 février 2019</span>',
+    '<span class="entry-date">2018-05-06</span>',
+    '<span class="posted-on"><time datetime="2017-07-08">8 juillet</time></span>',
+    '<span class="byline">Par <a title="Alice Dupont">Alice</a></span>',
+    '<div class="author-name">Carole Martin</div>',
+    '<span class="post-author-box">Denis Petit</span>',
+    '<a rel="author" href="/auteur/eve">Eve Bernard</a>',
+    '<nav class="breadcrumb"><a href="/">Accueil</a><a href="/tech/">Tech</a><a href="/tech/ia/">IA</a></nav>',
+    '<nav class="main-navigation"><a href="/web/">Web</a></nav>',
+    '<a rel="category tag" href="/social/">Social</a>',
+    '<span class="favtag">Marketing</span>',
+    '<div class="entry-excerpt">Un extrait assez long pour servir de résumé de repli.</div>',
+    '<p class="lead">Un chapô assez long pour servir de résumé de repli.</p>',
+    '<div class="entry-content"><p>Contenu hors article, assez long pour compter.</p></div>',
+    '<div class="content"><p>Bloc de contenu générique de la page.</p></div>',
+    '<div class="sidebar"><p>Widget sans sélecteur.</p></div>',
+]
+
+# parties de l'article, omises au hasard pour déclencher les replis
+ARTICLE_PARTS = [
+    '<span class="favtag">Web</span>',
+    '<h1 class="entry-title">Titre de test</h1>',
+    '<span class="posted-on"><time datetime="2022-01-01T09:00:00">1er janvier</time></span>',
+    '<span class="byline">Par <a href="/auteur/" title="Bob Martin">Bob</a></span>',
+    '<div class="entry-content"><p>Premier paragraphe du contenu de l\'article.</p><p>Suite.</p></div>',
+]
+
+
+def random_page(rng):
+    def fragments():
+        return ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 3)))
+
+    parts = [part for part in ARTICLE_PARTS if rng.random() < 0.7]
+    article_class = ' class="post category-web"' if rng.random() < 0.5 else ''
+    wrapper = rng.choice([('', ''), ('<main>', '</main>'), ('<div class="wrap">', '</div>')])
+    return (
+        '<html><head><title>t</title><link rel="canonical" href="https://www.blogdumoderateur.com/web/x/"></head>'
+        f'<body>{fragments()}{wrapper[0]}{fragments()}'
+        f'<article{article_class}>{fragments()}{"".join(parts)}{fragments()}</article>'
+        f'{fragments()}{wrapper[1]}{fragments()}</body></html>'
+    )
+
+
+def parse_both(html):
+    full = ArticleScraper(http_client=object()).parse_article(html, URL)
+    restricted = ArticleScraper(http_client=object(), restricted=True).parse_article(html, URL)
+    return full, restricted
+
+
+def test_page_time_before_article_matches_full_parse():
+    # <time datetime> de l'en-tête avant <article> : le parsing complet le trouve en premier
+    html = article_page(byline='Bob Martin', date=None, page_time='2020-01-02T00:00:00')
+    html = html.replace('<h1 class="entry-title">', '<time datetime="2022-01-01">1er janvier</time><h1 class="entry-title">')
+
+    full, restricted = parse_both(html)
+
+    assert full['publication_date'] == '20200102'
+    assert restricted == full
+
+
+def test_clean_page_is_parsed_from_region_only(monkeypatch):
+    parsed = []
+    parse_html = article_scraper.parse_html
+    monkeypatch.setattr(article_scraper, 'parse_html', lambda markup, parser=None: parsed.append(markup) or parse_html(markup, parser))
+
+    html = article_page(byline='Bob Martin', page_time='2020-01-02T00:00:00',
+                        extra_body='<aside><div class="author-name">Autre</div><h1>Pied</h1></aside>')
+    article = ArticleScraper(http_client=object(), restricted=True).parse_article(html, URL)
+
+    # les éléments hors zone ne passent pas avant ceux de l'article : une seule construction d'arbre
+    assert len(parsed) == 1 and '<main>' not in parsed[0]
+    assert article['publication_date'] == '20240315'
+    assert article['author'] == 'Bob Martin'
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_restricted_parse_equals_full_parse_on_random_layouts(seed):
+    rng = random.Random(seed)
+    for _ in range(250):
+        html = random_page(rng)
+        full, restricted = parse_both(html)
+        assert restricted == full, html
+
+
+@pytest.mark.parametrize('restricted', [False, True])
+def test_extraction_matches_original_scraper(restricted):
+    scraper = ArticleScraper(http_client=object(), restricted=restricted)
+    for page in BASELINE['pages']:
+        assert scraper.parse_article(page['html'], BASELINE['url']) == page['article'], page['html']
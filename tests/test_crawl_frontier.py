@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from src.crawl_frontier import CrawlFrontier, canonicalize_url
+
+BASE = 'https://www.blogdumoderateur.com/article-ia/'
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.blogdumoderateur.com/article-ia',
+    'HTTPS://WWW.BlogDuModerateur.com:443/article-ia/',
+    'https://www.blogdumoderateur.com/article-ia/#commentaires',
+    'https://www.blogdumoderateur.com/article-ia/?utm_source=x&fbclid=y',
+    ' https://www.blogdumoderateur.com/article-ia/?gclid=z ',
+])
+def test_variants_share_one_canonical_url(url):
+    assert canonicalize_url(url) == canonicalize_url(BASE)
+
+
+def test_meaningful_differences_are_kept():
+    assert canonicalize_url(BASE + '?page=2') != canonicalize_url(BASE)
+    assert canonicalize_url('http://www.blogdumoderateur.com/article-ia/') != canonicalize_url(BASE)
+    assert canonicalize_url('https://www.blogdumoderateur.com/Article-IA/') != canonicalize_url(BASE)
+
+
+def test_frontier_keeps_first_preview_and_every_category():
+    frontier = CrawlFrontier()
+    assert frontier.add({'url': BASE, 'title': 'Vu dans web'}, 'web')
+    assert frontier.add({'url': 'https://www.blogdumoderateur.com/autre/'}, 'web')
+    assert not frontier.add({'url': BASE + '?utm_campaign=lettre', 'title': 'Vu dans tech'}, 'tech')
+    assert not frontier.add({'url': BASE}, 'tech')
+
+    entries = list(frontier)
+    assert len(frontier) == 2 and frontier.duplicates == 2
+    key, preview, categories = entries[0]
+    assert key == canonicalize_url(BASE)
+    assert preview['title'] == 'Vu dans web'
+    assert categories == ['web', 'tech']
+
+
+def test_concurrent_adds_count_each_article_once():
+    frontier = CrawlFrontier()
+    categories = ['web', 'tech', 'social', 'marketing']
+    new = []
+
+    def discover(category):
+        new.append(sum(frontier.add({'url': f'{BASE}{i}/?utm_medium={category}'}, category) for i in range(500)))
+
+    threads = [threading.Thread(target=discover, args=(category,)) for category in categories]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(new) == len(frontier) == 500
+    assert frontier.duplicates == 3 * 500
+    assert all(sorted(entry_categories) == sorted(categories) for _, _, entry_categories in frontier)
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from tests.helpers import make_article
+from utils.date_index import DateIndex
+
+
+def _reference(articles, category=None):
+    """(date, position) des articles datés, filtre de catégorie comme search_articles"""
+    entries = []
+    for position, article in enumerate(articles):
+        if not article.get('publication_date'):
+            continue
+        if category and category.lower() not in (article.get('category') or '').lower():
+            continue
+        entries.append((article['publication_date'], position))
+    return sorted(entries)
+
+
+def _corpus(count=300, seed=7):
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        article = make_article(i, category=rng.choice(['Web', 'Tech', 'Social media', None]),
+                               publication_date=rng.choice([None, f'2023{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}']))
+        articles.append(article)
+    return articles
+
+
+def test_latest_and_range_match_full_sort():
+    articles = _corpus()
+    index = DateIndex(articles)
+    for category in (None, 'web', 'TECH', 'media'):
+        reference = _reference(articles, category)
+        assert index.latest(25, category) == [position for _, position in reversed(reference)][:25]
+        expected = [position for date, position in reference if '20230301' <= date <= '20230630']
+        assert index.in_range('20230301', '20230630', category) == expected
+
+
+def test_update_moves_article_between_partitions():
+    articles = _corpus(50)
+    index = DateIndex(articles)
+    moved = dict(articles[10], category='Tech', publication_date='20991231')
+    articles[10] = moved
+    index.update(moved)
+    added = make_article(999, category='Web', publication_date='20991230')
+    articles.append(added)
+    index.update(added)
+    assert index.latest(2) == [10, 50]
+    assert index.latest(1, 'web') == [50]
+    assert index.in_range('20990101', None, 'tech') == [10]
+
+
+@pytest.mark.parametrize('storage', ['json', 'jsonl', 'sqlite'])
+def test_backends_latest_articles(make_manager, storage):
+    manager = make_manager(storage)
+    articles = _corpus(120)
+    manager.save_articles([dict(article) for article in articles[:80]])
+    manager.save_articles([dict(article) for article in articles[60:]])
+
+    stored = manager.load_articles()
+    reference = _reference(stored, 'web')
+    latest = manager.get_latest_articles(10, 'web')
+    assert [article['url'] for article in latest] == [stored[position]['url'] for _, position in reversed(reference)][:10]
+    in_range = manager.get_articles_in_range('20230101', '20230331')
+    assert [article['url'] for article in in_range] == [
+        stored[position]['url'] for date, position in _reference(stored) if date <= '20230331'
+    ]
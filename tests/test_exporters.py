@@ -0,0 +1,65 @@
+import csv
+import gzip
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from utils.exporters import BATCH_ROWS, EXPORT_COLUMNS, ColumnarExporter, export_row
+from tests.helpers import make_article
+
+BACKENDS = ['json', 'jsonl', 'sqlite']
+
+
+def csv_rows(articles):
+    """Lignes CSV attendues : valeurs converties en texte comme csv.DictWriter"""
+    return [{column: str(value) for column, value in export_row(article).items()} for article in articles]
+
+
+@pytest.fixture
+def manager(make_manager, request):
+    manager = make_manager(request.param)
+    manager.save_articles([make_article(i, thumbnail=f'https://img/{i}.jpg' if i % 2 else None)
+                           for i in range(25)])
+    return manager
+
+
+@pytest.mark.parametrize('manager', BACKENDS, indirect=True)
+def test_streamed_exports_match_stored_articles(manager, tmp_path):
+    articles = manager.load_articles()
+
+    assert manager.export_articles('jsonl', str(tmp_path / 'export.jsonl')) == 25
+    with open(tmp_path / 'export.jsonl', encoding='utf-8') as f:
+        assert [json.loads(line) for line in f] == articles
+
+    assert manager.export_articles('csv', str(tmp_path / 'export.csv')) == 25
+    with open(tmp_path / 'export.csv', newline='', encoding='utf-8') as f:
+        assert list(csv.DictReader(f)) == csv_rows(articles)
+
+
+def test_columnar_fallback_groups_rows_by_column(tmp_path):
+    articles = [make_article(i) for i in range(BATCH_ROWS + 5)]
+    path = str(tmp_path / 'export.columns.jsonl.gz')
+
+    assert ColumnarExporter().write(iter(articles), path) == len(articles)
+
+    rows = []
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        groups = [json.loads(line) for line in f]
+    assert [group['rows'] for group in groups] == [BATCH_ROWS, 5]
+    for group in groups:
+        assert list(group['columns']) == EXPORT_COLUMNS
+        rows.extend(dict(zip(group['columns'], values)) for values in zip(*group['columns'].values()))
+    assert rows == [export_row(article) for article in articles]
+
+
+@pytest.mark.parametrize('manager', BACKENDS, indirect=True)
+def test_since_exports_only_saved_or_updated_articles(manager, tmp_path):
+    time.sleep(0.01)
+    since = datetime.now().isoformat()
+    manager.save_articles([make_article(3, title='Mis à jour'), make_article(30)])
+
+    assert manager.export_articles('jsonl', str(tmp_path / 'delta.jsonl'), since=since) == 2
+    with open(tmp_path / 'delta.jsonl', encoding='utf-8') as f:
+        assert [json.loads(line)['url'] for line in f] == [make_article(3)['url'], make_article(30)['url']]
@@ -0,0 +1,104 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.feed_scraper import FeedScraper
+from utils.http_cache import HttpCache
+from utils.http_client import HttpClient
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel><title>BDM</title>
+{items}
+</channel></rss>"""
+
+ITEM = """<item><title>Article {i} &amp; co</title><link>https://www.blogdumoderateur.com/article-{i}/</link>
+<pubDate>Mon, 0{day} Jan 2024 10:00:00 +0000</pubDate><category>Web</category>
+<description>Résumé {i}</description><media:content url="https://img/{i}.jpg"/></item>"""
+
+SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{urls}
+</urlset>"""
+
+
+@pytest.fixture
+def server():
+    """Serveur HTTP local : chaque document porte un ETag, 304 si le client l'envoie"""
+    documents = {
+        '/feed/': RSS.format(items='\n'.join(ITEM.format(i=i, day=1 + i % 9) for i in range(5))),
+        '/sitemap.xml': SITEMAP.format(urls='\n'.join(
+            f'<url><loc>https://www.blogdumoderateur.com/article-{i}/</loc><lastmod>2024-01-0{1 + i}</lastmod></url>'
+            for i in range(3))),
+    }
+    statuses = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = documents[self.path.split('?')[0]].encode('utf-8')
+            etag = f'"{len(body)}"'
+            if self.headers.get('If-None-Match') == etag:
+                statuses.append(304)
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            statuses.append(200)
+            self.send_response(200)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Type', 'application/xml; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}', statuses
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def scraper_with_cache(tmp_path):
+    return FeedScraper(http_client=HttpClient(cache=HttpCache(str(tmp_path / 'http_cache'))))
+
+
+def test_feed_read_twice_through_http_cache(server, tmp_path):
+    base, statuses = server
+    scraper = scraper_with_cache(tmp_path)
+
+    first = scraper.fetch_articles_list(base + '/feed/')
+    second = scraper.fetch_articles_list(base + '/feed/')
+
+    # deuxième lecture : 304, corps rendu par le cache
+    assert statuses == [200, 304]
+    assert second == first
+    assert [preview['url'] for preview in first] == \
+        [f'https://www.blogdumoderateur.com/article-{i}/' for i in range(5)]
+    assert first[0]['title'] == 'Article 0 & co'
+    assert first[0]['preview_image'] == 'https://img/0.jpg'
+
+
+def test_sitemap_read_twice_through_http_cache(server, tmp_path):
+    base, statuses = server
+    scraper = scraper_with_cache(tmp_path)
+
+    first = scraper.fetch_sitemap(base + '/sitemap.xml')
+    second = scraper.fetch_sitemap(base + '/sitemap.xml')
+
+    assert statuses == [200, 304]
+    assert second == first
+    assert [preview['lastmod'] for preview in first] == ['2024-01-01', '2024-01-02', '2024-01-03']
+
+
+def test_feed_items_are_parsed_across_chunk_boundaries(server, tmp_path, monkeypatch):
+    base, _ = server
+    scraper = scraper_with_cache(tmp_path)
+    expected = scraper.fetch_articles_list(base + '/feed/')
+
+    # morceaux de 7 octets : balises et caractères multi-octets coupés en deux
+    monkeypatch.setattr(FeedScraper, 'CHUNK_SIZE', 7)
+    assert scraper.fetch_articles_list(base + '/feed/') == expected
@@ -0,0 +1,101 @@
+import json
+import os
+
+import pytest
+
+from utils.frontend_shards import FrontendPublisher, partition_key
+from tests.helpers import make_article
+
+
+def published(data_dir):
+    """État publié : statistiques et {(catégorie, mois): {url: article}} lus depuis les fichiers"""
+    with open(os.path.join(data_dir, 'index.json'), encoding='utf-8') as f:
+        index = json.load(f)
+    partitions = {}
+    for entry in index['partitions']:
+        with open(os.path.join(data_dir, entry['content']), encoding='utf-8') as f:
+            members = json.load(f)
+        with open(os.path.join(data_dir, entry['listing']), encoding='utf-8') as f:
+            assert [card['url'] for card in json.load(f)] == list(members)
+        assert entry['count'] == len(members)
+        partitions[(entry['category'], entry['month'])] = members
+    return index['stats'], partitions
+
+
+def rebuilt(tmp_path, articles):
+    """État d'une publication complète des mêmes articles, dans un dossier à part"""
+    data_dir = str(tmp_path / 'rebuilt')
+    FrontendPublisher(data_dir).publish(articles)
+    return published(data_dir)
+
+
+def same_content(state, expected):
+    # l'ordre des articles dans une partition peut différer : seul le contenu compte
+    assert state[0] == expected[0]
+    assert {key: dict(sorted(members.items())) for key, members in state[1].items()} == \
+        {key: dict(sorted(members.items())) for key, members in expected[1].items()}
+
+
+def test_update_rewrites_only_touched_partitions(tmp_path):
+    publisher = FrontendPublisher(str(tmp_path / 'data'))
+    articles = {article['url']: article for article in (make_article(i) for i in range(60))}
+    publisher.publish(articles.values())
+    total_partitions = len(published(publisher.data_dir)[1])
+
+    # une mise à jour dans sa partition, un article qui change de mois, un nouvel article
+    updated = dict(articles[make_article(1)['url']], title='Nouveau titre', updated_at='2025-01-01T00:00:00')
+    moved = dict(articles[make_article(2)['url']], publication_date='20190101', updated_at='2025-01-01T00:00:00')
+    added = make_article(100)
+    changes = [(article['url'], partition_key(articles[article['url']]) if article['url'] in articles else None,
+                article) for article in (updated, moved, added)]
+    articles.update((article['url'], article) for article in (updated, moved, added))
+
+    written, total = publisher.update(changes, lambda: pytest.fail("reconstruction complète inattendue"),
+                                      len(articles), len({a['author'] for a in articles.values()}))
+
+    touched = {partition_key(updated), partition_key(make_article(2)), partition_key(moved), partition_key(added)}
+    assert written == len(touched)
+    assert total == total_partitions + 1
+    same_content(published(publisher.data_dir), rebuilt(tmp_path, articles.values()))
+
+
+def test_update_rebuilds_when_index_is_missing_or_stale(tmp_path):
+    publisher = FrontendPublisher(str(tmp_path / 'data'))
+    articles = [make_article(i) for i in range(10)]
+
+    # pas d'index : publication complète depuis le corpus
+    assert publisher.update([], lambda: articles, len(articles), 5) == (10, 10)
+
+    # articles publiés par un processus interrompu : le total ne correspond plus
+    articles.append(make_article(10))
+    written, total = publisher.update([], lambda: articles, len(articles), 5)
+    assert total == 11 and written == 1
+    same_content(published(publisher.data_dir), rebuilt(tmp_path, articles))
+
+
+def closed(manager):
+    """Les stockages jsonl et sqlite publient en fin d'exécution"""
+    if hasattr(manager, 'close'):
+        manager.close()
+
+
+@pytest.mark.parametrize('storage', ['json', 'jsonl', 'sqlite'])
+def test_backends_publish_saved_articles_incrementally(make_manager, tmp_path, storage):
+    manager = make_manager(storage)
+    manager.save_articles([make_article(i) for i in range(30)])
+    closed(manager)
+
+    manager = make_manager(storage)
+    manager.save_articles([make_article(3, title='Titre modifié'),
+                           make_article(4, category_scraped='tech'),
+                           make_article(4, category_scraped='social'),
+                           make_article(40)])
+    closed(manager)
+
+    data_dir = str(tmp_path / 'frontend' / 'public' / 'data')
+    stats, partitions = published(data_dir)
+    urls = [url for members in partitions.values() for url in members]
+    assert len(urls) == len(set(urls)) == 31
+    moved = partitions[partition_key(make_article(4, category_scraped='social'))][make_article(4)['url']]
+    assert moved['category_scraped'] == 'social'
+    same_content((stats, partitions), rebuilt(tmp_path, make_manager(storage).load_articles()))
@@ -0,0 +1,100 @@
+import requests
+
+from utils.http_cache import HttpCache
+from utils.http_client import HttpClient
+
+URL = 'https://www.blogdumoderateur.com/web/'
+
+
+class FakeServer:
+    """Serveur qui répond 304 quand l'ETag envoyé correspond à la page courante"""
+
+    def __init__(self):
+        self.pages = {}
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.requests.append((url, dict(headers)))
+        body, etag = self.pages[url]
+        response = requests.Response()
+        response.url = url
+        response.encoding = 'utf-8'
+        if headers.get('If-None-Match') == etag:
+            response.status_code = 304
+            response._content = b''
+            response.headers['ETag'] = etag
+        else:
+            response.status_code = 200
+            response._content = body.encode('utf-8')
+            response.headers.update({'ETag': etag, 'Content-Type': 'text/html; charset=utf-8'})
+        return response
+
+
+def client_with(server, cache):
+    client = HttpClient(cache=cache)
+    client.session.get = server.get
+    return client
+
+
+def test_not_modified_page_is_served_from_cache(tmp_path):
+    server = FakeServer()
+    server.pages[URL] = ('<html>Première version é</html>', '"v1"')
+    client = client_with(server, HttpCache(str(tmp_path / 'cache')))
+
+    first = client.get(URL)
+    second = client.get(URL)
+
+    assert server.requests[1][1]['If-None-Match'] == '"v1"'
+    assert second.status_code == 200 and getattr(second, 'from_cache', False)
+    assert second.text == first.text == '<html>Première version é</html>'
+
+    # lecture par morceaux ou par lignes d'une réponse servie par le cache
+    again = client.get(URL)
+    assert again.from_cache
+    assert b''.join(again.iter_content(4)) == first.content
+    assert list(client.get(URL).iter_lines(decode_unicode=True)) == ['<html>Première version é</html>']
+
+    server.pages[URL] = ('<html>Seconde version</html>', '"v2"')
+    assert client.get(URL).text == '<html>Seconde version</html>'
+    client.close()
+
+    # index relu par un nouveau processus
+    server.requests.clear()
+    client = client_with(server, HttpCache(str(tmp_path / 'cache')))
+    assert client.get(URL).from_cache
+    assert server.requests[0][1]['If-None-Match'] == '"v2"'
+
+
+def test_lost_body_falls_back_to_full_request(tmp_path):
+    server = FakeServer()
+    server.pages[URL] = ('<html>Page</html>', '"v1"')
+    cache = HttpCache(str(tmp_path / 'cache'))
+    client = client_with(server, cache)
+    client.get(URL)
+
+    cache._remove_body(URL)
+    response = client.get(URL)
+
+    assert response.text == '<html>Page</html>' and not getattr(response, 'from_cache', False)
+    # requête conditionnelle, puis requête complète sans validateur
+    assert [headers.get('If-None-Match') for _, headers in server.requests] == [None, '"v1"', None]
+
+
+def test_cache_evicts_least_recently_used_bodies(tmp_path):
+    server = FakeServer()
+    urls = [f'{URL}page-{i}/' for i in range(4)]
+    for i, url in enumerate(urls):
+        # contenu peu compressible : environ 3 Ko par corps compressé, deux corps tiennent dans 7 Ko
+        server.pages[url] = (''.join(chr(0x4e00 + (i * 7919 + j * 104729) % 20000) for j in range(1400)), f'"{i}"')
+    cache = HttpCache(str(tmp_path / 'cache'), max_size_mb=7 / 1024)
+    client = client_with(server, cache)
+
+    client.get(urls[0])
+    client.get(urls[1])
+    client.get(urls[0])  # page 0 utilisée de nouveau : page 1 est la plus ancienne
+    client.get(urls[2])
+
+    assert cache._total_size <= cache.max_size
+    assert cache.conditional_headers(urls[0]) and cache.conditional_headers(urls[2])
+    assert not cache.conditional_headers(urls[1])
@@ -0,0 +1,59 @@
+from utils.jsonl_store import JsonlDataManager
+from tests.helpers import make_article
+
+
+def log_lines(manager):
+    with open(manager.log_file, 'rb') as f:
+        return f.read().count(b"\n")
+
+
+def test_compaction_keeps_latest_versions(make_manager):
+    manager = make_manager('jsonl')
+    manager.save_articles([make_article(i) for i in range(20)])
+    for version in range(3):
+        manager.save_articles([make_article(i, title=f'Version {version}') for i in range(0, 20, 2)])
+    expected = manager.load_articles()
+    stats = manager.get_stats()
+    assert log_lines(manager) == 50
+
+    manager.compact()
+
+    assert log_lines(manager) == 20
+    assert manager.load_articles() == expected
+    assert manager.get_stats() == stats
+    manager.close()
+
+    # relu depuis le journal compacté
+    reopened = make_manager('jsonl')
+    assert reopened.load_articles() == expected
+    assert reopened.verify_stats()
+
+
+def test_truncated_last_line_is_dropped(make_manager):
+    manager = make_manager('jsonl')
+    manager.save_articles([make_article(i) for i in range(3)])
+    manager.close()
+    # arrêt brutal pendant l'écriture d'une ligne
+    with open(manager.log_file, 'ab') as f:
+        f.write(b'{"url": "https://www.blogdumoderateur.com/coupe')
+
+    reopened = make_manager('jsonl')
+    assert len(reopened.load_articles()) == 3
+    reopened.save_articles([make_article(3)])
+    reopened.close()
+    assert len(make_manager('jsonl').load_articles()) == 4
+
+
+def test_background_compaction_during_saves(make_manager, monkeypatch):
+    monkeypatch.setattr(JsonlDataManager, 'COMPACT_MIN_LINES', 10)
+    manager = make_manager('jsonl')
+    for version in range(30):
+        # compaction lancée en arrière-plan par les sauvegardes, qui continuent pendant ce temps
+        manager.save_articles([make_article(i, title=f'Version {version}') for i in range(version % 4, 12, 3)])
+    expected = manager.load_articles()
+    manager.close()
+
+    assert log_lines(manager) < 30 * 4
+    reopened = make_manager('jsonl')
+    assert reopened.load_articles() == expected
+    assert reopened.verify_stats()
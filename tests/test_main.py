@@ -0,0 +1,64 @@
+import json
+import os
+import sys
+
+import pytest
+
+import main
+from main import BlogScrapingManager
+from utils.data_manager import create_data_manager
+from utils.html_archive import HtmlArchive
+from utils.html_parser import is_backend_available
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'parser_corpus')
+
+
+def test_page_stores_are_only_opened_by_fetching_commands(isolated_cwd):
+    manager = BlogScrapingManager()
+    manager.show_stats()
+    manager.search('intelligence')
+    manager.export()
+
+    assert not os.path.exists(os.path.join('data', 'http_cache'))
+    assert not os.path.exists(os.path.join('data', 'archive'))
+    assert manager.http_client.cache is None and manager.http_client.archive is None
+
+    manager._open_page_stores()
+    assert manager.http_client.cache is manager.http_cache
+    assert manager.http_client.archive is manager.archive
+    assert os.path.isdir(os.path.join('data', 'http_cache'))
+    assert os.path.isdir(os.path.join('data', 'archive'))
+
+
+def test_disabled_page_stores_stay_closed(isolated_cwd):
+    manager = BlogScrapingManager(use_cache=False, use_archive=False)
+    manager._open_page_stores()
+    assert manager.http_client.cache is None and manager.http_client.archive is None
+    assert not os.path.exists(os.path.join('data', 'http_cache'))
+    assert not os.path.exists(os.path.join('data', 'archive'))
+
+
+def archive_corpus_page(name):
+    """Archive une page du corpus de parsing et enregistre son article dans la base"""
+    with open(os.path.join(CORPUS_DIR, 'expected.json'), encoding='utf-8') as f:
+        article = json.load(f)[name]
+    with open(os.path.join(CORPUS_DIR, f'{name}.html'), encoding='utf-8') as f:
+        HtmlArchive().append(article['url'], f.read().encode('utf-8'))
+    create_data_manager('json').save_articles([article])
+
+
+def run_main(monkeypatch, *argv):
+    monkeypatch.setattr(sys, 'argv', ['main.py', *argv])
+    main.main()
+
+
+@pytest.mark.skipif(not is_backend_available('lxml'), reason="lxml non installé")
+def test_check_parser_fails_when_any_field_differs(isolated_cwd, monkeypatch):
+    archive_corpus_page('standard')
+    run_main(monkeypatch, 'check-parser', 'lxml')
+
+    # lxml répare autrement un <div> dans un <p> : résumé et contenu diffèrent
+    archive_corpus_page('malformed_div_in_p')
+    with pytest.raises(SystemExit) as exit_info:
+        run_main(monkeypatch, 'check-parser', 'lxml')
+    assert exit_info.value.code == 1
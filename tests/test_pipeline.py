@@ -0,0 +1,92 @@
+import os
+import threading
+
+import src.pipeline as pipeline_module
+from src.pipeline import ScrapePipeline, _parse_fetched
+from src.reparser import reparse_archive
+from utils.html_archive import HtmlArchive
+from utils.text_cleaner import date_pattern_stats, extract_date
+from tests.helpers import article_page
+
+URL = 'https://www.blogdumoderateur.com/web/article-{}/'
+
+
+def crashing_parse(job):
+    """Processus de parsing tué net (segfault d'une extension, OOM killer...) sur une page"""
+    if job[0] == URL.format('crash'):
+        os._exit(1)
+    return _parse_fetched(job)
+
+
+class Response:
+    text = article_page(byline='Bob Martin')
+
+    def raise_for_status(self):
+        pass
+
+
+class Client:
+    def get(self, url):
+        return Response()
+
+
+def run_with_timeout(pipeline, previews, timeout=60):
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.update(results=pipeline.run(previews)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "le pipeline attend un résultat qui ne viendra jamais"
+    return outcome['results']
+
+
+def test_crashed_worker_fails_pages_instead_of_hanging(make_manager, monkeypatch):
+    monkeypatch.setattr(pipeline_module, '_parse_fetched', crashing_parse)
+    manager = make_manager('json')
+    previews = [{'url': URL.format(i)} for i in range(3)] + [{'url': URL.format('crash')}] + \
+        [{'url': URL.format(i)} for i in range(3, 12)]
+    pipeline = ScrapePipeline(Client(), manager, fetch_workers=1, parse_workers=1, queue_size=2)
+
+    results = run_with_timeout(pipeline, previews)
+
+    assert len(results) == len(previews)
+    assert results[3] is None
+    # pages extraites avant la mort du processus : sauvegardées normalement
+    saved = {article['url'] for article in manager.load_articles()}
+    assert saved == {result['url'] for result in results if result}
+
+
+def year_only_hits():
+    return date_pattern_stats().get('year_only', 0)
+
+
+def test_date_patterns_of_parse_workers_reach_the_parent(make_manager):
+    # compteurs déjà remplis dans le processus principal : hérités par fork, ils ne
+    # doivent pas être comptés une seconde fois
+    extract_date('2021')
+    before = year_only_hits()
+
+    class YearOnlyResponse(Response):
+        text = article_page(date='Publié en 2023')
+
+    class YearOnlyClient:
+        def get(self, url):
+            return YearOnlyResponse()
+
+    pipeline = ScrapePipeline(YearOnlyClient(), make_manager('json'), fetch_workers=2, parse_workers=2)
+    results = run_with_timeout(pipeline, [{'url': URL.format(i)} for i in range(6)])
+
+    assert [result['publication_date'] for result in results] == ['20230101'] * 6
+    assert year_only_hits() - before == 6
+
+
+def test_date_patterns_of_reparse_workers_reach_the_parent():
+    extract_date('2021')
+    archive = HtmlArchive('archive')
+    for i in range(5):
+        archive.append(URL.format(i), article_page(date='Publié en 2023').encode('utf-8'))
+    before = year_only_hits()
+
+    articles = reparse_archive(archive, workers=2, chunksize=1)
+
+    assert len(articles) == 5
+    assert year_only_hits() - before == 5
@@ -0,0 +1,66 @@
+import pytest
+
+import utils.rate_limiter as rate_limiter
+from utils.rate_limiter import RateLimiter, TokenBucket
+
+URL = 'https://www.blogdumoderateur.com/web/'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge monotone contrôlée par le test"""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_bucket_spaces_requests_after_burst(clock):
+    bucket = TokenBucket(rate=2.0, burst=3)
+    # la réserve part sans attente, les suivantes attendent leur tour (0,5 s par jeton)
+    assert [bucket.reserve() for _ in range(5)] == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+    clock[0] += 10
+    # réserve de nouveau pleine, jamais au-delà de burst
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+
+
+def test_bucket_pause_delays_next_reservation(clock):
+    bucket = TokenBucket(rate=1.0, burst=2)
+    bucket.pause(30)
+    assert bucket.reserve() == 31.0
+    clock[0] += 40
+    assert bucket.reserve() == 0.0
+
+
+def test_limiter_slows_down_on_429_and_recovers(clock):
+    limiter = RateLimiter(requests_per_second=2.0, min_rate=0.5)
+    bucket = limiter._bucket(URL)
+
+    limiter.record(URL, 429, retry_after='12')
+    assert bucket.rate == 1.0
+    assert bucket.reserve() == pytest.approx(13.0)
+
+    limiter.record(URL, None)
+    limiter.record(URL, 503)
+    assert bucket.rate == 0.5
+
+    for _ in range(20):
+        limiter.record(URL, 200, latency=0.1)
+    assert bucket.rate == 2.0
+    # autres hôtes non concernés
+    assert limiter._bucket('https://autre.example/').rate == 2.0
+
+
+def test_limiter_slows_down_when_latency_spikes(clock):
+    limiter = RateLimiter(requests_per_second=4.0)
+    for _ in range(5):
+        limiter.record(URL, 200, latency=0.2)
+    limiter.record(URL, 200, latency=2.0)
+    assert limiter._bucket(URL).rate == 3.0
+
+
+def test_disabled_limiter_never_waits(monkeypatch):
+    monkeypatch.setattr(rate_limiter.time, 'sleep', lambda seconds: pytest.fail("attente inattendue"))
+    limiter = RateLimiter(requests_per_second=0)
+    for _ in range(10):
+        limiter.acquire(URL)
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+from utils.search_index import SearchIndex
+from tests.helpers import make_article
+
+BACKENDS = ['json', 'jsonl', 'sqlite']
+
+
+def closed(manager):
+    """Les stockages jsonl et sqlite enregistrent l'index en fin d'exécution"""
+    if hasattr(manager, 'close'):
+        manager.close()
+
+
+def urls(articles):
+    return sorted(article['url'] for article in articles)
+
+
+def no_sync(monkeypatch):
+    monkeypatch.setattr(SearchIndex, 'sync', lambda *args: pytest.fail("synchronisation inattendue"))
+
+
+def test_index_ranks_by_field_and_completes_prefixes():
+    index = SearchIndex(None)
+    index.add(make_article(1, title='Le référencement naturel', summary='', content=''), 'a')
+    index.add(make_article(2, title='Outils', summary='Référencement local', content=''), 'a')
+    index.add(make_article(3, title='Réseaux', summary='', content='Rien à voir'), 'a')
+
+    assert [url for url, _ in index.search('referencement')] == [make_article(1)['url'], make_article(2)['url']]
+    assert [url for url, _ in index.search('réfé')] == [make_article(1)['url'], make_article(2)['url']]
+    assert index.search('referencement reseaux') == []
+
+    index.remove(make_article(1)['url'])
+    assert [url for url, _ in index.search('référencement')] == [make_article(2)['url']]
+
+
+@pytest.mark.parametrize('storage', BACKENDS)
+def test_saved_articles_are_searchable_without_sync(make_manager, monkeypatch, storage):
+    manager = make_manager(storage)
+    manager.save_articles([make_article(i) for i in range(20)])
+    assert urls(manager.search_articles(query='article')) == urls(manager.load_articles())
+
+    no_sync(monkeypatch)
+    manager.save_articles([make_article(3, title='Intelligence artificielle'),
+                           make_article(50, title='Intelligence collective')])
+    manager.import_articles([make_article(60, title='Intelligence économique', scraped_at='2024-01-01T00:00:00')])
+
+    assert urls(manager.search_articles(query='intelligence')) == \
+        urls([make_article(3), make_article(50), make_article(60)])
+    closed(manager)
+
+    # index enregistré avec le jeton des données : relu tel quel par un nouveau processus
+    manager = make_manager(storage)
+    assert len(manager.search_articles(query='intelligence')) == 3
+    manager.save_articles([make_article(70, title='Intelligence territoriale')])
+    assert len(manager.search_articles(query='intelligence')) == 4
+
+
+@pytest.mark.parametrize('storage', BACKENDS)
+def test_missing_or_stale_index_is_recovered_by_sync(make_manager, monkeypatch, storage):
+    synced = []
+    sync = SearchIndex.sync
+    monkeypatch.setattr(SearchIndex, 'sync', lambda self, *args: synced.append(1) or sync(self, *args))
+
+    manager = make_manager(storage)
+    manager.save_articles([make_article(i) for i in range(10)])
+    # pas d'index avant la première recherche : construit depuis la base
+    assert len(manager.search_articles(query='article')) == 10
+    assert synced
+    closed(manager)
+    with open(manager.search_index_file, 'rb') as f:
+        saved_index = f.read()
+
+    # écriture suivie d'un arrêt brutal : l'index enregistré ne correspond plus à la base
+    writer = make_manager(storage)
+    writer.save_articles([make_article(20, title='Écrit ailleurs')])
+    closed(writer)
+    with open(manager.search_index_file, 'wb') as f:
+        f.write(saved_index)
+
+    synced.clear()
+    manager = make_manager(storage)
+    assert urls(manager.search_articles(query='ailleurs')) == urls([make_article(20)])
+    assert synced
+    closed(manager)
+
+    # index supprimé : reconstruit
+    os.remove(manager.search_index_file)
+    manager = make_manager(storage)
+    assert len(manager.search_articles(query='article')) == 11
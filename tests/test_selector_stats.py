@@ -0,0 +1,84 @@
+from src.article_scraper import ArticleScraper, AUTHOR_CHAIN
+from src.pipeline import ScrapePipeline, _parse_fetched
+from tests.helpers import article_page
+from utils.selector_stats import SelectorStats
+
+URL = 'https://www.blogdumoderateur.com/web/article-test/'
+HOST = 'www.blogdumoderateur.com'
+
+
+def _scraper(stats=None):
+    return ArticleScraper(http_client=object(), selector_stats=stats)
+
+
+def test_declared_priority_kept_after_a_few_pages():
+    # 3 pages sans byline : .author-name gagne, mais l'ordre déclaré reste en vigueur
+    stats = SelectorStats(None)
+    scraper = _scraper(stats)
+    for _ in range(3):
+        assert scraper.parse_article(article_page(author_name='Guest Columnist'), URL)['author'] == 'Guest Columnist'
+
+    page = article_page(byline='Bob Martin', author_name='Guest Columnist')
+    assert scraper.parse_article(page, URL)['author'] == 'Bob Martin'
+    assert _scraper().parse_article(page, URL)['author'] == 'Bob Martin'
+
+
+def test_order_demotes_only_selectors_that_never_won():
+    stats = SelectorStats(None)
+    chain = ['a', 'b', 'c', 'd']
+    for _ in range(stats.MIN_SAMPLES - 1):
+        stats.record(HOST, 'author', 'c')
+    assert stats.order(HOST, 'author', chain) == chain
+
+    stats.record(HOST, 'author', 'd')
+    # c et d ont gagné : ils gardent leur priorité déclarée, a et b passent en repli
+    assert stats.order(HOST, 'author', chain) == ['c', 'd', 'a', 'b']
+
+
+def test_demoted_selector_recovers_through_exploration():
+    stats = SelectorStats(None)
+    scraper = _scraper(stats)
+    for _ in range(SelectorStats.MIN_SAMPLES):
+        scraper.parse_article(article_page(author_name='Guest Columnist'), URL)
+    assert stats.order(HOST, 'author', AUTHOR_CHAIN)[0] == '.author-name'
+
+    # le site ajoute une byline : elle regagne sa place grâce aux pages extraites dans l'ordre déclaré
+    page = article_page(byline='Bob Martin', author_name='Guest Columnist')
+    authors = [scraper.parse_article(page, URL)['author'] for _ in range(2 * SelectorStats.EXPLORE_EVERY)]
+    assert 'Bob Martin' in authors
+    assert authors[-1] == 'Bob Martin'
+    assert stats.order(HOST, 'author', AUTHOR_CHAIN)[0] == 'span.byline'
+
+
+def test_stats_are_persisted_by_writer_only(tmp_path):
+    stats_file = str(tmp_path / 'selector_stats.json')
+    stats = SelectorStats(stats_file)
+    stats.record(HOST, 'author', '.author-name')
+    stats.flush()
+    reader = SelectorStats(stats_file, read_only=True)
+    reader.record(HOST, 'author', '.author-name')
+    reader.flush()
+    assert SelectorStats(stats_file)._hits == {HOST: {'author': {'.author-name': 1}}}
+
+
+def test_pipeline_worker_returns_hits_recorded_by_parent(make_manager):
+    article, hits, _ = _parse_fetched((URL, article_page(byline='Bob Martin'), None, False, None))
+    assert article['author'] == 'Bob Martin'
+    assert ('author', 'span.byline') in hits
+
+    class Response:
+        text = article_page(byline='Bob Martin')
+
+        def raise_for_status(self):
+            pass
+
+    class Client:
+        def get(self, url):
+            return Response()
+
+    stats = SelectorStats(None)
+    pipeline = ScrapePipeline(Client(), make_manager('json'), fetch_workers=2, parse_workers=1,
+                              selector_stats=stats)
+    results = pipeline.run([{'url': URL}, {'url': URL.replace('test', 'test-2')}])
+    assert all(result['author'] == 'Bob Martin' for result in results)
+    assert stats._hits[HOST]['author'] == {'span.byline': 2}
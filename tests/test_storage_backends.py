@@ -0,0 +1,189 @@
+import json
+import sqlite3
+
+import pytest
+
+from tests.helpers import make_article
+
+BACKENDS = ['json', 'jsonl', 'sqlite']
+
+
+def corpus():
+    articles = [make_article(i) for i in range(40)]
+    # casse, accents et champs absents : la recherche ignore la casse (str.lower) et ne
+    # filtre pas un article sans valeur pour le champ
+    articles[0].update(category='Économie', subcategory='Économie numérique', author='Élodie Durand')
+    articles[1].update(category='WEB', subcategory='Outils Web', author='ÉLODIE DURAND')
+    articles[2].update(category=None, author='')
+    articles[3].pop('category')
+    articles[4].update(title='Le WEB3 expliqué', publication_date='')
+    return articles
+
+
+def stored(manager):
+    manager.save_articles(corpus())
+    # mise à jour d'un article existant
+    manager.save_articles([make_article(5, title='Titre mis à jour', categories_scraped=['web'])])
+    return manager
+
+
+QUERIES = [
+    {'category': 'web'},
+    {'category': 'éco'},
+    {'category': 'ÉCONOMIE'},
+    {'category': 'introuvable'},
+    {'subcategory': 'web'},
+    {'author': 'élodie'},
+    {'author': 'auteur 3'},
+    {'title_search': 'web'},
+    {'category': 'web', 'author': 'auteur'},
+    {'date_start': '20240301', 'date_end': '20240630'},
+    {'date_start': '20240301', 'category': 'web'},
+]
+
+
+def without_timestamps(articles):
+    return [{k: v for k, v in article.items() if k not in ('scraped_at', 'updated_at')} for article in articles]
+
+
+@pytest.fixture
+def managers(make_manager):
+    return {storage: stored(make_manager(storage, name=storage)) for storage in BACKENDS}
+
+
+def test_backends_round_trip_the_same_articles(managers):
+    expected = without_timestamps(managers['json'].load_articles())
+    assert len(expected) == 40
+    assert expected[5]['title'] == 'Titre mis à jour'
+    for storage in ('jsonl', 'sqlite'):
+        assert without_timestamps(managers[storage].load_articles()) == expected, storage
+
+
+@pytest.mark.parametrize('filters', QUERIES)
+def test_backends_filter_like_the_json_store(managers, filters):
+    expected = [article['url'] for article in managers['json'].search_articles(**filters)]
+    for storage in ('jsonl', 'sqlite'):
+        assert [article['url'] for article in managers[storage].search_articles(**filters)] == expected, storage
+
+
+@pytest.mark.parametrize('category', [None, 'web', 'éco', 'introuvable'])
+def test_backends_list_like_the_json_store(managers, category):
+    reference = managers['json']
+    for storage in ('jsonl', 'sqlite'):
+        manager = managers[storage]
+        assert manager.get_subcategories(category) == reference.get_subcategories(category)
+        assert [a['url'] for a in manager.get_latest_articles(5, category)] == \
+            [a['url'] for a in reference.get_latest_articles(5, category)]
+        assert [a['url'] for a in manager.get_articles_in_range('20240201', '20240801', category)] == \
+            [a['url'] for a in reference.get_articles_in_range('20240201', '20240801', category)]
+    assert managers['sqlite'].get_stats() == reference.get_stats()
+
+
+def test_sqlite_filters_use_the_lowercase_indexes(managers):
+    manager = managers['sqlite']
+    statements = []
+    manager._conn.set_trace_callback(statements.append)
+    manager.search_articles(category='web', author='élodie')
+    manager.get_subcategories('éco')
+    manager.get_latest_articles(5, 'web')
+    manager._conn.set_trace_callback(None)
+
+    plans = []
+    for statement in statements:
+        if statement.lstrip().upper().startswith('SELECT'):
+            plans.extend(detail for *_, detail in manager._conn.execute('EXPLAIN QUERY PLAN ' + statement))
+    assert plans
+    assert 'py_lower' not in ' '.join(statements)
+    # aucun parcours de la table elle-même : chaque requête passe par un index
+    assert not [detail for detail in plans if detail.startswith('SCAN articles') and 'INDEX' not in detail]
+    assert any('idx_articles_category_lower' in detail or 'idx_articles_author_lower' in detail for detail in plans)
+
+
+def test_sqlite_migrates_databases_without_lowercase_columns(make_manager, tmp_path):
+    data_dir = tmp_path / 'old'
+    data_dir.mkdir()
+    conn = sqlite3.connect(str(data_dir / 'articles.db'))
+    conn.executescript("""
+        CREATE TABLE articles (url TEXT PRIMARY KEY, position INTEGER NOT NULL, title TEXT, category TEXT,
+                               subcategory TEXT, author TEXT, publication_date TEXT,
+                               has_images INTEGER NOT NULL DEFAULT 0, has_content INTEGER NOT NULL DEFAULT 0,
+                               data TEXT NOT NULL);
+    """)
+    for position, article in enumerate(corpus(), 1):
+        conn.execute("INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", (
+            article['url'], position, article.get('title'), article.get('category'), article.get('subcategory'),
+            article.get('author'), article.get('publication_date'), 0, 1, json.dumps(article)))
+    conn.commit()
+    conn.close()
+
+    manager = make_manager('sqlite', name='old')
+    reference = make_manager('json', name='reference')
+    reference.import_articles(corpus())
+    for filters in QUERIES:
+        assert [a['url'] for a in manager.search_articles(**filters)] == \
+            [a['url'] for a in reference.search_articles(**filters)], filters
+
+
+def mutate(articles):
+    for article in articles:
+        article['title'] = 'modifié'
+        article.setdefault('images', []).append({'url': 'https://img/intrus.jpg', 'caption': ''})
+        article.setdefault('categories_scraped', []).append('intrus')
+
+
+@pytest.mark.parametrize('storage', BACKENDS)
+def test_returned_and_saved_articles_do_not_share_the_cache(make_manager, storage):
+    manager = make_manager(storage)
+    articles = [make_article(i, categories_scraped=['web']) for i in range(10)]
+    manager.save_articles(articles)
+    # instantané indépendant de tout ce que le stockage a pu retourner
+    expected = json.loads(json.dumps(manager.load_articles()))
+
+    # articles de l'appelant modifiés après la sauvegarde
+    mutate(articles)
+    # résultats de chaque méthode de lecture modifiés
+    mutate(manager.load_articles())
+    mutate(manager.search_articles(category='web'))
+    mutate(manager.search_articles(date_start='20240101'))
+    mutate(manager.search_articles(query='article'))
+    mutate(manager.get_latest_articles(5))
+    mutate(manager.get_articles_in_range('20240101', '20241231'))
+
+    assert manager.load_articles() == expected
+    assert not manager.search_articles(title_search='modifié')
+
+
+def recomputed_stats(articles):
+    """get_stats d'origine : tout le corpus parcouru à chaque appel"""
+    by_category = {}
+    for article in articles:
+        key = article.get('category', 'Sans catégorie')
+        by_category[key] = by_category.get(key, 0) + 1
+    return {
+        'total_articles': len(articles),
+        'categories_count': len({a['category'] for a in articles if a.get('category')}),
+        'authors_count': len({a['author'] for a in articles if a.get('author')}),
+        'articles_with_images': sum(1 for a in articles if a.get('images')),
+        'articles_with_content': sum(1 for a in articles if a.get('content')),
+        'by_category': by_category,
+    }
+
+
+@pytest.mark.parametrize('storage', BACKENDS)
+def test_materialized_stats_follow_every_save(make_manager, storage):
+    manager = make_manager(storage)
+    steps = [
+        corpus(),
+        # changement de catégorie, d'auteur, images et contenu retirés
+        [make_article(5, category='Social', author='Nouvel auteur', images=[], content='')],
+        # dernier article d'un auteur et d'une catégorie déplacé ailleurs
+        [make_article(0, category='Web', author='Auteur 0')],
+        [make_article(1, category=None), make_article(2, category='Web', author='Élodie Durand')],
+        [make_article(i) for i in range(40, 45)],
+    ]
+    for articles in steps:
+        manager.save_articles(articles)
+        assert manager.get_stats() == recomputed_stats(manager.load_articles())
+    manager.import_articles([make_article(3, category='Tech', author='')])
+    assert manager.get_stats() == recomputed_stats(manager.load_articles())
+    assert manager.verify_stats()
@@ -0,0 +1,28 @@
+import json
+import os
+
+from utils.text_cleaner import clean_text, clean_texts, extract_date, extract_dates
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def baseline(name):
+    """[(entrée, résultat de la version d'origine du module)]"""
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_clean_text_matches_original_replacements():
+    cases = baseline('clean_text_baseline.json')
+    for text, expected in cases:
+        assert clean_text(text) == expected, repr(text)
+    assert clean_texts([text for text, _ in cases]) == [expected for _, expected in cases]
+
+
+def test_extract_date_matches_original_parser():
+    cases = baseline('extract_date_baseline.json')
+    for text, expected in cases:
+        assert extract_date(text) == expected, repr(text)
+        # deuxième appel servi par le cache
+        assert extract_date(text) == expected, repr(text)
+    assert extract_dates([text for text, _ in cases] * 2) == [expected for _, expected in cases] * 2
@@ -0,0 +1,131 @@
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+
+class ArticleStats:
+    """
+    Statistiques matérialisées des articles (celles de DataManager.get_stats).
+
+    Les compteurs sont mis à jour article par article à chaque sauvegarde
+    (replace(ancien, nouveau)) au lieu d'être recalculés sur tout le corpus : lire les
+    statistiques ne coûte plus que le nombre de catégories. Les auteurs et les
+    catégories sont gardés avec leur nombre d'articles, pour savoir quand le dernier
+    article d'un auteur ou d'une catégorie disparaît.
+
+    version identifie l'état de la base pour lequel les statistiques sont valables
+    (voir DataManager._stats_token) ; None : statistiques en cours de modification.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.total = 0
+        self.with_images = 0
+        self.with_content = 0
+        # clé de répartition de get_stats ('Sans catégorie' si le champ est absent) -> nombre
+        self.by_category: Dict[Optional[str], int] = {}
+        # catégories et auteurs renseignés -> nombre d'articles
+        self.categories: Dict[str, int] = {}
+        self.authors: Dict[str, int] = {}
+
+    @classmethod
+    def compute(cls, articles: Iterable[Dict]) -> 'ArticleStats':
+        """
+        Calcule les statistiques depuis zéro
+        """
+        stats = cls()
+        for article in articles:
+            stats.replace(None, article)
+        return stats
+
+    @staticmethod
+    def _move(counter: Dict, old_key, new_key, old_counted: bool, new_counted: bool):
+        """Déplace un article d'une clé à l'autre (une clé à zéro disparaît)"""
+        if old_counted and new_counted and old_key == new_key:
+            return
+        if old_counted:
+            counter[old_key] -= 1
+            if not counter[old_key]:
+                del counter[old_key]
+        if new_counted:
+            counter[new_key] = counter.get(new_key, 0) + 1
+
+    def replace(self, old: Optional[Dict], new: Optional[Dict]):
+        """
+        Reporte le remplacement d'un article : old=None pour un ajout, new=None pour une suppression
+        """
+        exists_old, exists_new = old is not None, new is not None
+        self.total += exists_new - exists_old
+        old = old or {}
+        new = new or {}
+
+        self.with_images += bool(new.get('images')) - bool(old.get('images'))
+        self.with_content += bool(new.get('content')) - bool(old.get('content'))
+        self._move(self.by_category,
+                   old.get('category', 'Sans catégorie'), new.get('category', 'Sans catégorie'),
+                   exists_old, exists_new)
+        self._move(self.categories, old.get('category'), new.get('category'),
+                   bool(old.get('category')), bool(new.get('category')))
+        self._move(self.authors, old.get('author'), new.get('author'),
+                   bool(old.get('author')), bool(new.get('author')))
+
+    def as_dict(self) -> Dict:
+        """
+        Statistiques au format de DataManager.get_stats
+        """
+        return {
+            'total_articles': self.total,
+            'categories_count': len(self.categories),
+            'authors_count': len(self.authors),
+            'articles_with_images': self.with_images,
+            'articles_with_content': self.with_content,
+            'by_category': dict(self.by_category),
+        }
+
+    def to_json(self) -> Dict:
+        return {
+            'version': self.version,
+            'total': self.total,
+            'with_images': self.with_images,
+            'with_content': self.with_content,
+            # liste de paires : la clé peut être None (catégorie présente mais vide)
+            'by_category': [[key, count] for key, count in self.by_category.items()],
+            'categories': self.categories,
+            'authors': self.authors,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict) -> 'ArticleStats':
+        stats = cls()
+        version = data.get('version')
+        stats.version = tuple(version) if isinstance(version, list) else version
+        stats.total = data['total']
+        stats.with_images = data['with_images']
+        stats.with_content = data['with_content']
+        stats.by_category = {key: count for key, count in data['by_category']}
+        stats.categories = data['categories']
+        stats.authors = data['authors']
+        return stats
+
+    @classmethod
+    def load(cls, stats_file: str) -> Optional['ArticleStats']:
+        """
+        Relit les statistiques enregistrées (None si le fichier est absent ou illisible)
+        """
+        if not os.path.exists(stats_file):
+            return None
+        try:
+            with open(stats_file, 'r', encoding='utf-8') as f:
+                return cls.from_json(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            print("Statistiques illisibles, recalculées")
+            return None
+
+    def save(self, stats_file: str):
+        """
+        Écrit les statistiques à côté des données (remplacement atomique)
+        """
+        tmp_file = stats_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, stats_file)
@@ -1,16 +1,114 @@
 import json
 import os
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple
+
+from utils.article_stats import ArticleStats
+from utils.date_index import DateIndex
+from utils.exporters import create_exporter, export_filename, modified_at
+from utils.frontend_shards import FrontendPublisher, partition_key
+from utils.search_index import SearchIndex
+
+
+# cache du corpus partagé par le processus : chemin absolu -> ((mtime_ns, taille), articles)
+_corpus_cache: Dict[str, Tuple[Tuple[int, int], List[Dict]]] = {}
+_corpus_lock = threading.Lock()
+
+
+def _file_key(path: str) -> Optional[Tuple[int, int]]:
+    """Clé de validité du cache : date de modification et taille du fichier"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _copy_json(value):
+    """Copie d'une valeur JSON, listes et dictionnaires imbriqués compris"""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _copy_article(article: Dict) -> Dict:
+    """
+    Copie indépendante d'un article : les images, catégories et autres valeurs
+    imbriquées ne sont pas partagées avec le corpus en cache
+    """
+    return _copy_json(article)
+
+
+def _iter_json_array(path: str, chunk_size: int = 1 << 20) -> Iterator[Dict]:
+    """
+    Décode un tableau JSON élément par élément, en lisant le fichier par morceaux :
+    seul l'élément en cours de décodage est gardé en mémoire
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{path}: tableau JSON attendu")
+        position = 1
+        eof = False
+        while True:
+            # séparateurs entre deux éléments
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position < len(buffer) and buffer[position] == ']':
+                return
+            try:
+                if position == len(buffer):
+                    raise ValueError("morceau épuisé")
+                item, end = decoder.raw_decode(buffer, position)
+            except ValueError:
+                # élément coupé par la fin du morceau : lire la suite
+                if eof:
+                    raise ValueError(f"{path}: tableau JSON tronqué")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            yield item
+            position = end
 
 
 class DataManager:
-    def __init__(self, data_dir="data"):
+    """
+    Stockage des articles dans data/articles.json.
+
+    Le fichier n'est relu et décodé que s'il a changé (date de modification ou taille) :
+    le corpus est gardé en mémoire pour tout le processus et mis à jour directement
+    après chaque sauvegarde. Les méthodes de recherche et de statistiques travaillent
+    sur ce corpus partagé ; load_articles(), search_articles() et les listes par date
+    retournent des copies complètes (valeurs imbriquées comprises) que l'appelant peut
+    modifier sans altérer le cache, et les articles sauvegardés sont copiés de même.
+    """
+
+    def __init__(self, data_dir="data", frontend_dir="frontend/public"):
         self.data_dir = data_dir
         self.articles_file = os.path.join(data_dir, "articles.json")
         # Chemin pour le frontend React
-        self.frontend_dir = "frontend/public"
-        self.frontend_articles_file = os.path.join(self.frontend_dir, "articles.json")
+        self.frontend_dir = frontend_dir
+        # fichiers découpés par catégorie et par mois (index.json, listing/, content/)
+        self.frontend_data_dir = os.path.join(self.frontend_dir, "data")
+        self._frontend = FrontendPublisher(self.frontend_data_dir)
+        # index de recherche plein texte, chargé à la première recherche
+        self.search_index_file = os.path.join(data_dir, "search_index.json.gz")
+        self._search_index: Optional[SearchIndex] = None
+        self._search_index_version = None
+        # (corpus, {url: article}) pour retrouver les articles d'un résultat de recherche
+        self._by_url: Optional[Tuple[List[Dict], Dict[str, Dict]]] = None
+        # index trié des dates de publication, construit à la première requête par date
+        self._date_index: Optional[DateIndex] = None
+        self._date_index_version = None
+        # statistiques matérialisées, enregistrées à côté des données
+        self.stats_file = os.path.join(data_dir, "stats.json")
+        self._stats: Optional[ArticleStats] = None
         self._ensure_data_dir()
     
     def _ensure_data_dir(self):
@@ -26,58 +124,401 @@ class DataManager:
         """
         Sauvegarde une liste d'articles dans le fichier JSON
         """
-        # Charger les articles existants
-        existing_articles = self.load_articles()
+        # Charger les articles existants (corpus en cache, copié seulement pour les mises à jour)
+        existing_articles = self._corpus()
         
         # Créer un dictionnaire pour éviter les doublons (basé sur l'URL)
         articles_dict = {article['url']: article for article in existing_articles}
         
         # Ajouter les nouveaux articles
+        stats = self._begin_stats_update()
+        search_synced = self._search_index_synced()
         new_count = 0
+        saved = []
+        changes = []
         for article in articles:
-            if article['url'] not in articles_dict:
+            previous = articles_dict.get(article['url'])
+            if previous is None:
                 # Ajouter timestamp de sauvegarde
                 article['scraped_at'] = datetime.now().isoformat()
-                articles_dict[article['url']] = article
+                # copie : l'appelant peut continuer à modifier son article
+                articles_dict[article['url']] = _copy_article(article)
                 new_count += 1
             else:
                 # Mettre à jour l'article existant si nécessaire
-                articles_dict[article['url']].update(article)
-                articles_dict[article['url']]['updated_at'] = datetime.now().isoformat()
+                existing = dict(previous)
+                articles_dict[article['url']] = existing
+                # garder toutes les catégories où l'article a déjà été vu
+                categories = existing.get('categories_scraped', [])
+                existing.update(_copy_article(article))
+                if categories:
+                    existing['categories_scraped'] = categories + [
+                        c for c in article.get('categories_scraped', []) if c not in categories
+                    ]
+                existing['updated_at'] = datetime.now().isoformat()
+            saved.append(articles_dict[article['url']])
+            stats.replace(previous, saved[-1])
+            changes.append(self._frontend_change(previous, saved[-1]))
         
         # Convertir en liste et sauvegarder
         all_articles = list(articles_dict.values())
         
         # Sauvegarder dans le dossier data principal
-        with open(self.articles_file, 'w', encoding='utf-8') as f:
-            json.dump(all_articles, f, ensure_ascii=False, indent=2)
+        self._write_articles_file(all_articles)
+        self._store_stats(stats)
+        self._update_date_index(saved)
+        self._update_search_index(saved, search_synced)
         
-        # Sauvegarder aussi dans frontend/public pour React
-        try:
-            with open(self.frontend_articles_file, 'w', encoding='utf-8') as f:
-                json.dump(all_articles, f, ensure_ascii=False, indent=2)
-            print(f"Articles également sauvegardés pour le frontend: {self.frontend_articles_file}")
-        except Exception as e:
-            print(f"Attention: impossible de sauvegarder dans frontend/public: {e}")
+        # Sauvegarder aussi dans frontend/public pour React (partitions modifiées seulement)
+        self._publish_frontend(changes)
         
         print(f"Sauvegarde terminée. {new_count} nouveaux articles ajoutés.")
         print(f"Total d'articles dans la base: {len(all_articles)}")
         
         return len(all_articles)
     
-    def load_articles(self) -> List[Dict]:
+    def import_articles(self, articles: List[Dict]) -> int:
+        """
+        Enregistre des articles tels quels (migration entre stockages) : les dates de
+        scraping sont conservées et chaque URL remplace la version déjà stockée
         """
-        Charge tous les articles depuis le fichier JSON
+        articles_dict = {article['url']: article for article in self._corpus()}
+        stats = self._begin_stats_update()
+        search_synced = self._search_index_synced()
+        changes = []
+        for article in articles:
+            previous = articles_dict.get(article['url'])
+            stats.replace(previous, article)
+            articles_dict[article['url']] = _copy_article(article)
+            changes.append(self._frontend_change(previous, articles_dict[article['url']]))
+        all_articles = list(articles_dict.values())
+        
+        self._write_articles_file(all_articles)
+        self._store_stats(stats)
+        saved = [articles_dict[article['url']] for article in articles]
+        self._update_date_index(saved)
+        self._update_search_index(saved, search_synced)
+        self._publish_frontend(changes)
+        
+        return len(all_articles)
+    
+    def _write_articles_file(self, articles: List[Dict]):
+        """
+        Réécrit articles.json et y associe le corpus en cache (sans relecture).
+        Les articles passés ne doivent plus être modifiés ensuite.
         """
-        if not os.path.exists(self.articles_file):
+        with open(self.articles_file, 'w', encoding='utf-8') as f:
+            json.dump(articles, f, ensure_ascii=False, indent=2)
+        
+        key = _file_key(self.articles_file)
+        with _corpus_lock:
+            if key is None:
+                _corpus_cache.pop(os.path.abspath(self.articles_file), None)
+            else:
+                _corpus_cache[os.path.abspath(self.articles_file)] = (key, articles)
+    
+    def _read_articles_file(self) -> List[Dict]:
+        """
+        Contenu de articles.json, décodé une seule fois tant que le fichier ne change pas.
+        La liste retournée est partagée : elle ne doit pas être modifiée.
+        """
+        path = os.path.abspath(self.articles_file)
+        key = _file_key(path)
+        if key is None:
             return []
         
+        with _corpus_lock:
+            cached = _corpus_cache.get(path)
+            if cached and cached[0] == key:
+                return cached[1]
+            
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    articles = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                print("Erreur lors du chargement des articles existants")
+                articles = []
+            # clé lue avant le décodage : une écriture concurrente invalidera le cache
+            _corpus_cache[path] = (key, articles)
+            return articles
+    
+    def _corpus(self) -> List[Dict]:
+        """
+        Vue en lecture seule de tous les articles, utilisée par les requêtes.
+        Les backends qui gardent leurs articles autrement redéfinissent cette méthode.
+        """
+        return self._read_articles_file()
+    
+    def _iter_stored(self) -> Iterator[Dict]:
+        """
+        Parcourt les articles stockés (vues en lecture seule) sans charger tout le corpus :
+        le corpus en cache s'il est à jour, sinon articles.json décodé au fil de la lecture
+        """
+        path = os.path.abspath(self.articles_file)
+        key = _file_key(path)
+        if key is None:
+            return iter(())
+        with _corpus_lock:
+            cached = _corpus_cache.get(path)
+        if cached and cached[0] == key:
+            return iter(cached[1])
+        return _iter_json_array(path)
+    
+    def iter_articles(self, since: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Parcourt les articles dans l'ordre de première sauvegarde, un à la fois.
+        since (date ISO) : seulement les articles scrapés ou mis à jour depuis cette date.
+        Les articles retournés ne doivent pas être modifiés.
+        """
+        for article in self._iter_stored():
+            if since is None or modified_at(article) >= since:
+                yield article
+    
+    @staticmethod
+    def _frontend_change(previous: Optional[Dict], article: Dict) -> Tuple:
+        """
+        Modification à publier pour le frontend : (url, partition de l'ancienne version
+        ou None pour un nouvel article, nouvelle version)
+        """
+        return article['url'], partition_key(previous) if previous is not None else None, article
+    
+    def _publish_frontend(self, changes: Iterable[Tuple]):
+        """
+        Publie les articles modifiés pour le frontend React (voir _frontend_change) : seules
+        les partitions (catégorie, mois) qu'ils quittent ou rejoignent sont réécrites,
+        tout est republié depuis le corpus si l'index publié manque ou est périmé
+        """
         try:
-            with open(self.articles_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            print("Erreur lors du chargement des articles existants")
-            return []
+            stats = self._current_stats()
+            written, total = self._frontend.update(changes, self.iter_articles, stats.total, len(stats.authors))
+            print(f"Articles également sauvegardés pour le frontend: {self._frontend.index_file} "
+                  f"({written}/{total} partitions réécrites)")
+        except Exception as e:
+            print(f"Attention: impossible de sauvegarder dans frontend/public: {e}")
+    
+    def _articles_by_urls(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Articles (vues en lecture seule) correspondant à ces URLs
+        """
+        corpus = self._corpus()
+        if self._by_url is None or self._by_url[0] is not corpus:
+            self._by_url = (corpus, {article['url']: article for article in corpus if article.get('url')})
+        by_url = self._by_url[1]
+        return {url: by_url[url] for url in urls if url in by_url}
+    
+    def _data_version(self):
+        """
+        Jeton qui change à chaque modification des articles
+        """
+        return _file_key(self.articles_file)
+    
+    def _search_token(self):
+        """
+        Jeton de l'état des données enregistré avec l'index de recherche (valeur JSON) :
+        un index relu dont le jeton correspond n'a pas besoin d'être synchronisé
+        """
+        key = self._stats_token()
+        return list(key) if key is not None else None
+    
+    def _loaded_search_index(self) -> SearchIndex:
+        """
+        Index de recherche, lu une fois par objet ; considéré à jour si son jeton
+        correspond aux données
+        """
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.search_index_file)
+            token = self._search_index.token
+            if token is not None and token == self._search_token():
+                self._search_index_version = self._data_version()
+        return self._search_index
+    
+    def _synced_search_index(self) -> SearchIndex:
+        """
+        Index de recherche à jour. Les sauvegardes de cet objet l'alimentent directement ;
+        sync() ne sert qu'à rattraper un index absent ou périmé (écriture d'un autre
+        processus, arrêt avant son enregistrement) : seuls les articles dont la date de
+        scraping ou de mise à jour diffère sont alors réindexés.
+        """
+        index = self._loaded_search_index()
+        version = self._data_version()
+        if version != self._search_index_version:
+            changed = index.sync(self.get_scraped_timestamps(), self._articles_by_urls)
+            self._search_index_version = version
+            if changed or index.token != self._search_token():
+                self._save_search_index()
+        return index
+    
+    def _search_index_synced(self) -> bool:
+        """
+        À appeler avant d'écrire : vrai si l'index de recherche existe (en mémoire ou sur
+        disque) et correspond aux données, les articles sauvegardés y sont alors ajoutés.
+        Sans index, rien n'est fait : il sera construit à la première recherche.
+        """
+        if self._search_index is None and not os.path.exists(self.search_index_file):
+            return False
+        self._loaded_search_index()
+        return self._search_index_version == self._data_version()
+    
+    def _update_search_index(self, saved: Iterable[Dict], synced: bool):
+        """
+        Indexe les articles sauvegardés si l'index était à jour avant l'écriture
+        (synced : résultat de _search_index_synced())
+        """
+        if not synced:
+            return
+        for article in saved:
+            self._search_index.add(article, modified_at(article))
+        self._search_index_version = self._data_version()
+        self._search_index_changed()
+    
+    def _search_index_changed(self):
+        """
+        Enregistre l'index après une sauvegarde (articles.json est de toute façon réécrit
+        en entier) ; les stockages incrémentaux l'enregistrent en fin de programme
+        """
+        self._save_search_index()
+    
+    def _save_search_index(self):
+        """
+        Écrit l'index de recherche avec le jeton des données, s'il leur correspond
+        """
+        if self._search_index is None or self._search_index_version != self._data_version():
+            return
+        self._search_index.token = self._search_token()
+        self._search_index.save()
+    
+    def _ranked_articles(self, query: str) -> List[Dict]:
+        """
+        Articles contenant tous les termes de la requête, du plus pertinent au moins pertinent
+        """
+        ranked = [url for url, _ in self._synced_search_index().search(query)]
+        by_url = self._articles_by_urls(ranked)
+        return [by_url[url] for url in ranked if url in by_url]
+    
+    def _stats_token(self):
+        """
+        Jeton de l'état des données, enregistré avec les statistiques : des statistiques
+        dont le jeton ne correspond plus (écriture externe, arrêt pendant une sauvegarde)
+        sont recalculées
+        """
+        return _file_key(self.articles_file)
+    
+    def _current_stats(self) -> ArticleStats:
+        """
+        Statistiques matérialisées à jour (relues, ou recalculées si elles ne
+        correspondent plus aux données)
+        """
+        token = self._stats_token()
+        if self._stats is None or self._stats.version != token:
+            stats = ArticleStats.load(self.stats_file)
+            if stats is None or stats.version != token:
+                stats = ArticleStats.compute(self._corpus())
+                stats.version = token
+                stats.save(self.stats_file)
+            self._stats = stats
+        return self._stats
+    
+    def _begin_stats_update(self) -> ArticleStats:
+        """
+        Statistiques à modifier pendant une sauvegarde : elles ne sont plus considérées
+        à jour tant que _store_stats() n'a pas été appelé
+        """
+        stats = self._current_stats()
+        self._stats = None
+        return stats
+    
+    def _store_stats(self, stats: ArticleStats):
+        """
+        Enregistre les statistiques pour l'état actuel des données
+        """
+        stats.version = self._stats_token()
+        stats.save(self.stats_file)
+        self._stats = stats
+    
+    def verify_stats(self) -> bool:
+        """
+        Recalcule les statistiques depuis zéro et les compare aux statistiques
+        matérialisées ; en cas d'écart, les statistiques recalculées les remplacent
+        """
+        stored = self.get_stats()
+        fresh = ArticleStats.compute(self.load_articles())
+        expected = fresh.as_dict()
+        
+        differences = [key for key in expected if stored.get(key) != expected[key]]
+        for key in differences:
+            print(f"  X {key}: {stored.get(key)} enregistré, {expected[key]} recalculé")
+        if differences:
+            self._store_stats(fresh)
+        return not differences
+    
+    def _synced_date_index(self) -> DateIndex:
+        """
+        Index des dates à jour : reconstruit seulement si la base a été modifiée
+        autrement que par les sauvegardes de cet objet
+        """
+        version = self._data_version()
+        if self._date_index is None or version != self._date_index_version:
+            self._date_index = DateIndex(self._corpus())
+            self._date_index_version = version
+        return self._date_index
+    
+    def _update_date_index(self, saved: Iterable[Dict]):
+        """
+        Reporte les articles sauvegardés dans l'index des dates, s'il est construit
+        (les nouveaux articles doivent arriver dans l'ordre où ils ont été ajoutés)
+        """
+        if self._date_index is None:
+            return
+        for article in saved:
+            self._date_index.update(article)
+        self._date_index_version = self._data_version()
+    
+    def _articles_at(self, positions: List[int]) -> List[Dict]:
+        """
+        Articles (vues en lecture seule) aux positions données du corpus
+        """
+        corpus = self._corpus()
+        return [corpus[position] for position in positions]
+    
+    def get_latest_articles(self, count: int = 10, category: Optional[str] = None) -> List[Dict]:
+        """
+        Retourne les count articles publiés le plus récemment (du plus récent au plus
+        ancien), éventuellement dans les catégories contenant le texte category
+        """
+        positions = self._synced_date_index().latest(count, category)
+        return [_copy_article(article) for article in self._articles_at(positions)]
+    
+    def get_articles_in_range(self,
+                              date_start: Optional[str] = None,
+                              date_end: Optional[str] = None,
+                              category: Optional[str] = None) -> List[Dict]:
+        """
+        Retourne les articles publiés entre date_start et date_end (AAAAMMJJ, inclus),
+        par date croissante ; les articles sans date sont exclus
+        """
+        positions = self._synced_date_index().in_range(date_start, date_end, category)
+        return [_copy_article(article) for article in self._articles_at(positions)]
+    
+    def load_articles(self) -> List[Dict]:
+        """
+        Charge tous les articles depuis le fichier JSON (copies modifiables du corpus en cache)
+        """
+        return [_copy_article(article) for article in self._corpus()]
+    
+    def get_known_urls(self) -> Set[str]:
+        """
+        Retourne l'ensemble des URLs d'articles déjà enregistrés
+        """
+        return {article['url'] for article in self._corpus() if article.get('url')}
+    
+    def get_scraped_timestamps(self) -> Dict[str, str]:
+        """
+        Retourne pour chaque URL la date du dernier scraping (updated_at, sinon scraped_at)
+        """
+        return {
+            article['url']: article.get('updated_at') or article.get('scraped_at')
+            for article in self._corpus() if article.get('url')
+        }
     
     def search_articles(self, 
                        category: Optional[str] = None,
@@ -85,11 +526,20 @@ class DataManager:
                        author: Optional[str] = None,
                        date_start: Optional[str] = None,
                        date_end: Optional[str] = None,
-                       title_search: Optional[str] = None) -> List[Dict]:
+                       title_search: Optional[str] = None,
+                       query: Optional[str] = None) -> List[Dict]:
         """
-        Recherche des articles selon différents critères
+        Recherche des articles selon différents critères.
+        query : recherche plein texte (titre, résumé, contenu, auteur) via l'index
+        inversé ; les résultats sont alors classés par pertinence.
+        Les filtres de date passent par l'index trié des dates.
         """
-        articles = self.load_articles()
+        if query:
+            articles = self._ranked_articles(query)
+        elif date_start or date_end:
+            articles = self._articles_at(self._synced_date_index().search(date_start, date_end, category))
+        else:
+            articles = self._corpus()
         filtered_articles = []
         
         for article in articles:
@@ -123,7 +573,7 @@ class DataManager:
                 if title_search.lower() not in article['title'].lower():
                     continue
             
-            filtered_articles.append(article)
+            filtered_articles.append(_copy_article(article))
         
         return filtered_articles
     
@@ -131,7 +581,7 @@ class DataManager:
         """
         Retourne la liste des catégories disponibles
         """
-        articles = self.load_articles()
+        articles = self._corpus()
         categories = set()
         
         for article in articles:
@@ -144,7 +594,7 @@ class DataManager:
         """
         Retourne la liste des sous-catégories disponibles
         """
-        articles = self.load_articles()
+        articles = self._corpus()
         subcategories = set()
         
         for article in articles:
@@ -162,7 +612,7 @@ class DataManager:
         """
         Retourne la liste des auteurs disponibles
         """
-        articles = self.load_articles()
+        articles = self._corpus()
         authors = set()
         
         for article in articles:
@@ -173,69 +623,54 @@ class DataManager:
     
     def get_stats(self) -> Dict:
         """
-        Retourne des statistiques sur les articles
+        Retourne des statistiques sur les articles (matérialisées : mises à jour à
+        chaque sauvegarde, sans parcourir le corpus)
         """
-        articles = self.load_articles()
-        
-        stats = {
-            'total_articles': len(articles),
-            'categories_count': len(self.get_categories()),
-            'authors_count': len(self.get_authors()),
-            'articles_with_images': sum(1 for a in articles if a.get('images')),
-            'articles_with_content': sum(1 for a in articles if a.get('content')),
-        }
-        
-        # Statistiques par catégorie
-        category_stats = {}
-        for article in articles:
-            cat = article.get('category', 'Sans catégorie')
-            category_stats[cat] = category_stats.get(cat, 0) + 1
-        
-        stats['by_category'] = category_stats
-        
-        return stats
+        return self._current_stats().as_dict()
     
-    def export_to_csv(self, filename: Optional[str] = None):
+    def export_articles(self, fmt: str = 'csv', filename: Optional[str] = None,
+                        since: Optional[str] = None) -> int:
         """
-        Exporte les articles vers un fichier CSV
+        Exporte les articles au format csv, jsonl ou parquet en flux (sans charger le corpus).
+        since (date ISO) : export incrémental des articles scrapés ou mis à jour depuis cette date.
         """
-        import csv
-        
+        exporter = create_exporter(fmt)
         if not filename:
-            filename = os.path.join(self.data_dir, "articles_export.csv")
-        
-        articles = self.load_articles()
+            filename = export_filename(self.data_dir, exporter, since)
         
-        if not articles:
-            print("Aucun article à exporter")
-            return
-        
-        # Définir les colonnes
-        columns = [
-            'url', 'title', 'category', 'subcategory', 'author', 
-            'publication_date', 'summary', 'content', 'thumbnail',
-            'images_count', 'scraped_at'
-        ]
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            
-            for article in articles:
-                row = {
-                    'url': article.get('url', ''),
-                    'title': article.get('title', ''),
-                    'category': article.get('category', ''),
-                    'subcategory': article.get('subcategory', ''),
-                    'author': article.get('author', ''),
-                    'publication_date': article.get('publication_date', ''),
-                    'summary': article.get('summary', ''),
-                    'content': article.get('content', ''),
-                    'thumbnail': article.get('thumbnail', ''),
-                    'images_count': len(article.get('images', [])),
-                    'scraped_at': article.get('scraped_at', '')
-                }
-                writer.writerow(row)
+        # borne du prochain export incrémental, prise avant la lecture des articles
+        started = datetime.now().isoformat()
+        count = exporter.write(self.iter_articles(since), filename)
         
         print(f"Export terminé: {filename}")
-        print(f"{len(articles)} articles exportés")
+        print(f"{count} articles exportés")
+        print(f"Prochain export incrémental: --since={started}")
+        return count
+    
+    def export_to_csv(self, filename: Optional[str] = None):
+        """
+        Exporte les articles vers un fichier CSV
+        """
+        return self.export_articles('csv', filename)
+
+
+# backends de stockage disponibles pour create_data_manager
+STORAGE_BACKENDS = ('json', 'jsonl', 'sqlite')
+
+
+def create_data_manager(storage: str = 'json', data_dir: str = "data",
+                        frontend_dir: str = "frontend/public") -> DataManager:
+    """
+    Crée le gestionnaire de données du backend de stockage demandé :
+    'json' (articles.json réécrit à chaque sauvegarde), 'jsonl' (journal en ajout seul)
+    ou 'sqlite' (base SQLite indexée)
+    """
+    if storage == 'json':
+        return DataManager(data_dir, frontend_dir)
+    if storage == 'jsonl':
+        from utils.jsonl_store import JsonlDataManager
+        return JsonlDataManager(data_dir, frontend_dir)
+    if storage == 'sqlite':
+        from utils.sqlite_store import SqliteDataManager
+        return SqliteDataManager(data_dir, frontend_dir)
+    raise ValueError(f"Stockage inconnu: {storage} (disponibles: {', '.join(STORAGE_BACKENDS)})")
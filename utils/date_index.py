@@ -0,0 +1,129 @@
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# borne haute d'une clé (date, position) : toutes les positions d'une même date
+_LAST = float('inf')
+
+
+class DateIndex:
+    """
+    Index trié des dates de publication, partitionné par catégorie.
+
+    Chaque partition garde les couples (date, position dans le corpus) triés : une
+    plage de dates se trouve par dichotomie (bisect) en O(log n + k) et les N plus
+    récents sont les N derniers éléments, sans trier le corpus. Les articles sans date
+    sont gardés à part (search() les laisse passer, comme les filtres de
+    DataManager.search_articles).
+
+    update() maintient l'index après une sauvegarde : un nouvel article prend la
+    position suivante, un article existant garde la sienne.
+    """
+
+    def __init__(self, articles: Iterable[Dict] = ()):
+        # catégorie (None : sans catégorie) -> [(date, position)] triés
+        self._dated: Dict[Optional[str], List[Tuple[str, int]]] = {}
+        # catégorie -> positions triées des articles sans date
+        self._undated: Dict[Optional[str], List[int]] = {}
+        # url -> (position, date, catégorie) indexées
+        self._keys: Dict[str, Tuple[int, Optional[str], Optional[str]]] = {}
+        self._next = 0
+
+        for position, article in enumerate(articles):
+            self._next = position + 1
+            if article.get('url'):
+                date, category = self._key(article)
+                self._keys[article['url']] = (position, date, category)
+                if date:
+                    self._dated.setdefault(category, []).append((date, position))
+                else:
+                    self._undated.setdefault(category, []).append(position)
+        for entries in self._dated.values():
+            entries.sort()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _key(article: Dict) -> Tuple[Optional[str], Optional[str]]:
+        return article.get('publication_date') or None, article.get('category') or None
+
+    def update(self, article: Dict):
+        """
+        Indexe un article sauvegardé (nouveau, ou mis à jour à sa position actuelle)
+        """
+        url = article['url']
+        date, category = self._key(article)
+        known = self._keys.get(url)
+        if known is None:
+            position = self._next
+            self._next += 1
+        else:
+            position, old_date, old_category = known
+            if (old_date, old_category) == (date, category):
+                return
+            self._discard(position, old_date, old_category)
+
+        self._keys[url] = (position, date, category)
+        if date:
+            insort(self._dated.setdefault(category, []), (date, position))
+        else:
+            insort(self._undated.setdefault(category, []), position)
+
+    def _discard(self, position: int, date: Optional[str], category: Optional[str]):
+        if date:
+            entries = self._dated[category]
+            del entries[bisect_left(entries, (date, position))]
+        else:
+            positions = self._undated[category]
+            del positions[bisect_left(positions, position)]
+
+    def _partitions(self, category: Optional[str], uncategorized: bool) -> List[Optional[str]]:
+        """Catégories contenant le texte demandé (sans casse), comme search_articles"""
+        keys = set(self._dated) | set(self._undated)
+        if not category:
+            return list(keys)
+        needle = category.lower()
+        return [key for key in keys
+                if (key is None and uncategorized) or (key is not None and needle in key.lower())]
+
+    @staticmethod
+    def _slice(entries: List[Tuple[str, int]], start: Optional[str], end: Optional[str]) -> List[Tuple[str, int]]:
+        low = bisect_left(entries, (start,)) if start else 0
+        high = bisect_right(entries, (end, _LAST)) if end else len(entries)
+        return entries[low:high]
+
+    def search(self, start: Optional[str] = None, end: Optional[str] = None,
+               category: Optional[str] = None) -> List[int]:
+        """
+        Positions (ordre du corpus) des articles retenus par les filtres date_start,
+        date_end et category de search_articles : les articles sans date ou sans
+        catégorie ne sont pas filtrés
+        """
+        positions = []
+        for key in self._partitions(category, uncategorized=True):
+            positions.extend(position for _, position in self._slice(self._dated.get(key, []), start, end))
+            positions.extend(self._undated.get(key, ()))
+        positions.sort()
+        return positions
+
+    def in_range(self, start: Optional[str] = None, end: Optional[str] = None,
+                 category: Optional[str] = None) -> List[int]:
+        """
+        Positions des articles datés entre start et end (inclus), par date croissante
+        """
+        slices = [self._slice(self._dated.get(key, []), start, end)
+                  for key in self._partitions(category, uncategorized=False)]
+        return [position for _, position in heapq.merge(*slices)]
+
+    def latest(self, count: int, category: Optional[str] = None) -> List[int]:
+        """
+        Positions des count articles les plus récents, du plus récent au plus ancien
+        """
+        if count <= 0:
+            return []
+        tails = [reversed(self._dated.get(key, [])[-count:])
+                 for key in self._partitions(category, uncategorized=False)]
+        return [position for _, position in islice(heapq.merge(*tails, reverse=True), count)]
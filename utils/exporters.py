@@ -0,0 +1,203 @@
+import csv
+import gzip
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+
+# colonnes des exports tabulaires (CSV et colonnaire)
+EXPORT_COLUMNS = [
+    'url', 'title', 'category', 'subcategory', 'author',
+    'publication_date', 'summary', 'content', 'thumbnail',
+    'images_count', 'scraped_at', 'updated_at'
+]
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet')
+
+# lignes par groupe de l'export colonnaire (mémoire bornée pendant l'export)
+BATCH_ROWS = 2000
+
+
+def _has_pyarrow() -> bool:
+    """Le format Parquet n'est écrit que si pyarrow est installé"""
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def modified_at(article: Dict) -> str:
+    """
+    Date de la dernière écriture de l'article (updated_at, sinon scraped_at)
+    """
+    return article.get('updated_at') or article.get('scraped_at') or ''
+
+
+def parse_since(value: str) -> str:
+    """
+    Valide la borne --since (date ou date et heure ISO) et la retourne au format
+    des champs scraped_at / updated_at, pour une comparaison de chaînes
+    """
+    try:
+        return datetime.fromisoformat(str(value)).isoformat()
+    except ValueError:
+        raise ValueError(f"Date invalide pour --since: {value} (attendu: AAAA-MM-JJ ou AAAA-MM-JJTHH:MM:SS)")
+
+
+def export_row(article: Dict) -> Dict:
+    """
+    Ligne d'export tabulaire d'un article (valeurs vides pour les champs absents)
+    """
+    row = {column: article.get(column) or '' for column in EXPORT_COLUMNS}
+    row['images_count'] = len(article.get('images') or [])
+    return row
+
+
+class Exporter:
+    """
+    Écrit un flux d'articles dans un fichier, article par article : seule une ligne
+    (ou un groupe de lignes pour le format colonnaire) est gardée en mémoire.
+
+    Le fichier est écrit à côté puis remplacé d'un coup (os.replace) : un export
+    interrompu ne laisse pas de fichier tronqué à la place du précédent.
+    """
+
+    extension = ''
+
+    def write(self, articles: Iterable[Dict], filename: str) -> int:
+        """
+        Exporte les articles et retourne le nombre de lignes écrites
+        """
+        tmp_file = filename + ".tmp"
+        try:
+            count = self._write(articles, tmp_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        os.replace(tmp_file, filename)
+        return count
+
+    def _write(self, articles: Iterable[Dict], path: str) -> int:
+        raise NotImplementedError
+
+
+class CsvExporter(Exporter):
+    extension = '.csv'
+
+    def _write(self, articles: Iterable[Dict], path: str) -> int:
+        count = 0
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_COLUMNS)
+            writer.writeheader()
+            for article in articles:
+                writer.writerow(export_row(article))
+                count += 1
+        return count
+
+
+class JsonlExporter(Exporter):
+    """Articles complets (tous les champs), un objet JSON par ligne"""
+
+    extension = '.jsonl'
+
+    def _write(self, articles: Iterable[Dict], path: str) -> int:
+        count = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            for article in articles:
+                f.write(json.dumps(article, ensure_ascii=False))
+                f.write("\n")
+                count += 1
+        return count
+
+
+def _batches(articles: Iterable[Dict], size: int = BATCH_ROWS) -> Iterable[Dict[str, List]]:
+    """Regroupe les lignes d'export par colonnes, size lignes à la fois"""
+    columns = {column: [] for column in EXPORT_COLUMNS}
+    rows = 0
+    for article in articles:
+        for column, value in export_row(article).items():
+            columns[column].append(value)
+        rows += 1
+        if rows == size:
+            yield columns
+            columns = {column: [] for column in EXPORT_COLUMNS}
+            rows = 0
+    if rows:
+        yield columns
+
+
+class ParquetExporter(Exporter):
+    """Fichier Parquet (pyarrow), un groupe de lignes par lot de BATCH_ROWS articles"""
+
+    extension = '.parquet'
+
+    def _write(self, articles: Iterable[Dict], path: str) -> int:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([
+            (column, pa.int32() if column == 'images_count' else pa.string())
+            for column in EXPORT_COLUMNS
+        ])
+        count = 0
+        with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+            for batch in _batches(articles):
+                writer.write_batch(pa.RecordBatch.from_pydict(batch, schema=schema))
+                count += len(batch['url'])
+            if not count:
+                # fichier valide (schéma seul) même sans article
+                writer.write_table(schema.empty_table())
+        return count
+
+
+class ColumnarExporter(Exporter):
+    """
+    Repli colonnaire sans dépendance : fichier gzip dont chaque ligne est un groupe
+    de BATCH_ROWS articles au format {"rows": n, "columns": {colonne: [valeurs]}}.
+    Les valeurs d'une même colonne se suivent et se compressent bien ; un lecteur
+    peut ne décoder que les colonnes qui l'intéressent, groupe par groupe.
+    """
+
+    extension = '.columns.jsonl.gz'
+
+    def _write(self, articles: Iterable[Dict], path: str) -> int:
+        count = 0
+        with gzip.open(path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            for batch in _batches(articles):
+                rows = len(batch['url'])
+                f.write(json.dumps({'rows': rows, 'columns': batch}, ensure_ascii=False, separators=(',', ':')))
+                f.write("\n")
+                count += rows
+        return count
+
+
+def create_exporter(fmt: str = 'csv') -> Exporter:
+    """
+    Exporteur du format demandé : 'csv', 'jsonl' ou 'parquet'
+    (repli colonnaire compressé si pyarrow n'est pas installé)
+    """
+    if fmt == 'csv':
+        return CsvExporter()
+    if fmt == 'jsonl':
+        return JsonlExporter()
+    if fmt == 'parquet':
+        if _has_pyarrow():
+            return ParquetExporter()
+        print("pyarrow non installé: export colonnaire de repli (gzip)")
+        return ColumnarExporter()
+    raise ValueError(f"Format d'export inconnu: {fmt} (disponibles: {', '.join(EXPORT_FORMATS)})")
+
+
+def export_filename(data_dir: str, exporter: Exporter, since: Optional[str] = None) -> str:
+    """
+    Nom de fichier par défaut : data/articles_export.csv, ou
+    data/articles_delta_<date>.jsonl pour un export incrémental
+    """
+    if since:
+        stamp = since.replace('-', '').replace(':', '').split('.')[0]
+        return os.path.join(data_dir, f"articles_delta_{stamp}{exporter.extension}")
+    return os.path.join(data_dir, f"articles_export{exporter.extension}")
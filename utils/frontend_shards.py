@@ -0,0 +1,263 @@
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.exporters import modified_at
+from utils.search_index import fold
+
+
+# champs des cartes de la liste d'articles (le contenu complet est dans les fichiers content/)
+CARD_FIELDS = ('url', 'title', 'author', 'publication_date', 'category', 'subcategory',
+               'category_scraped', 'thumbnail')
+# longueur du résumé gardé sur une carte (la carte en affiche 120 caractères)
+SUMMARY_LENGTH = 200
+
+_SLUG_RE = re.compile(r'[^0-9a-z_-]+')
+
+
+def card(article: Dict) -> Dict:
+    """
+    Champs d'un article nécessaires à sa carte dans la liste
+    """
+    entry = {field: article[field] for field in CARD_FIELDS if article.get(field) is not None}
+    summary = article.get('summary') or article.get('content') or ''
+    if len(summary) > SUMMARY_LENGTH:
+        summary = summary[:SUMMARY_LENGTH].rstrip() + '…'
+    entry['summary'] = summary
+    entry['images_count'] = len(article.get('images') or [])
+    return entry
+
+
+def partition_key(article: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Partition d'un article : (catégorie scrapée, mois de publication AAAA-MM), None si absent
+    """
+    date = article.get('publication_date') or ''
+    month = f"{date[:4]}-{date[4:6]}" if len(date) == 8 and date.isdigit() else None
+    return article.get('category_scraped') or None, month
+
+
+def _slug(value: Optional[str], default: str) -> str:
+    return _SLUG_RE.sub('-', fold(value or '')).strip('-') or default
+
+
+class FrontendPublisher:
+    """
+    Fichiers de données du frontend React, découpés par catégorie et par mois
+    (frontend/public/data) au lieu d'un articles.json complet :
+
+    - index.json : liste des partitions (catégorie, mois, nombre d'articles, fichiers)
+      et statistiques globales. C'est le seul fichier lu au premier affichage.
+    - listing/<catégorie>/<mois>.<signature>.json : cartes des articles de la partition
+      (champs de CARD_FIELDS, résumé tronqué, nombre d'images), chargées page par page.
+    - content/<catégorie>/<mois>.<signature>.json : articles complets par URL, chargés
+      à l'ouverture d'un article.
+
+    Après une sauvegarde, update() ne relit et ne réécrit que les partitions des articles
+    modifiés (leur ancienne et leur nouvelle partition), depuis leur fichier content/ :
+    le reste du corpus n'est ni regroupé ni haché. publish() reconstruit tout depuis
+    le corpus complet, quand l'index publié manque ou ne correspond plus à la base.
+
+    Chaque partition a une signature (URLs et dates de mise à jour de ses articles),
+    qui fait partie du nom des fichiers : une partition modifiée change d'URL (pas de
+    contenu périmé en cache navigateur), et les anciens fichiers sont supprimés une
+    fois le nouvel index en place. publish() garde les fichiers des partitions dont
+    la signature n'a pas changé.
+    """
+
+    VERSION = 2
+    INDEX_FILE = "index.json"
+
+    def __init__(self, data_dir: str = "frontend/public/data"):
+        self.data_dir = data_dir
+        self.index_file = os.path.join(data_dir, self.INDEX_FILE)
+
+    def _read_index(self) -> Optional[Dict]:
+        """Index déjà publié (None s'il est absent, illisible ou d'une autre version)"""
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return index if index.get('version') == self.VERSION else None
+
+    def _previous_partitions(self) -> Dict[str, Dict]:
+        """Partitions de l'index déjà publié, par signature"""
+        index = self._read_index() or {}
+        return {partition['signature']: partition for partition in index.get('partitions', [])}
+
+    @staticmethod
+    def _signature(articles: List[Dict]) -> str:
+        digest = hashlib.sha1()
+        for article in articles:
+            digest.update(f"{article.get('url')}\t{modified_at(article)}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _write_json(self, relative_path: str, data):
+        path = os.path.join(self.data_dir, relative_path)
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp_file = path + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_file, path)
+
+    def _remove_unused(self, used: set):
+        """Supprime les fichiers de partitions qui ne sont plus référencés par l'index"""
+        for folder in ('listing', 'content'):
+            root = os.path.join(self.data_dir, folder)
+            for directory, _, files in os.walk(root, topdown=False):
+                for name in files:
+                    path = os.path.join(directory, name)
+                    if os.path.relpath(path, self.data_dir).replace(os.sep, '/') not in used:
+                        os.remove(path)
+                if directory != root and not os.listdir(directory):
+                    os.rmdir(directory)
+
+    def _entry(self, key: Tuple[Optional[str], Optional[str]], members: List[Dict],
+               previous: Dict[str, Dict]) -> Tuple[Dict, bool]:
+        """
+        Entrée d'index d'une partition, ses fichiers écrits si sa signature est nouvelle.
+        Retourne (entrée, fichiers réécrits).
+        """
+        category, month = key
+        signature = self._signature(members)
+        entry = previous.get(signature)
+        if entry is not None and all(os.path.exists(os.path.join(self.data_dir, entry[name]))
+                                     for name in ('listing', 'content')):
+            return entry, False
+
+        name = f"{_slug(category, '_')}/{month or 'sans-date'}.{signature[:12]}.json"
+        entry = {
+            'category': category,
+            'month': month,
+            'count': len(members),
+            'with_images': sum(1 for article in members if article.get('images')),
+            'signature': signature,
+            'listing': f"listing/{name}",
+            'content': f"content/{name}",
+        }
+        self._write_json(entry['listing'], [card(article) for article in members])
+        self._write_json(entry['content'], {article['url']: article for article in members})
+        return entry, True
+
+    def _write_index(self, entries: List[Dict], authors: int):
+        """
+        Écrit index.json : partitions (mois les plus récents d'abord, les articles sans
+        date à la fin, puis par catégorie) et statistiques, qui se déduisent des
+        partitions sauf le nombre d'auteurs
+        """
+        entries = sorted(entries, key=lambda entry: entry['category'] or '')
+        entries.sort(key=lambda entry: entry['month'] or '', reverse=True)
+        by_category: Dict[str, int] = {}
+        for entry in entries:
+            if entry['category']:
+                by_category[entry['category']] = by_category.get(entry['category'], 0) + entry['count']
+
+        self._write_json(self.INDEX_FILE, {
+            'version': self.VERSION,
+            'generated_at': datetime.now().isoformat(),
+            'stats': {
+                'total': sum(entry['count'] for entry in entries),
+                'by_category': dict(sorted(by_category.items())),
+                'authors': authors,
+                'with_images': sum(entry['with_images'] for entry in entries),
+            },
+            'partitions': entries,
+        })
+        self._remove_unused({entry[name] for entry in entries for name in ('listing', 'content')})
+
+    def publish(self, articles: Iterable[Dict]) -> Tuple[int, int]:
+        """
+        Publie tous les articles pour le frontend (reconstruction complète).
+        Retourne (partitions réécrites, nombre total de partitions).
+        """
+        partitions: Dict[Tuple[Optional[str], Optional[str]], List[Dict]] = {}
+        authors = set()
+        for article in articles:
+            if not article.get('url'):
+                continue
+            partitions.setdefault(partition_key(article), []).append(article)
+            if article.get('author'):
+                authors.add(article['author'])
+
+        previous = self._previous_partitions()
+        entries = []
+        written = 0
+        for key, members in partitions.items():
+            entry, rewritten = self._entry(key, members, previous)
+            entries.append(entry)
+            written += rewritten
+
+        self._write_index(entries, len(authors))
+        return written, len(entries)
+
+    def update(self, changes: Iterable[Tuple[str, Optional[Tuple[Optional[str], Optional[str]]], Optional[Dict]]],
+               corpus: Callable[[], Iterable[Dict]], total: int, authors: int) -> Tuple[int, int]:
+        """
+        Publie les articles modifiés depuis la dernière publication. changes : triplets
+        (url, partition de la version déjà publiée ou None si l'article est nouveau,
+        version actuelle ou None si l'article a été supprimé). total et authors : nombre
+        d'articles et d'auteurs de la base (statistiques matérialisées).
+
+        Seules les partitions touchées sont relues (fichier content/) et réécrites.
+        Reconstruction complète depuis corpus() si l'index publié manque, si le fichier
+        d'une partition touchée a disparu, ou si le nombre d'articles publiés ne
+        correspond plus à la base (modifications d'un processus interrompu avant
+        publication). Retourne (partitions réécrites, nombre total de partitions).
+        """
+        index = self._read_index()
+        if index is None:
+            return self.publish(corpus())
+
+        # une URL modifiée plusieurs fois : partition publiée d'origine, dernière version
+        pending: Dict[str, list] = {}
+        for url, previous_key, article in changes:
+            if url in pending:
+                pending[url][1] = article
+            elif url:
+                pending[url] = [previous_key, article]
+
+        # par partition : URLs retirées et articles ajoutés ou remplacés
+        removed: Dict[Tuple[Optional[str], Optional[str]], set] = {}
+        added: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Dict]] = {}
+        for url, (previous_key, article) in pending.items():
+            if previous_key is not None:
+                removed.setdefault(tuple(previous_key), set()).add(url)
+            if article is not None:
+                added.setdefault(partition_key(article), {})[url] = article
+
+        partitions = {(entry['category'], entry['month']): entry for entry in index['partitions']}
+        written = 0
+        for key in set(removed) | set(added):
+            entry = partitions.get(key)
+            members: Dict[str, Dict] = {}
+            if entry is not None:
+                try:
+                    with open(os.path.join(self.data_dir, entry['content']), 'r', encoding='utf-8') as f:
+                        members = json.load(f)
+                except (OSError, ValueError):
+                    return self.publish(corpus())
+
+            for url in removed.get(key, ()):
+                if url not in added.get(key, {}):
+                    members.pop(url, None)
+            # un article déjà présent garde sa place dans la partition
+            members.update(added.get(key, {}))
+
+            if members:
+                partitions[key], rewritten = self._entry(key, list(members.values()), {})
+                written += rewritten
+            else:
+                partitions.pop(key, None)
+
+        entries = list(partitions.values())
+        if sum(entry['count'] for entry in entries) != total:
+            return self.publish(corpus())
+
+        self._write_index(entries, authors)
+        return written, len(entries)
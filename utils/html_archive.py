@@ -0,0 +1,134 @@
+import gzip
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional
+
+
+class HtmlArchive:
+    """
+    Archive compressée, en ajout seul, des pages téléchargées.
+
+    Format inspiré de WARC : chaque page est un enregistrement "resource"
+    (en-têtes WARC + corps) compressé en un membre gzip indépendant, ajouté à la
+    fin du segment courant. L'index (index.jsonl) donne pour chaque enregistrement
+    son segment, son offset et sa longueur : une page se relit avec un seul seek,
+    sans décompresser le reste du segment.
+    """
+
+    INDEX_FILE = "index.jsonl"
+
+    def __init__(self, archive_dir: str = "data/archive", max_segment_mb: float = 100):
+        self.archive_dir = archive_dir
+        self.index_file = os.path.join(archive_dir, self.INDEX_FILE)
+        self.max_segment_size = int(max_segment_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._segment = None
+        self._ensure_archive_dir()
+
+    def _ensure_archive_dir(self):
+        """Crée le dossier de l'archive s'il n'existe pas"""
+        if not os.path.exists(self.archive_dir):
+            os.makedirs(self.archive_dir)
+
+    def _segment_path(self, segment: str) -> str:
+        return os.path.join(self.archive_dir, segment)
+
+    def _current_segment(self, incoming: int) -> str:
+        """Retourne le segment où écrire, en ouvrant un nouveau segment si le courant est plein"""
+        if self._segment is None:
+            segments = sorted(f for f in os.listdir(self.archive_dir) if f.startswith('segment-'))
+            self._segment = segments[-1] if segments else 'segment-00001.warc.gz'
+
+        path = self._segment_path(self._segment)
+        if os.path.exists(path) and os.path.getsize(path) + incoming > self.max_segment_size:
+            number = int(self._segment.split('-')[1].split('.')[0]) + 1
+            self._segment = f"segment-{number:05d}.warc.gz"
+        return self._segment
+
+    def append(self, url: str, body: bytes, content_type: Optional[str] = None,
+               encoding: Optional[str] = None) -> Dict:
+        """
+        Ajoute une page à l'archive et retourne son entrée d'index
+        """
+        date = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        header = (
+            "WARC/1.0\r\n"
+            "WARC-Type: resource\r\n"
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Date: {date}\r\n"
+            f"Content-Type: {content_type or 'text/html'}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode('utf-8')
+        record = gzip.compress(header + body + b"\r\n\r\n")
+
+        with self._lock:
+            segment = self._current_segment(len(record))
+            with open(self._segment_path(segment), 'ab') as f:
+                offset = f.tell()
+                f.write(record)
+
+            entry = {
+                'url': url,
+                'segment': segment,
+                'offset': offset,
+                'length': len(record),
+                'date': date,
+                'encoding': encoding
+            }
+            with open(self.index_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        return entry
+
+    def read(self, entry: Dict) -> bytes:
+        """
+        Relit le corps d'une page archivée à partir de son entrée d'index
+        """
+        with open(self._segment_path(entry['segment']), 'rb') as f:
+            f.seek(entry['offset'])
+            record = gzip.decompress(f.read(entry['length']))
+
+        header, _, rest = record.partition(b"\r\n\r\n")
+        length = None
+        for line in header.split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value.strip())
+        return rest[:length] if length is not None else rest
+
+    def read_html(self, entry: Dict) -> str:
+        """
+        Relit une page archivée sous forme de texte
+        """
+        return self.read(entry).decode(entry.get('encoding') or 'utf-8', errors='replace')
+
+    def iter_entries(self) -> Iterator[Dict]:
+        """
+        Parcourt toutes les entrées de l'index dans l'ordre d'ajout
+        """
+        if not os.path.exists(self.index_file):
+            return
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # dernière ligne tronquée (arrêt brutal pendant l'écriture)
+                    continue
+
+    def latest_entries(self) -> Dict[str, Dict]:
+        """
+        Retourne la version la plus récente archivée de chaque URL
+        """
+        latest = {}
+        for entry in self.iter_entries():
+            latest[entry['url']] = entry
+        return latest
@@ -0,0 +1,127 @@
+import re
+from functools import lru_cache
+from bs4 import BeautifulSoup
+
+
+# backends de parsing HTML (nom -> tree builder BeautifulSoup)
+PARSER_BACKENDS = {
+    'html.parser': 'html.parser',   # pur Python, toujours disponible, le plus lent
+    'lxml': 'lxml',                 # parser C de lxml, bien plus rapide (expérimental)
+}
+
+# backend de référence : lxml répare autrement le HTML mal formé (<div> dans un <p>,
+# <li> non fermés) et peut donner des champs différents (tests/test_html_parser.py) ;
+# il reste expérimental, check-parser échoue sur l'archive au moindre champ différent
+DEFAULT_BACKEND = 'html.parser'
+
+_default_backend = DEFAULT_BACKEND
+
+_HEAD_RE = re.compile(r'<head(?=[\s>]).*?</head\s*>', re.I | re.S)
+
+
+def is_backend_available(name):
+    """
+    Vérifie qu'un backend est connu et que sa dépendance est installée
+    """
+    if name not in PARSER_BACKENDS:
+        return False
+    if name == 'lxml':
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            return False
+    return True
+
+
+def set_default_backend(name):
+    """
+    Change le backend utilisé quand aucun n'est précisé
+    """
+    global _default_backend
+    if not is_backend_available(name):
+        raise ValueError(f"Backend de parsing indisponible: {name} (disponibles: {available_backends()})")
+    _default_backend = name
+
+
+def get_default_backend():
+    return _default_backend
+
+
+def available_backends():
+    return [name for name in PARSER_BACKENDS if is_backend_available(name)]
+
+
+def parse_html(markup, backend=None, parse_only=None):
+    """
+    Construit l'arbre BeautifulSoup d'une page avec le backend demandé
+    (ou le backend par défaut). parse_only accepte un SoupStrainer.
+    """
+    name = backend or _default_backend
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Backend de parsing inconnu: {name} (disponibles: {available_backends()})")
+    return BeautifulSoup(markup, PARSER_BACKENDS[name], parse_only=parse_only)
+
+
+@lru_cache(maxsize=None)
+def _region_tokens(name):
+    # commentaires et scripts sont consommés d'un bloc : un "<article>" dans une
+    # chaîne JavaScript ne doit pas être pris pour une balise
+    return re.compile(
+        rf'<!--.*?-->|<script\b.*?</script\s*>|<(/?){name}(?=[\s/>])[^>]*>',
+        re.I | re.S
+    )
+
+
+def find_region(markup, name):
+    """
+    Pré-lecture du HTML brut : position du premier élément <name> (éléments imbriqués
+    du même nom compris) et du <head> qui le précède, sans construire d'arbre.
+    Retourne (head, élément), chacun un couple (début, fin) et head à None si absent,
+    ou None si l'élément est absent ou non fermé.
+    """
+    start = None
+    depth = 0
+    for match in _region_tokens(name).finditer(markup):
+        closing = match.group(1)
+        if closing is None:
+            continue
+        if not closing:
+            if start is None:
+                start = match.start()
+            depth += 1
+        elif start is not None:
+            depth -= 1
+            if depth == 0:
+                head = _HEAD_RE.search(markup, 0, start)
+                return (head.span() if head else None), (start, match.end())
+    return None
+
+
+def region_document(markup, bounds):
+    """
+    Document réduit au <head> et à l'élément trouvés par find_region, à parser
+    """
+    head, (start, end) = bounds
+    return (
+        "<html>" + (markup[head[0]:head[1]] if head else "")
+        + "<body>" + markup[start:end] + "</body></html>"
+    )
+
+
+def outside_region(markup, bounds):
+    """
+    HTML brut hors du document réduit : (avant l'élément, après l'élément),
+    le <head> étant retiré de la partie avant
+    """
+    head, (start, end) = bounds
+    before = markup[:head[0]] + markup[head[1]:start] if head else markup[:start]
+    return before, markup[end:]
+
+
+def extract_region(markup, name):
+    """
+    Découpe le premier élément <name> et le <head> qui le précède (find_region).
+    Retourne un document réduit à parser, ou None si l'élément est absent ou non fermé.
+    """
+    bounds = find_region(markup, name)
+    return region_document(markup, bounds) if bounds else None
@@ -0,0 +1,178 @@
+import atexit
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+import requests
+
+
+class HttpCache:
+    """
+    Cache HTTP persistant sur disque, indexé par URL.
+
+    Seules les réponses portant un validateur (ETag ou Last-Modified) sont gardées :
+    elles permettent une requête conditionnelle et, sur un 304, le corps en cache est
+    rendu aux parsers. Les corps sont compressés et la taille totale est bornée
+    (éviction LRU).
+    """
+
+    INDEX_FILE = "index.json"
+    # nombre de modifications avant réécriture de l'index
+    FLUSH_EVERY = 20
+
+    def __init__(self, cache_dir: str = "data/http_cache", max_size_mb: float = 500):
+        self.cache_dir = cache_dir
+        self.bodies_dir = os.path.join(cache_dir, "bodies")
+        self.index_file = os.path.join(cache_dir, self.INDEX_FILE)
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self._ensure_cache_dir()
+        # url -> métadonnées, de la moins récemment utilisée à la plus récente
+        self._entries: "OrderedDict[str, Dict]" = self._load_index()
+        self._total_size = sum(entry['size'] for entry in self._entries.values())
+        atexit.register(self.flush)
+
+    def _ensure_cache_dir(self):
+        """Crée le dossier du cache s'il n'existe pas"""
+        if not os.path.exists(self.bodies_dir):
+            os.makedirs(self.bodies_dir)
+
+    def _load_index(self) -> "OrderedDict[str, Dict]":
+        if not os.path.exists(self.index_file):
+            return OrderedDict()
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return OrderedDict(json.load(f))
+        except (json.JSONDecodeError, OSError, TypeError, ValueError):
+            print("Index du cache HTTP illisible, cache réinitialisé")
+            return OrderedDict()
+
+    def _body_path(self, url: str) -> str:
+        return os.path.join(self.bodies_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Retourne les en-têtes If-None-Match / If-Modified-Since pour l'URL si elle est en cache
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if not entry:
+                return {}
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            return headers
+
+    def store(self, url: str, response: requests.Response):
+        """
+        Met en cache une réponse 200 si elle porte un validateur
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+
+        data = zlib.compress(response.content)
+        with open(self._body_path(url), 'wb') as f:
+            f.write(data)
+
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old:
+                self._total_size -= old['size']
+            self._entries[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'content_type': response.headers.get('Content-Type'),
+                'encoding': response.encoding,
+                'size': len(data),
+                'stored_at': datetime.now().isoformat()
+            }
+            self._total_size += len(data)
+            self._evict()
+            self._mark_dirty()
+
+    def cached_response(self, url: str, not_modified: requests.Response) -> Optional[requests.Response]:
+        """
+        Construit une réponse 200 à partir du cache suite à un 304 (None si le corps est introuvable)
+        """
+        try:
+            with open(self._body_path(url), 'rb') as f:
+                content = zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            self.invalidate(url)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            # l'entrée devient la plus récemment utilisée
+            self._entries.move_to_end(url)
+            self._mark_dirty()
+
+        response = requests.Response()
+        response.status_code = 200
+        # corps déjà en mémoire, sans connexion derrière : iter_content() et
+        # iter_lines() parcourent _content au lieu de lire raw
+        response._content = content
+        response._content_consumed = True
+        response.raw = None
+        response.url = not_modified.url or url
+        response.request = not_modified.request
+        response.headers = requests.structures.CaseInsensitiveDict(not_modified.headers)
+        if entry.get('content_type'):
+            response.headers['Content-Type'] = entry['content_type']
+        response.encoding = entry.get('encoding')
+        response.from_cache = True
+        return response
+
+    def invalidate(self, url: str):
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry:
+                self._total_size -= entry['size']
+                self._remove_body(url)
+                self._mark_dirty()
+
+    def _evict(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de la taille max (verrou tenu)"""
+        while self._total_size > self.max_size and self._entries:
+            url, entry = self._entries.popitem(last=False)
+            self._total_size -= entry['size']
+            self._remove_body(url)
+
+    def _remove_body(self, url: str):
+        try:
+            os.remove(self._body_path(url))
+        except OSError:
+            pass
+
+    def _mark_dirty(self):
+        """Compte une modification et réécrit l'index de temps en temps (verrou tenu)"""
+        self._dirty += 1
+        if self._dirty >= self.FLUSH_EVERY:
+            self._write_index()
+
+    def _write_index(self):
+        tmp_file = self.index_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(list(self._entries.items()), f, ensure_ascii=False)
+        os.replace(tmp_file, self.index_file)
+        self._dirty = 0
+
+    def flush(self):
+        """
+        Écrit l'index sur disque s'il a changé
+        """
+        with self._lock:
+            if self._dirty:
+                self._write_index()
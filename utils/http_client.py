@@ -0,0 +1,141 @@
+import time
+from typing import Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _supports_brotli() -> bool:
+    """urllib3 ne décode le brotli que si le paquet brotli (ou brotlicffi) est installé"""
+    try:
+        import brotli  # noqa: F401
+        return True
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+
+class HttpClient:
+    """
+    Couche de transport HTTP partagée par les scrapers.
+
+    Une seule session requests garde les connexions ouvertes (keep-alive) dans un pool,
+    applique un timeout à chaque requête, négocie la compression et passe par le
+    limiteur de débit s'il est fourni.
+    """
+
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br' if _supports_brotli() else 'gzip, deflate',
+    }
+
+    def __init__(self,
+                 rate_limiter=None,
+                 cache=None,
+                 archive=None,
+                 pool_size: int = 10,
+                 timeout: Union[float, Tuple[float, float]] = (5.0, 30.0),
+                 max_retries: int = 2,
+                 headers: Optional[Dict[str, str]] = None):
+        self.rate_limiter = rate_limiter
+        # cache HTTP sur disque (utils.http_cache.HttpCache), optionnel
+        self.cache = cache
+        # archive des pages téléchargées (utils.html_archive.HtmlArchive), optionnelle
+        self.archive = archive
+        # (connexion, lecture) en secondes
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        # 429/503 sont gérés par le limiteur de débit, on ne réessaie que les erreurs réseau/passerelle
+        retries = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 504),
+            allowed_methods=('GET', 'HEAD'),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Effectue une requête GET via la session partagée.
+        Avec un cache, la requête est conditionnelle et un 304 renvoie le corps en cache.
+        Les pages réellement téléchargées sont ajoutées à l'archive.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+
+        if kwargs.get('stream'):
+            return self._send(url, **kwargs)
+
+        if self.cache:
+            response = self._conditional_get(url, **kwargs)
+        else:
+            response = self._send(url, **kwargs)
+
+        if self.archive and response.status_code == 200 and not getattr(response, 'from_cache', False):
+            self.archive.append(url, response.content, response.headers.get('Content-Type'),
+                                response.encoding or response.apparent_encoding)
+
+        return response
+
+    def _conditional_get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Requête conditionnelle : un 304 renvoie le corps en cache
+        """
+        headers = dict(kwargs.pop('headers', None) or {})
+        conditional = self.cache.conditional_headers(url)
+        response = self._send(url, headers={**headers, **conditional}, **kwargs)
+
+        if response.status_code == 304 and conditional:
+            cached = self.cache.cached_response(url, response)
+            if cached is not None:
+                return cached
+            # corps perdu : on refait une requête complète
+            response = self._send(url, headers=headers, **kwargs)
+
+        if response.status_code == 200:
+            self.cache.store(url, response)
+
+        return response
+
+    def _send(self, url: str, **kwargs) -> requests.Response:
+        """
+        Envoie la requête en passant par le limiteur de débit
+        """
+        if not self.rate_limiter:
+            return self.session.get(url, **kwargs)
+
+        self.rate_limiter.acquire(url)
+        start = time.monotonic()
+        try:
+            response = self.session.get(url, **kwargs)
+        except requests.exceptions.RequestException:
+            self.rate_limiter.record(url, None, time.monotonic() - start)
+            raise
+
+        self.rate_limiter.record(url, response.status_code, time.monotonic() - start,
+                                 response.headers.get('Retry-After'))
+        return response
+
+    def close(self):
+        if self.cache:
+            self.cache.flush()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,3 +1,6 @@
+from bs4.element import Tag
+
+
 def extract_image_info(img_tag):
     """
     Extrait les informations d'une image (URL et légende/description)
@@ -50,47 +53,143 @@ def extract_image_caption(img_tag):
     if not img_tag:
         return None
     
-    caption_sources = []
-    
+    parent = img_tag.parent
+    return _first_caption(
+        img_tag,
+        lambda: parent.find('figcaption') if parent else None,
+        lambda: parent.find(class_=lambda x: x and 'caption' in x.lower()) if parent else None,
+        lambda: img_tag.find_next_sibling(['p', 'span', 'div']),
+        lambda element: element.get_text(strip=True)
+    )
+
+
+def _first_caption(img_tag, find_figcaption, find_caption_elem, find_next_elem, text_of):
+    """
+    Retourne la première légende trouvée, par ordre de priorité. Les éléments candidats
+    ne sont cherchés (find_*) que si les sources précédentes sont vides.
+    """
     # attribut alt de l'image
     if img_tag.has_attr('alt'):
         alt_text = img_tag['alt'].strip()
         if alt_text and alt_text.lower() not in ['image', 'photo', 'picture']:
-            caption_sources.append(alt_text)
+            return alt_text
     
     # attribut title de l'image
     if img_tag.has_attr('title'):
         title_text = img_tag['title'].strip()
-        if title_text and title_text not in caption_sources:
-            caption_sources.append(title_text)
-    
-    # chercher une légende dans les éléments parents/suivants
-    parent = img_tag.parent
-    if parent:
-        figcaption = parent.find('figcaption')
-        if figcaption:
-            caption_text = figcaption.get_text(strip=True)
-            if caption_text and caption_text not in caption_sources:
-                caption_sources.append(caption_text)
-        
-        caption_elem = parent.find(class_=lambda x: x and 'caption' in x.lower())
-        if caption_elem:
-            caption_text = caption_elem.get_text(strip=True)
-            if caption_text and caption_text not in caption_sources:
-                caption_sources.append(caption_text)
+        if title_text:
+            return title_text
+    
+    # chercher une légende dans les éléments parents
+    figcaption = find_figcaption()
+    if figcaption:
+        caption_text = text_of(figcaption)
+        if caption_text:
+            return caption_text
+    
+    caption_elem = find_caption_elem()
+    if caption_elem:
+        caption_text = text_of(caption_elem)
+        if caption_text:
+            return caption_text
     
     # chercher dans le contexte proche (éléments suivants)
-    next_elem = img_tag.find_next_sibling(['p', 'span', 'div'])
+    next_elem = find_next_elem()
     if next_elem:
-        text = next_elem.get_text(strip=True)
+        text = text_of(next_elem)
         if text and len(text) < 200:  
             classes = next_elem.get('class', [])
             if any('caption' in str(cls).lower() or 'legend' in str(cls).lower() for cls in classes):
-                if text not in caption_sources:
-                    caption_sources.append(text)
+                return text
     
-    # retourne la première légende trouvée 
-    return caption_sources[0] if caption_sources else None
+    return None
+
+
+def _has_caption_class(tag):
+    """Vrai si une des classes de la balise contient 'caption' (comme le filtre class_ de find)"""
+    classes = tag.get('class')
+    if not classes:
+        return False
+    if isinstance(classes, str):
+        classes = [classes]
+    return any('caption' in cls.lower() for cls in classes)
+
+
+def _assign_to_ancestors(node, container, first_by_ancestor):
+    """
+    Enregistre node comme premier candidat de chacun de ses ancêtres (jusqu'au conteneur)
+    qui n'en a pas encore. Un ancêtre déjà servi a des ancêtres déjà servis : on s'arrête.
+    """
+    parent = node.parent
+    while parent is not None and id(parent) not in first_by_ancestor:
+        first_by_ancestor[id(parent)] = node
+        if parent is container:
+            break
+        parent = parent.parent
+
+
+def extract_images(container):
+    """
+    Extrait les informations (URL, légende) de toutes les images d'un conteneur, dans
+    l'ordre du document. Même résultat que extract_image_info() sur chaque <img>, mais
+    les figcaptions et éléments de légende sont repérés en un seul parcours au lieu
+    d'être recherchés dans le sous-arbre du parent de chaque image.
+    """
+    if not container:
+        return []
+    
+    images = []
+    # id(ancêtre) -> premier <figcaption> / premier élément de classe "caption" de son sous-arbre
+    first_figcaption = {}
+    first_caption_elem = {}
+    
+    for node in container.descendants:
+        if not isinstance(node, Tag):
+            continue
+        if node.name == 'img':
+            images.append(node)
+        elif node.name == 'figcaption':
+            _assign_to_ancestors(node, container, first_figcaption)
+        if _has_caption_class(node):
+            _assign_to_ancestors(node, container, first_caption_elem)
+    
+    # premier <p>/<span>/<div> suivant chaque image, en un parcours inverse par parent
+    image_ids = {id(img) for img in images}
+    next_elems = {}
+    scanned_parents = set()
+    for img in images:
+        parent = img.parent
+        if id(parent) in scanned_parents:
+            continue
+        scanned_parents.add(id(parent))
+        following = None
+        for child in reversed(parent.contents):
+            if id(child) in image_ids:
+                next_elems[id(child)] = following
+            if isinstance(child, Tag) and child.name in ('p', 'span', 'div'):
+                following = child
+    
+    # un même élément de légende peut servir à plusieurs images
+    texts = {}
+    
+    def text_of(element):
+        if id(element) not in texts:
+            texts[id(element)] = element.get_text(strip=True)
+        return texts[id(element)]
+    
+    results = []
+    for img in images:
+        parent_id = id(img.parent)
+        caption = _first_caption(
+            img,
+            lambda: first_figcaption.get(parent_id),
+            lambda: first_caption_elem.get(parent_id),
+            lambda: next_elems.get(id(img)),
+            text_of
+        )
+        results.append({'url': extract_img_url(img), 'caption': caption})
+    
+    return results
 
 
 def is_valid_image_url(url):
@@ -0,0 +1,307 @@
+import atexit
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from utils.data_manager import DataManager, _copy_article, _file_key
+from utils.frontend_shards import partition_key
+
+
+class JsonlDataManager(DataManager):
+    """
+    Stockage des articles dans un journal JSON Lines en ajout seul (data/articles.jsonl).
+
+    Chaque sauvegarde ajoute une ligne par article nouveau ou mis à jour (l'état complet
+    de l'article), écrite d'un bloc puis synchronisée sur disque (fsync) : le coût d'une
+    sauvegarde dépend du nombre d'articles sauvegardés, pas de la taille de la base.
+    À la lecture, la dernière ligne d'une URL l'emporte ; une ligne tronquée par un arrêt
+    brutal est ignorée.
+
+    Quand le journal contient trop de versions périmées, il est compacté en arrière-plan
+    (une ligne par URL, fichier temporaire puis os.replace atomique). Les fichiers du
+    frontend (frontend/public/data) sont mis à jour à la compaction et en fin de programme.
+    Un articles.json existant est migré automatiquement au premier lancement.
+    """
+
+    LOG_FILE = "articles.jsonl"
+    # compaction quand le journal dépasse ce rapport lignes / articles
+    COMPACT_RATIO = 2.0
+    # pas de compaction en dessous de ce nombre de lignes
+    COMPACT_MIN_LINES = 1000
+
+    def __init__(self, data_dir="data", frontend_dir="frontend/public"):
+        super().__init__(data_dir, frontend_dir)
+        self.log_file = os.path.join(data_dir, self.LOG_FILE)
+        self._lock = threading.Lock()
+        self._compaction = None
+        # articles modifiés pas encore publiés pour le frontend : url -> partition publiée
+        # (None pour un nouvel article)
+        self._frontend_pending: Dict[str, Optional[Tuple]] = {}
+        # url -> dernier état de l'article, dans l'ordre de première sauvegarde
+        self._articles: Dict[str, Dict] = {}
+        # nombre de lignes du journal (versions périmées comprises)
+        self._log_lines = 0
+        # incrémenté à chaque sauvegarde (synchronisation de l'index de recherche)
+        self._version = 0
+        # liste des articles, reconstruite après chaque sauvegarde
+        self._articles_list: Optional[List[Dict]] = None
+        # index de recherche complété par les sauvegardes, enregistré en fin de programme
+        self._search_index_pending = False
+
+        if not os.path.exists(self.log_file) and os.path.exists(self.articles_file):
+            self._migrate_from_json()
+        self._load_log()
+        self._log = open(self.log_file, 'ab')
+        atexit.register(self.close)
+
+    def _migrate_from_json(self):
+        """Convertit l'ancien articles.json en journal JSON Lines"""
+        articles = self._read_articles_file()
+        self._write_lines(self.log_file, [self._encode(article) for article in articles if article.get('url')])
+        print(f"Migration de {self.articles_file} vers {self.log_file}: {len(articles)} articles")
+
+    def _load_log(self):
+        """Relit le journal et garde la dernière version de chaque article"""
+        if not os.path.exists(self.log_file):
+            return
+
+        valid_size = 0
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # dernière ligne tronquée (arrêt brutal pendant l'écriture)
+                    break
+                valid_size += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    article = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Ligne illisible ignorée dans {self.log_file}")
+                    continue
+                if article.get('url'):
+                    self._articles[article['url']] = article
+                self._log_lines += 1
+
+        if valid_size < os.path.getsize(self.log_file):
+            # la prochaine ligne ne doit pas être collée au morceau tronqué
+            with open(self.log_file, 'r+b') as f:
+                f.truncate(valid_size)
+
+    @staticmethod
+    def _encode(article: Dict) -> bytes:
+        return (json.dumps(article, ensure_ascii=False) + "\n").encode('utf-8')
+
+    @staticmethod
+    def _write_lines(path: str, lines: List[bytes]):
+        """Écrit un fichier complet de façon atomique (fichier temporaire, fsync, os.replace)"""
+        tmp_file = path + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+
+    def save_articles(self, articles: List[Dict]):
+        """
+        Ajoute les articles nouveaux ou mis à jour au journal
+        """
+        lines = []
+        saved_articles = []
+        new_count = 0
+        stats = self._begin_stats_update()
+
+        with self._lock:
+            search_synced = self._search_index_synced()
+            for article in articles:
+                existing = self._articles.get(article['url'])
+                if existing is None:
+                    # Ajouter timestamp de sauvegarde
+                    article['scraped_at'] = datetime.now().isoformat()
+                    saved = _copy_article(article)
+                    new_count += 1
+                else:
+                    # nouvelle version de l'article existant (l'ancienne reste dans le journal
+                    # jusqu'à la prochaine compaction)
+                    saved = dict(existing)
+                    # garder toutes les catégories où l'article a déjà été vu
+                    categories = existing.get('categories_scraped', [])
+                    saved.update(_copy_article(article))
+                    if categories:
+                        saved['categories_scraped'] = categories + [
+                            c for c in article.get('categories_scraped', []) if c not in categories
+                        ]
+                    saved['updated_at'] = datetime.now().isoformat()
+                stats.replace(existing, saved)
+                self._pending_frontend(existing, saved)
+                self._articles[article['url']] = saved
+                lines.append(self._encode(saved))
+                saved_articles.append(saved)
+
+            self._log.write(b"".join(lines))
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._log_lines += len(lines)
+            self._changed()
+            self._store_stats(stats)
+            self._update_date_index(saved_articles)
+            self._update_search_index(saved_articles, search_synced)
+            total = len(self._articles)
+            compact = self._needs_compaction()
+
+        if compact:
+            self.compact(background=True)
+
+        print(f"Sauvegarde terminée. {new_count} nouveaux articles ajoutés.")
+        print(f"Total d'articles dans la base: {total}")
+
+        return total
+
+    def import_articles(self, articles: List[Dict]) -> int:
+        """
+        Ajoute des articles tels quels au journal (migration entre stockages)
+        """
+        stats = self._begin_stats_update()
+        with self._lock:
+            search_synced = self._search_index_synced()
+            saved_articles = []
+            for article in articles:
+                saved_articles.append(_copy_article(article))
+                stats.replace(self._articles.get(article['url']), article)
+                self._pending_frontend(self._articles.get(article['url']), article)
+                self._articles[article['url']] = saved_articles[-1]
+            self._log.write(b"".join(self._encode(article) for article in articles))
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._log_lines += len(articles)
+            self._changed()
+            self._store_stats(stats)
+            self._update_date_index(saved_articles)
+            self._update_search_index(saved_articles, search_synced)
+            return len(self._articles)
+
+    def _pending_frontend(self, previous: Optional[Dict], article: Dict):
+        """Note un article à publier pour le frontend (verrou tenu)"""
+        if article['url'] not in self._frontend_pending:
+            self._frontend_pending[article['url']] = partition_key(previous) if previous is not None else None
+
+    def _search_index_changed(self):
+        # l'index complet n'est pas réécrit à chaque sauvegarde (verrou tenu)
+        self._search_index_pending = True
+
+    def _changed(self):
+        """Note une modification des articles (verrou tenu)"""
+        self._version += 1
+        self._articles_list = None
+
+    def load_articles(self) -> List[Dict]:
+        """
+        Retourne tous les articles (dernière version de chaque URL)
+        """
+        with self._lock:
+            return [_copy_article(article) for article in self._articles.values()]
+
+    def _corpus(self) -> List[Dict]:
+        # les articles ne sont jamais modifiés sur place : la liste suffit comme vue
+        with self._lock:
+            if self._articles_list is None:
+                self._articles_list = list(self._articles.values())
+            return self._articles_list
+
+    def _iter_stored(self) -> Iterator[Dict]:
+        # instantané des références : les sauvegardes pendant l'export ne le modifient pas
+        with self._lock:
+            return iter(list(self._articles.values()))
+
+    def _articles_by_urls(self, urls: List[str]) -> Dict[str, Dict]:
+        with self._lock:
+            return {url: self._articles[url] for url in urls if url in self._articles}
+
+    def _data_version(self):
+        return self._version
+
+    def _stats_token(self):
+        return _file_key(self.log_file)
+
+    def get_known_urls(self) -> Set[str]:
+        with self._lock:
+            return set(self._articles)
+
+    def _needs_compaction(self) -> bool:
+        """Vrai si le journal contient trop de versions périmées (verrou tenu)"""
+        return (self._log_lines >= self.COMPACT_MIN_LINES
+                and self._log_lines > self.COMPACT_RATIO * len(self._articles)
+                and not (self._compaction and self._compaction.is_alive()))
+
+    def compact(self, background: bool = False):
+        """
+        Réécrit le journal avec une seule ligne par article, puis régénère le fichier du frontend.
+        Les sauvegardes restent possibles pendant la réécriture : les lignes ajoutées
+        entre-temps sont recopiées à la fin du nouveau journal avant le remplacement.
+        """
+        if background:
+            with self._lock:
+                if self._compaction and self._compaction.is_alive():
+                    return
+                self._compaction = threading.Thread(target=self.compact, daemon=True)
+                self._compaction.start()
+            return
+
+        with self._lock:
+            # les articles ne sont jamais modifiés sur place : la liste suffit comme instantané
+            snapshot = list(self._articles.values())
+            offset = self._log.tell()
+
+        tmp_file = self.log_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.writelines(self._encode(article) for article in snapshot)
+
+            with self._lock:
+                # lignes ajoutées pendant la réécriture
+                self._log.flush()
+                with open(self.log_file, 'rb') as log:
+                    log.seek(offset)
+                    tail = log.read()
+                f.write(tail)
+                f.flush()
+                os.fsync(f.fileno())
+                self._log.close()
+                stats_current = self._stats is not None and self._stats.version == self._stats_token()
+                os.replace(tmp_file, self.log_file)
+                self._log = open(self.log_file, 'ab')
+                self._log_lines = len(snapshot) + tail.count(b"\n")
+                if stats_current:
+                    # mêmes articles dans le nouveau journal : les statistiques restent valables
+                    self._store_stats(self._stats)
+
+        print(f"Journal compacté: {len(snapshot)} articles dans {self.log_file}")
+        self.publish_frontend()
+
+    def publish_frontend(self):
+        """
+        Publie pour le frontend React les articles modifiés depuis la dernière publication
+        (partitions modifiées seulement)
+        """
+        with self._lock:
+            pending, self._frontend_pending = self._frontend_pending, {}
+            changes = [(url, previous_key, self._articles.get(url)) for url, previous_key in pending.items()]
+
+        self._publish_frontend(changes)
+
+    def close(self):
+        """
+        Attend la compaction en cours, enregistre l'index de recherche et met à jour le
+        frontend si la base a changé
+        """
+        compaction = self._compaction
+        if compaction and compaction.is_alive():
+            compaction.join()
+        if self._search_index_pending:
+            self._search_index_pending = False
+            self._save_search_index()
+        if self._frontend_pending:
+            self.publish_frontend()
+        if not self._log.closed:
+            self._log.close()
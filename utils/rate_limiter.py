@@ -0,0 +1,150 @@
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Seau à jetons : `rate` jetons par seconde, au plus `burst` jetons en réserve
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def reserve(self) -> float:
+        """
+        Réserve un jeton et retourne le temps d'attente (en secondes) avant de pouvoir l'utiliser.
+        Le solde peut devenir négatif : les appels suivants attendent leur tour.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            # le seau peut être en pause jusqu'à self.updated
+            wait = max(0.0, self.updated - now)
+            if self.tokens < 0:
+                wait += -self.tokens / self.rate
+            return wait
+
+    def set_rate(self, rate: float):
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds: float):
+        """Bloque le seau pendant `seconds` secondes (ex: en-tête Retry-After)"""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.updated = max(self.updated, now + seconds)
+            self.tokens = min(self.tokens, 0.0)
+
+
+class RateLimiter:
+    """
+    Limiteur de débit par hôte, partagé entre les scrapers et les threads.
+
+    Le débit de chaque hôte s'adapte aux réponses : il est divisé par deux sur une
+    réponse 429/503 (ou une erreur réseau), réduit quand la latence s'envole par
+    rapport à sa moyenne, puis remonte progressivement jusqu'au débit configuré.
+    """
+
+    SLOW_DOWN_STATUSES = (429, 503)
+
+    def __init__(self, requests_per_second: float = 1.0, burst: int = 1,
+                 min_rate: float = 0.1, latency_factor: float = 3.0):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.min_rate = min_rate
+        # une réponse plus lente que latency_factor * latence moyenne déclenche un ralentissement
+        self.latency_factor = latency_factor
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._latencies: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.requests_per_second > 0
+
+    def configure(self, requests_per_second: Optional[float] = None, burst: Optional[int] = None):
+        """
+        Change le débit de base (et la réserve) de tous les hôtes
+        """
+        with self._lock:
+            if requests_per_second is not None:
+                self.requests_per_second = requests_per_second
+            if burst is not None:
+                self.burst = burst
+            # les seaux seront recréés avec les nouveaux réglages
+            self._buckets.clear()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url: str):
+        """
+        Attend (si nécessaire) que l'hôte de l'URL accepte une nouvelle requête
+        """
+        if not self.enabled:
+            return
+
+        wait = self._bucket(url).reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def record(self, url: str, status_code: Optional[int] = None,
+               latency: Optional[float] = None, retry_after: Optional[str] = None):
+        """
+        Ajuste le débit de l'hôte selon le résultat d'une requête.
+        status_code à None signifie que la requête a échoué (timeout, connexion...).
+        """
+        if not self.enabled:
+            return
+
+        host = urlparse(url).netloc
+        bucket = self._bucket(url)
+
+        if status_code is None or status_code in self.SLOW_DOWN_STATUSES:
+            bucket.set_rate(max(self.min_rate, bucket.rate / 2))
+            delay = _parse_retry_after(retry_after)
+            if delay:
+                bucket.pause(delay)
+            return
+
+        slow = False
+        if latency is not None:
+            with self._lock:
+                average = self._latencies.get(host)
+                slow = average is not None and latency > average * self.latency_factor
+                # moyenne mobile exponentielle de la latence
+                self._latencies[host] = latency if average is None else 0.8 * average + 0.2 * latency
+
+        if slow:
+            bucket.set_rate(max(self.min_rate, bucket.rate * 0.75))
+        elif bucket.rate < self.requests_per_second:
+            # remontée progressive vers le débit configuré
+            bucket.set_rate(min(self.requests_per_second, bucket.rate + self.requests_per_second * 0.1))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retourne le délai en secondes de l'en-tête Retry-After (forme numérique uniquement)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,336 @@
+import base64
+import gzip
+import heapq
+import json
+import math
+import os
+import re
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# poids des champs indexés dans le score d'un article
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'author': 2.0,
+    'summary': 1.5,
+    'content': 1.0,
+}
+
+# mots vides français (après suppression des accents)
+STOPWORDS = frozenset("""
+    au aux avec ce ces cet cette dans de des du elle elles en est et etre eux il ils
+    je la le les leur leurs lui mais me meme ne nos notre nous on ou par pas plus
+    pour qu que qui sa se ses son sont sur ta te tes toi ton tu un une vos votre vous
+""".split())
+
+# poids d'un terme obtenu par complétion de préfixe (le terme exact reste devant)
+PREFIX_PENALTY = 0.8
+# longueur minimale d'un préfixe complété
+MIN_PREFIX = 2
+
+_COMBINING_RE = re.compile('[\u0300-\u036f]+')
+# élisions : l'article, d'abord, qu'il, jusqu'à...
+_ELISION_RE = re.compile(r"(?<!\w)(?:[cdjlmnst]|qu|jusqu|lorsqu|puisqu|quoiqu)['’]")
+_WORD_RE = re.compile(r'\w+')
+
+
+def fold(text: str) -> str:
+    """
+    Minuscules sans accents ni ligatures : « Économie » -> « economie »
+    """
+    text = text.lower().replace('œ', 'oe').replace('æ', 'ae')
+    return _COMBINING_RE.sub('', unicodedata.normalize('NFKD', text))
+
+
+def normalize_term(word: str) -> str:
+    # pluriel simple : « articles » et « article » donnent le même terme
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Découpe un texte français en termes indexables (sans accents, élisions ni mots vides)
+    """
+    if not text:
+        return []
+    terms = []
+    for word in _WORD_RE.findall(_ELISION_RE.sub(' ', fold(text))):
+        if word in STOPWORDS or (len(word) < 2 and not word.isdigit()):
+            continue
+        terms.append(normalize_term(word))
+    return terms
+
+
+class SearchIndex:
+    """
+    Index inversé persistant des articles (titre, résumé, contenu, auteur).
+
+    Pour chaque terme, l'index garde les articles qui le contiennent et un poids
+    (fréquence amortie, pondérée par champ) dans deux tableaux compacts
+    (array : 8 octets par entrée). Une recherche ne parcourt que les listes des termes
+    demandés : tous les termes doivent être présents, les articles sont classés par
+    score tf-idf, et le dernier terme (ou un terme terminé par *) est complété par
+    préfixe grâce à la liste triée des termes.
+
+    Mises à jour incrémentales : un article réindexé reçoit un nouvel identifiant et
+    l'ancien est marqué supprimé ; les entrées supprimées sont ignorées à la recherche
+    et purgées par save() quand elles deviennent trop nombreuses. sync() compare les
+    signatures (date de scraping ou de mise à jour) au contenu de la base et ne
+    réindexe que les articles nouveaux ou modifiés.
+
+    token : jeton de l'état des données auquel l'index correspond, enregistré avec lui
+    (None si inconnu) ; le stockage le compare au sien pour éviter sync() au chargement.
+    """
+
+    VERSION = 2
+    # proportion d'identifiants supprimés au-delà de laquelle save() reconstruit les listes
+    PURGE_RATIO = 0.25
+
+    def __init__(self, index_file: Optional[str] = "data/search_index.json.gz"):
+        # index_file=None : index gardé en mémoire seulement
+        self.index_file = index_file
+        # identifiant -> url (None : article supprimé ou réindexé)
+        self._urls: List[Optional[str]] = []
+        self._ids: Dict[str, int] = {}
+        self._signatures: Dict[str, str] = {}
+        self._deleted: Set[int] = set()
+        # terme -> (identifiants d'articles, poids)
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._sorted_terms: Optional[List[str]] = None
+        self.token = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _load(self):
+        if not self.index_file or not os.path.exists(self.index_file):
+            return
+        try:
+            with gzip.open(self.index_file, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, EOFError, ValueError):
+            print("Index de recherche illisible, reconstruit")
+            return
+        if data.get('version') != self.VERSION:
+            return
+        self.token = data.get('token')
+
+        for doc, entry in enumerate(data['docs']):
+            if entry is None:
+                self._urls.append(None)
+                self._deleted.add(doc)
+                continue
+            url, signature = entry
+            self._urls.append(url)
+            self._ids[url] = doc
+            self._signatures[url] = signature
+
+        swap = data['byteorder'] != sys.byteorder
+        for term, (ids_data, weights_data) in data['postings'].items():
+            ids, weights = array('I'), array('f')
+            ids.frombytes(base64.b64decode(ids_data))
+            weights.frombytes(base64.b64decode(weights_data))
+            if swap:
+                ids.byteswap()
+                weights.byteswap()
+            self._postings[term] = (ids, weights)
+
+    def _purge(self):
+        """Retire les articles supprimés des listes et renumérote les identifiants"""
+        renumber = {}
+        urls = []
+        for doc, url in enumerate(self._urls):
+            if url is not None:
+                renumber[doc] = len(urls)
+                urls.append(url)
+
+        for term, (ids, weights) in list(self._postings.items()):
+            kept_ids, kept_weights = array('I'), array('f')
+            for doc, weight in zip(ids, weights):
+                new_doc = renumber.get(doc)
+                if new_doc is not None:
+                    kept_ids.append(new_doc)
+                    kept_weights.append(weight)
+            if kept_ids:
+                self._postings[term] = (kept_ids, kept_weights)
+            else:
+                del self._postings[term]
+
+        self._urls = urls
+        self._ids = {url: doc for doc, url in enumerate(urls)}
+        self._deleted = set()
+        self._sorted_terms = None
+
+    def save(self):
+        """
+        Écrit l'index sur disque (remplacement atomique)
+        """
+        if len(self._deleted) > self.PURGE_RATIO * len(self._urls):
+            self._purge()
+        if not self.index_file:
+            return
+
+        docs = [[url, self._signatures[url]] if url is not None else None for url in self._urls]
+        postings = {
+            term: [base64.b64encode(ids.tobytes()).decode('ascii'),
+                   base64.b64encode(weights.tobytes()).decode('ascii')]
+            for term, (ids, weights) in self._postings.items()
+        }
+
+        directory = os.path.dirname(self.index_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp_file = self.index_file + ".tmp"
+        with gzip.open(tmp_file, 'wt', encoding='utf-8', compresslevel=1) as f:
+            json.dump({'version': self.VERSION, 'byteorder': sys.byteorder, 'token': self.token,
+                       'docs': docs, 'postings': postings}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_file, self.index_file)
+
+    @staticmethod
+    def _weights(article: Dict) -> Dict[str, float]:
+        """Poids de chaque terme de l'article : somme sur les champs de poids * (1 + log tf)"""
+        weights: Dict[str, float] = {}
+        for field, field_weight in FIELD_WEIGHTS.items():
+            counts: Dict[str, int] = {}
+            for term in tokenize(article.get(field)):
+                counts[term] = counts.get(term, 0) + 1
+            for term, count in counts.items():
+                weights[term] = weights.get(term, 0.0) + field_weight * (1.0 + math.log(count))
+        return weights
+
+    def add(self, article: Dict, signature: Optional[str] = None):
+        """
+        Indexe (ou réindexe) un article
+        """
+        url = article['url']
+        self._forget(url)
+        doc = len(self._urls)
+        self._urls.append(url)
+        self._ids[url] = doc
+        self._signatures[url] = signature or ''
+
+        for term, weight in self._weights(article).items():
+            entry = self._postings.get(term)
+            if entry is None:
+                entry = self._postings[term] = (array('I'), array('f'))
+                self._sorted_terms = None
+            entry[0].append(doc)
+            entry[1].append(weight)
+
+    def _forget(self, url: str):
+        doc = self._ids.pop(url, None)
+        if doc is not None:
+            self._urls[doc] = None
+            self._deleted.add(doc)
+            del self._signatures[url]
+
+    def remove(self, url: str):
+        """
+        Retire un article de l'index
+        """
+        self._forget(url)
+
+    def sync(self, signatures: Dict[str, Optional[str]],
+             fetch: Callable[[List[str]], Dict[str, Dict]]) -> bool:
+        """
+        Met l'index en accord avec la base : signatures donne {url: date de scraping},
+        fetch(urls) retourne les articles à réindexer. Retourne True si l'index a changé.
+        """
+        removed = [url for url in self._ids if url not in signatures]
+        for url in removed:
+            self.remove(url)
+
+        changed = [url for url, signature in signatures.items()
+                   if url not in self._ids or self._signatures[url] != (signature or '')]
+        if changed:
+            for url, article in fetch(changed).items():
+                self.add(article, signatures.get(url))
+        if changed or removed:
+            print(f"Index de recherche: {len(changed)} articles indexés, {len(removed)} retirés")
+
+        return bool(removed or changed)
+
+    def _expand(self, prefix: str) -> Iterable[str]:
+        """Termes de l'index commençant par ce préfixe (recherche dichotomique)"""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        position = bisect_left(terms, prefix)
+        while position < len(terms) and terms[position].startswith(prefix):
+            yield terms[position]
+            position += 1
+
+    def _postings_of(self, term: str) -> Dict[int, float]:
+        entry = self._postings.get(term)
+        if entry is None:
+            return {}
+        if not self._deleted:
+            return dict(zip(*entry))
+        deleted = self._deleted
+        return {doc: weight for doc, weight in zip(*entry) if doc not in deleted}
+
+    def _matches(self, term: str, prefix: bool) -> Dict[int, float]:
+        matches = self._postings_of(term)
+        if not prefix or len(term) < MIN_PREFIX:
+            return matches
+
+        for other in self._expand(term):
+            if other == term:
+                continue
+            for doc, weight in self._postings_of(other).items():
+                weight *= PREFIX_PENALTY
+                if weight > matches.get(doc, 0.0):
+                    matches[doc] = weight
+        return matches
+
+    def parse_query(self, query: str) -> List[Tuple[str, bool]]:
+        """
+        Termes de la requête et, pour chacun, s'il est complété par préfixe
+        (dernier terme sans espace final, ou terme terminé par *)
+        """
+        words = query.split()
+        parsed = []
+        for position, word in enumerate(words):
+            prefix = word.endswith('*') or (position == len(words) - 1 and not query[-1:].isspace())
+            terms = tokenize(word.rstrip('*'))
+            # seul le dernier morceau d'un mot composé (« e-commerce ») est un préfixe
+            for i, term in enumerate(terms):
+                parsed.append((term, prefix and i == len(terms) - 1))
+        return parsed
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Recherche les articles contenant tous les termes de la requête.
+        Retourne [(url, score)] par score décroissant (les limit premiers si précisé).
+        """
+        terms = self.parse_query(query)
+        if not terms:
+            return []
+
+        total = len(self._ids)
+        scores: Optional[Dict[int, float]] = None
+        # les termes les plus rares d'abord : l'intersection rétrécit vite
+        for matches in sorted((self._matches(term, prefix) for term, prefix in terms), key=len):
+            if not matches:
+                return []
+            idf = math.log(1.0 + total / len(matches))
+            if scores is None:
+                scores = {doc: weight * idf for doc, weight in matches.items()}
+            else:
+                scores = {doc: score + matches[doc] * idf for doc, score in scores.items() if doc in matches}
+            if not scores:
+                return []
+
+        if limit is not None:
+            ranked = heapq.nlargest(limit, scores, key=scores.__getitem__)
+        else:
+            ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+        urls = self._urls
+        return [(urls[doc], scores[doc]) for doc in ranked]
@@ -0,0 +1,103 @@
+import atexit
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+
+class SelectorStats:
+    """
+    Statistiques persistantes des sélecteurs gagnants, par site et par champ.
+
+    Pour chaque champ extrait (date, auteur, contenu...), on compte quel sélecteur de
+    la chaîne de repli a fourni la valeur. order() garde toujours l'ordre de priorité
+    déclaré entre les sélecteurs qui ont déjà gagné sur le site ; ceux qui n'ont jamais
+    gagné en MIN_SAMPLES pages passent en fin de chaîne (essayés seulement si aucun
+    autre ne trouve rien), ce qui évite de les chercher sur chaque page.
+
+    Un sélecteur relégué qui se mettrait à correspondre (refonte du site) ne serait plus
+    prioritaire : une page sur EXPLORE_EVERY est extraite avec l'ordre déclaré pour
+    qu'il puisse regagner sa place. L'apprentissage reste optionnel (--learn-selectors).
+    """
+
+    # nombre de modifications avant réécriture du fichier
+    FLUSH_EVERY = 50
+    # succès comptés pour un champ avant de reléguer les sélecteurs qui n'ont jamais gagné
+    MIN_SAMPLES = 20
+    # une page sur EXPLORE_EVERY garde l'ordre déclaré
+    EXPLORE_EVERY = 20
+
+    def __init__(self, stats_file: Optional[str] = "data/selector_stats.json", read_only: bool = False):
+        # stats_file=None : statistiques gardées en mémoire seulement
+        self.stats_file = stats_file
+        # read_only : le fichier est lu mais jamais réécrit (processus de parsing)
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._dirty = 0
+        # (site, champ) -> nombre d'appels à order()
+        self._calls: Dict[tuple, int] = {}
+        # site -> champ -> sélecteur -> nombre de succès
+        self._hits: Dict[str, Dict[str, Dict[str, int]]] = self._load()
+        if stats_file and not read_only:
+            atexit.register(self.flush)
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        if not self.stats_file or not os.path.exists(self.stats_file):
+            return {}
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            print("Statistiques des sélecteurs illisibles, réinitialisées")
+            return {}
+
+    def order(self, host: str, field: str, chain: List[str]) -> List[str]:
+        """
+        Retourne la chaîne de sélecteurs à essayer : les sélecteurs déjà gagnants sur ce
+        site dans l'ordre déclaré, puis ceux qui n'ont jamais gagné
+        """
+        with self._lock:
+            hits = self._hits.get(host, {}).get(field) or {}
+            if sum(hits.values()) < self.MIN_SAMPLES:
+                return chain
+            calls = self._calls.get((host, field), 0) + 1
+            self._calls[(host, field)] = calls
+            if calls % self.EXPLORE_EVERY == 0:
+                return chain
+            winners = [selector for selector in chain if hits.get(selector)]
+        if not winners or len(winners) == len(chain):
+            return chain
+        return winners + [selector for selector in chain if not hits.get(selector)]
+
+    def record(self, host: str, field: str, selector: str):
+        """
+        Compte un succès du sélecteur pour ce champ sur ce site
+        """
+        with self._lock:
+            field_hits = self._hits.setdefault(host, {}).setdefault(field, {})
+            field_hits[selector] = field_hits.get(selector, 0) + 1
+            self._dirty += 1
+            if self._dirty >= self.FLUSH_EVERY:
+                self._write()
+
+    def _write(self):
+        """Réécrit le fichier de statistiques (verrou tenu)"""
+        if not self.stats_file or self.read_only:
+            self._dirty = 0
+            return
+        directory = os.path.dirname(self.stats_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp_file = self.stats_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._hits, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.stats_file)
+        self._dirty = 0
+
+    def flush(self):
+        """
+        Écrit les statistiques sur disque si elles ont changé
+        """
+        with self._lock:
+            if self._dirty:
+                self._write()
@@ -0,0 +1,466 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+from utils.article_stats import ArticleStats
+from utils.data_manager import DataManager
+from utils.frontend_shards import partition_key
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    title TEXT,
+    category TEXT,
+    subcategory TEXT,
+    author TEXT,
+    publication_date TEXT,
+    has_images INTEGER NOT NULL DEFAULT 0,
+    has_content INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    -- champs filtrés par sous-chaîne sans tenir compte de la casse, en minuscules
+    -- (str.lower() de Python), '' si le champ est absent
+    category_lower TEXT NOT NULL DEFAULT '',
+    subcategory_lower TEXT NOT NULL DEFAULT '',
+    author_lower TEXT NOT NULL DEFAULT '',
+    title_lower TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_articles_position ON articles(position);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category);
+CREATE INDEX IF NOT EXISTS idx_articles_subcategory ON articles(subcategory);
+CREATE INDEX IF NOT EXISTS idx_articles_author ON articles(author);
+-- (date, position) : plages de dates et plus récents lus dans l'ordre, sans tri
+DROP INDEX IF EXISTS idx_articles_publication_date;
+CREATE INDEX IF NOT EXISTS idx_articles_date_position ON articles(publication_date, position);
+-- statistiques matérialisées, écrites dans la même transaction que les articles
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+# champs filtrés par sous-chaîne (colonne <champ>_lower)
+LOWER_COLUMNS = ('category', 'subcategory', 'author', 'title')
+# champs à peu de valeurs distinctes : les valeurs qui correspondent sont retrouvées
+# par l'index, puis les articles par égalité sur ces valeurs (même index)
+INDEXED_LOWER_COLUMNS = ('category', 'subcategory', 'author')
+
+# créés après la migration des bases qui n'ont pas encore les colonnes en minuscules
+LOWER_INDEXES = "".join(
+    f"CREATE INDEX IF NOT EXISTS idx_articles_{column}_lower ON articles({column}_lower);\n"
+    for column in INDEXED_LOWER_COLUMNS
+)
+
+UPSERT = """
+INSERT INTO articles (url, position, title, category, subcategory, author,
+                      publication_date, has_images, has_content, data,
+                      category_lower, subcategory_lower, author_lower, title_lower)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    title = excluded.title,
+    category = excluded.category,
+    subcategory = excluded.subcategory,
+    author = excluded.author,
+    publication_date = excluded.publication_date,
+    has_images = excluded.has_images,
+    has_content = excluded.has_content,
+    data = excluded.data,
+    category_lower = excluded.category_lower,
+    subcategory_lower = excluded.subcategory_lower,
+    author_lower = excluded.author_lower,
+    title_lower = excluded.title_lower
+"""
+
+# limite de paramètres d'une requête SQLite (les anciennes versions acceptent 999)
+_BATCH = 900
+
+
+def _lower(value) -> str:
+    # lower() de SQLite ne gère que l'ASCII : les colonnes gardent la sémantique de str.lower()
+    return value.lower() if isinstance(value, str) else ''
+
+
+class SqliteDataManager(DataManager):
+    """
+    Stockage des articles dans une base SQLite (data/articles.db).
+
+    Chaque article est gardé en JSON complet (colonne data) ; les champs filtrés
+    (catégorie, sous-catégorie, auteur, date de publication) sont aussi des colonnes
+    indexées. Les recherches et listes sont calculées par SQLite sans désérialiser le
+    corpus ; les statistiques sont matérialisées dans la table stats, mise à jour dans
+    la même transaction que les articles. Les résultats et l'ordre (ordre de première
+    sauvegarde) sont ceux de DataManager.
+
+    Les fichiers du frontend (frontend/public/data) sont mis à jour en fin de programme si la base
+    a changé. `python main.py migrate json sqlite` copie une base existante.
+    """
+
+    DB_FILE = "articles.db"
+
+    def __init__(self, data_dir="data", frontend_dir="frontend/public"):
+        super().__init__(data_dir, frontend_dir)
+        self.db_file = os.path.join(data_dir, self.DB_FILE)
+        self._lock = threading.Lock()
+        # articles modifiés pas encore publiés pour le frontend : url -> partition publiée
+        # (None pour un nouvel article)
+        self._frontend_pending: Dict[str, Optional[Tuple]] = {}
+        # incrémenté à chaque écriture de ce processus (synchronisation de l'index de recherche)
+        self._changes = 0
+        # index de recherche complété par les sauvegardes, enregistré en fin de programme
+        self._search_index_pending = False
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._add_lower_columns()
+        self._conn.executescript(LOWER_INDEXES)
+        atexit.register(self.close)
+
+    def _add_lower_columns(self):
+        """
+        Migration des bases créées sans les colonnes en minuscules : colonnes ajoutées
+        et remplies depuis les champs d'origine, en une transaction
+        """
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        missing = [column for column in LOWER_COLUMNS if f"{column}_lower" not in columns]
+        if not missing:
+            return
+
+        with self._conn:
+            for column in missing:
+                self._conn.execute(f"ALTER TABLE articles ADD COLUMN {column}_lower TEXT NOT NULL DEFAULT ''")
+            rows = self._conn.execute(f"SELECT url, {', '.join(LOWER_COLUMNS)} FROM articles").fetchall()
+            self._conn.executemany(
+                f"UPDATE articles SET {', '.join(f'{column}_lower = ?' for column in LOWER_COLUMNS)} WHERE url = ?",
+                [tuple(_lower(value) for value in row[1:]) + (row[0],) for row in rows]
+            )
+        print(f"Base {self.db_file} migrée: colonnes en minuscules pour {len(rows)} articles")
+
+    @staticmethod
+    def _row(article: Dict, position: int) -> tuple:
+        return (
+            article['url'], position,
+            article.get('title'),
+            article.get('category'),
+            article.get('subcategory'),
+            article.get('author'),
+            article.get('publication_date'),
+            1 if article.get('images') else 0,
+            1 if article.get('content') else 0,
+            json.dumps(article, ensure_ascii=False)
+        ) + tuple(_lower(article.get(column)) for column in LOWER_COLUMNS)
+
+    def _existing(self, urls: List[str]) -> Dict[str, Dict]:
+        """Articles déjà stockés parmi ces URLs (verrou tenu)"""
+        existing = {}
+        for start in range(0, len(urls), _BATCH):
+            chunk = urls[start:start + _BATCH]
+            placeholders = ",".join("?" * len(chunk))
+            for url, data in self._conn.execute(
+                    f"SELECT url, data FROM articles WHERE url IN ({placeholders})", chunk):
+                existing[url] = json.loads(data)
+        return existing
+
+    def _upsert(self, articles: Iterable[Dict], stats: ArticleStats, existing: Dict[str, Dict]):
+        """
+        Insère ou remplace les articles et leurs statistiques en une transaction ;
+        existing : versions précédentes des articles déjà stockés (verrou tenu)
+        """
+        position = self._conn.execute("SELECT COALESCE(MAX(position), 0) FROM articles").fetchone()[0]
+        rows = []
+        for article in articles:
+            position += 1
+            rows.append(self._row(article, position))
+            if article['url'] not in self._frontend_pending:
+                previous = existing.get(article['url'])
+                self._frontend_pending[article['url']] = partition_key(previous) if previous is not None else None
+        with self._conn:
+            # la position n'est pas modifiée pour un article déjà présent
+            self._conn.executemany(UPSERT, rows)
+            self._write_stats(stats)
+            # génération des articles, enregistrée avec l'index de recherche
+            self._conn.execute("INSERT INTO stats (name, data) VALUES ('generation', '1') "
+                               "ON CONFLICT(name) DO UPDATE SET data = CAST(data AS INTEGER) + 1")
+        self._changes += 1
+
+    def save_articles(self, articles: List[Dict]):
+        """
+        Sauvegarde une liste d'articles (insertion ou mise à jour groupée)
+        """
+        new_count = 0
+        search_synced = self._search_index_synced()
+
+        with self._lock:
+            existing = self._existing(list({article['url'] for article in articles}))
+            stats = self._read_stats()
+            merged = {}
+            for article in articles:
+                current = merged.get(article['url']) or existing.get(article['url'])
+                if current is None:
+                    # Ajouter timestamp de sauvegarde
+                    article['scraped_at'] = datetime.now().isoformat()
+                    merged[article['url']] = dict(article)
+                    new_count += 1
+                else:
+                    # Mettre à jour l'article existant
+                    saved = dict(current)
+                    # garder toutes les catégories où l'article a déjà été vu
+                    categories = current.get('categories_scraped', [])
+                    saved.update(article)
+                    if categories:
+                        saved['categories_scraped'] = categories + [
+                            c for c in article.get('categories_scraped', []) if c not in categories
+                        ]
+                    saved['updated_at'] = datetime.now().isoformat()
+                    merged[article['url']] = saved
+                stats.replace(current, merged[article['url']])
+
+            self._upsert(merged.values(), stats, existing)
+            total = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        self._update_search_index(merged.values(), search_synced)
+
+        print(f"Sauvegarde terminée. {new_count} nouveaux articles ajoutés.")
+        print(f"Total d'articles dans la base: {total}")
+
+        return total
+
+    def import_articles(self, articles: List[Dict]) -> int:
+        """
+        Enregistre des articles tels quels (migration entre stockages)
+        """
+        search_synced = self._search_index_synced()
+        with self._lock:
+            existing = self._existing(list({article['url'] for article in articles}))
+            previous = dict(existing)
+            stats = self._read_stats()
+            for article in articles:
+                stats.replace(existing.get(article['url']), article)
+                existing[article['url']] = article
+            self._upsert(articles, stats, previous)
+            total = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        self._update_search_index(articles, search_synced)
+        return total
+
+    def _read_stats(self) -> ArticleStats:
+        """Statistiques enregistrées, calculées depuis les articles si absentes (verrou tenu)"""
+        row = self._conn.execute("SELECT data FROM stats WHERE name = 'articles'").fetchone()
+        if row:
+            return ArticleStats.from_json(json.loads(row[0]))
+        stats = ArticleStats.compute(
+            json.loads(data) for data, in self._conn.execute("SELECT data FROM articles ORDER BY position")
+        )
+        with self._conn:
+            self._write_stats(stats)
+        return stats
+
+    def _write_stats(self, stats: ArticleStats):
+        """(verrou tenu, dans une transaction)"""
+        self._conn.execute("INSERT OR REPLACE INTO stats (name, data) VALUES ('articles', ?)",
+                           (json.dumps(stats.to_json(), ensure_ascii=False),))
+
+    def _current_stats(self) -> ArticleStats:
+        # une seule ligne lue : à jour même si un autre processus a écrit dans la base
+        with self._lock:
+            return self._read_stats()
+
+    def _store_stats(self, stats: ArticleStats):
+        with self._lock, self._conn:
+            self._write_stats(stats)
+
+    def _query(self, sql: str, params: Iterable = ()) -> list:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def load_articles(self) -> List[Dict]:
+        """
+        Charge tous les articles, dans l'ordre de première sauvegarde
+        """
+        return [json.loads(data) for data, in self._query("SELECT data FROM articles ORDER BY position")]
+
+    def iter_articles(self, since: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Parcourt les articles par lots depuis une connexion en lecture seule : la lecture
+        voit un instantané de la base (WAL) sans bloquer les sauvegardes
+        """
+        sql = "SELECT data FROM articles"
+        params = ()
+        if since is not None:
+            sql += (" WHERE COALESCE(NULLIF(json_extract(data, '$.updated_at'), ''),"
+                    " json_extract(data, '$.scraped_at'), '') >= ?")
+            params = (since,)
+        sql += " ORDER BY position"
+
+        conn = sqlite3.connect(f"file:{quote(os.path.abspath(self.db_file))}?mode=ro", uri=True)
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(_BATCH)
+                if not rows:
+                    break
+                for data, in rows:
+                    yield json.loads(data)
+        finally:
+            conn.close()
+
+    def _articles_by_urls(self, urls: List[str]) -> Dict[str, Dict]:
+        with self._lock:
+            return self._existing(urls)
+
+    def _data_version(self):
+        # data_version change quand une autre connexion modifie la base
+        return self._changes, self._query("PRAGMA data_version")[0][0]
+
+    def _search_token(self):
+        # génération écrite dans la même transaction que les articles
+        row = self._query("SELECT data FROM stats WHERE name = 'generation'")
+        return row[0][0] if row else None
+
+    def _search_index_changed(self):
+        # l'index complet n'est pas réécrit à chaque sauvegarde
+        self._search_index_pending = True
+
+    def get_known_urls(self) -> Set[str]:
+        return {url for url, in self._query("SELECT url FROM articles")}
+
+    def get_scraped_timestamps(self) -> Dict[str, str]:
+        return dict(self._query(
+            "SELECT url, COALESCE(NULLIF(json_extract(data, '$.updated_at'), ''), json_extract(data, '$.scraped_at')) "
+            "FROM articles"
+        ))
+
+    def _contains(self, column: str, value: str, keep_empty: bool = True) -> Tuple[str, List[str]]:
+        """
+        Condition SQL et paramètres : le champ contient value, sans tenir compte de la casse.
+        keep_empty : comme DataManager, un article sans valeur pour ce champ n'est pas filtré.
+
+        Pour la catégorie, la sous-catégorie et l'auteur, les valeurs distinctes de la
+        colonne en minuscules (lues sur son index) sont filtrées en Python, et la condition
+        devient une égalité sur ces valeurs, servie par le même index. Le titre est cherché
+        par instr() sur sa colonne en minuscules.
+        """
+        needle = value.lower()
+        lower = f"{column}_lower"
+        if column in INDEXED_LOWER_COLUMNS:
+            values = [key for key, in self._query(f"SELECT DISTINCT {lower} FROM articles WHERE {lower} != ''")
+                      if needle in key]
+            if keep_empty:
+                values.append('')
+            if len(values) <= _BATCH:
+                return f"{lower} IN ({','.join('?' * len(values))})", values
+
+        empty = f"{lower} = '' OR " if keep_empty else f"{lower} != '' AND "
+        return f"({empty}instr({lower}, ?) > 0)", [needle]
+
+    def search_articles(self,
+                        category: Optional[str] = None,
+                        subcategory: Optional[str] = None,
+                        author: Optional[str] = None,
+                        date_start: Optional[str] = None,
+                        date_end: Optional[str] = None,
+                        title_search: Optional[str] = None,
+                        query: Optional[str] = None) -> List[Dict]:
+        """
+        Recherche des articles selon différents critères (requête SQL indexée).
+        query : recherche plein texte via l'index inversé, résultats classés par pertinence.
+        """
+        clauses = []
+        params = []
+
+        for column, value in (('category', category), ('subcategory', subcategory),
+                              ('author', author), ('title', title_search)):
+            if value:
+                clause, values = self._contains(column, value)
+                clauses.append(clause)
+                params.extend(values)
+
+        if date_start:
+            clauses.append("(publication_date IS NULL OR publication_date = '' OR publication_date >= ?)")
+            params.append(date_start)
+        if date_end:
+            clauses.append("(publication_date IS NULL OR publication_date = '' OR publication_date <= ?)")
+            params.append(date_end)
+
+        if not query:
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            rows = self._query(f"SELECT data FROM articles {where} ORDER BY position", params)
+            return [json.loads(data) for data, in rows]
+
+        ranked = [url for url, _ in self._synced_search_index().search(query)]
+        found = {}
+        for start in range(0, len(ranked), _BATCH):
+            chunk = ranked[start:start + _BATCH]
+            where = " AND ".join(clauses + [f"url IN ({','.join('?' * len(chunk))})"])
+            found.update(self._query(f"SELECT url, data FROM articles WHERE {where}", params + chunk))
+        return [json.loads(found[url]) for url in ranked if url in found]
+
+    def _dated_query(self, date_start: Optional[str], date_end: Optional[str],
+                     category: Optional[str], order: str, limit: Optional[int] = None) -> List[Dict]:
+        """Articles datés, parcourus dans l'ordre de l'index sur publication_date"""
+        clauses = ["publication_date IS NOT NULL", "publication_date != ''"]
+        params = []
+        if date_start:
+            clauses.append("publication_date >= ?")
+            params.append(date_start)
+        if date_end:
+            clauses.append("publication_date <= ?")
+            params.append(date_end)
+        if category:
+            clause, values = self._contains('category', category, keep_empty=False)
+            clauses.append(clause)
+            params.extend(values)
+        sql = f"SELECT data FROM articles WHERE {' AND '.join(clauses)} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(data) for data, in self._query(sql, params)]
+
+    def get_latest_articles(self, count: int = 10, category: Optional[str] = None) -> List[Dict]:
+        if count <= 0:
+            return []
+        return self._dated_query(None, None, category, "publication_date DESC, position DESC", count)
+
+    def get_articles_in_range(self,
+                              date_start: Optional[str] = None,
+                              date_end: Optional[str] = None,
+                              category: Optional[str] = None) -> List[Dict]:
+        return self._dated_query(date_start, date_end, category, "publication_date, position")
+
+    def _distinct(self, column: str, where: str = "", params: Iterable = ()) -> List[str]:
+        rows = self._query(
+            f"SELECT DISTINCT {column} FROM articles WHERE {column} IS NOT NULL AND {column} != '' {where}",
+            params
+        )
+        return sorted(value for value, in rows)
+
+    def get_categories(self) -> List[str]:
+        return self._distinct('category')
+
+    def get_subcategories(self, category: Optional[str] = None) -> List[str]:
+        if category:
+            clause, values = self._contains('category', category)
+            return self._distinct('subcategory', f"AND {clause}", values)
+        return self._distinct('subcategory')
+
+    def get_authors(self) -> List[str]:
+        return self._distinct('author')
+
+    def close(self):
+        """
+        Enregistre l'index de recherche et met à jour le fichier du frontend si la base
+        a changé, puis ferme la connexion
+        """
+        if self._search_index_pending:
+            self._search_index_pending = False
+            self._save_search_index()
+        if self._frontend_pending:
+            with self._lock:
+                pending, self._frontend_pending = self._frontend_pending, {}
+                current = self._existing(list(pending))
+            self._publish_frontend([(url, previous_key, current.get(url)) for url, previous_key in pending.items()])
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,43 @@
 import re
-from datetime import datetime
+import threading
+from collections import Counter
+from functools import lru_cache
+
+
+# caractères de contrôle supprimés du texte
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+HTML_ENTITIES = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#8217;': "'",
+    '&#8216;': "'",
+    '&#8220;': '"',
+    '&#8221;': '"',
+    '&#8230;': '...',
+    '&hellip;': '...',
+    '&mdash;': '—',
+    '&ndash;': '–'
+}
+
+# Les entités étaient remplacées une par une, dans l'ordre du dictionnaire : un
+# "&amp;lt;" devenait "&lt;" puis "<", mais "&amp;nbsp;" restait "&nbsp;". Les formes
+# "&amp;xxx;" des entités qui suivent &amp; sont donc ajoutées pour obtenir le même
+# résultat en un seul passage (les plus longues sont essayées en premier).
+_ENTITY_REPLACEMENTS = dict(HTML_ENTITIES)
+for _entity in list(HTML_ENTITIES)[list(HTML_ENTITIES).index('&amp;') + 1:]:
+    _ENTITY_REPLACEMENTS['&amp;' + _entity[1:]] = HTML_ENTITIES[_entity]
+
+_ENTITY_RE = re.compile('|'.join(
+    re.escape(entity) for entity in sorted(_ENTITY_REPLACEMENTS, key=len, reverse=True)
+))
+
+
+def _replace_entity(match):
+    return _ENTITY_REPLACEMENTS[match.group()]
 
 
 def clean_text(text):
@@ -9,80 +47,153 @@ def clean_text(text):
     if not text:
         return ""
     
-    text = text.strip()
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-    
-    replacements = {
-        '&nbsp;': ' ',
-        '&amp;': '&',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&quot;': '"',
-        '&#8217;': "'",
-        '&#8216;': "'",
-        '&#8220;': '"',
-        '&#8221;': '"',
-        '&#8230;': '...',
-        '&hellip;': '...',
-        '&mdash;': '—',
-        '&ndash;': '–'
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    # strip + espaces multiples : split() coupe sur les mêmes espaces que \s
+    text = ' '.join(text.split())
+    text = _CONTROL_CHARS_RE.sub('', text)
+    
+    if '&' in text:
+        text = _ENTITY_RE.sub(_replace_entity, text)
     
     return text.strip()
 
 
-def extract_date(date_string):
+def clean_texts(texts):
     """
-    Extrait et convertit une date au format AAAAMMJJ
+    Nettoie une série de textes (paragraphes, légendes...) et retourne la liste des résultats
+    """
+    return [clean_text(text) for text in texts]
+
+
+# formats de date reconnus, essayés dans l'ordre (nom, motif compilé)
+DATE_PATTERNS = [
+    ('iso', re.compile(r'(\d{4})-(\d{2})-(\d{2})')),
+    ('slash', re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')),
+    ('dash', re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})')),
+    ('french', re.compile(r'(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})')),
+]
+_ISO_DATE_RE = DATE_PATTERNS[0][1]
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+# Dictionnaire des mois français
+FRENCH_MONTHS = {
+    'janvier': 1, 'février': 2, 'mars': 3, 'avril': 4, 
+    'mai': 5, 'juin': 6, 'juillet': 7, 'août': 8, 
+    'septembre': 9, 'octobre': 10, 'novembre': 11, 'décembre': 12
+}
+
+# nombre d'appels par motif ayant donné la date ('year_only' = repli AAAA0101, None = échec)
+_date_pattern_hits = Counter()
+_date_pattern_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_string):
+    """
+    Convertit une date au format AAAAMMJJ et retourne (date, nom du motif).
+    Mémoïsé : les pages d'un même site reprennent souvent les mêmes dates.
     """
-    if not date_string:
-        return None
-    
     date_string = clean_text(date_string)
-    
-    date_patterns = [
-        (r'(\d{4})-(\d{2})-(\d{2})', '%Y-%m-%d'),
-        (r'(\d{1,2})/(\d{1,2})/(\d{4})', '%d/%m/%Y'),
-        (r'(\d{1,2})-(\d{1,2})-(\d{4})', '%d-%m-%Y'),
-        (r'(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})', '%d %B %Y'),
-    ]
-    
-    # Dictionnaire des mois français
-    french_months = {
-        'janvier': 1, 'février': 2, 'mars': 3, 'avril': 4, 
-        'mai': 5, 'juin': 6, 'juillet': 7, 'août': 8, 
-        'septembre': 9, 'octobre': 10, 'novembre': 11, 'décembre': 12
-    }
+    lowered = date_string.lower()
     
     # Essayer chaque pattern
-    for pattern, fmt in date_patterns:
-        match = re.search(pattern, date_string.lower())
+    for name, pattern in DATE_PATTERNS:
+        match = pattern.search(lowered)
         if match:
-            try:
-                if fmt == '%Y-%m-%d':
-                    year, month, day = match.groups()
-                    return f"{year}{month.zfill(2)}{day.zfill(2)}"
-                elif fmt in ['%d/%m/%Y', '%d-%m-%Y']:
-                    day, month, year = match.groups()
-                    return f"{year}{month.zfill(2)}{day.zfill(2)}"
-                elif fmt == '%d %B %Y':
-                    day, month_name, year = match.groups()
-                    if month_name in french_months:
-                        month_num = french_months[month_name]
-                        return f"{year}{month_num:02d}{int(day):02d}"
-            except (ValueError, IndexError):
-                continue
+            if name == 'iso':
+                year, month, day = match.groups()
+                return f"{year}{month.zfill(2)}{day.zfill(2)}", name
+            elif name in ('slash', 'dash'):
+                day, month, year = match.groups()
+                return f"{year}{month.zfill(2)}{day.zfill(2)}", name
+            else:
+                day, month_name, year = match.groups()
+                return f"{year}{FRENCH_MONTHS[month_name]:02d}{int(day):02d}", name
     
     # Si aucun pattern ne fonctionne, essayer d'extraire au moins l'année
-    year_match = re.search(r'\b(20\d{2})\b', date_string)
+    year_match = _YEAR_RE.search(date_string)
     if year_match:
-        return f"{year_match.group(1)}0101"  # 1er janvier par défaut
+        return f"{year_match.group(1)}0101", 'year_only'  # 1er janvier par défaut
+    
+    return None, None
+
+
+def _convert_date(date_string):
+    if not date_string:
+        return None, None
+    
+    # chemin rapide : attribut datetime ISO 8601 (le nettoyage ne change pas ses 10 premiers caractères)
+    match = _ISO_DATE_RE.match(date_string)
+    if match:
+        year, month, day = match.groups()
+        return f"{year}{month}{day}", 'iso'
     
-    return None
+    return _parse_date(date_string)
+
+
+def extract_date_with_pattern(date_string):
+    """
+    Extrait une date au format AAAAMMJJ et retourne (date, motif) où motif vaut
+    'iso', 'slash', 'dash', 'french', 'year_only' (repli au 1er janvier) ou None
+    """
+    result = _convert_date(date_string)
+    with _date_pattern_lock:
+        _date_pattern_hits[result[1]] += 1
+    return result
+
+
+def extract_date(date_string):
+    """
+    Extrait et convertit une date au format AAAAMMJJ
+    """
+    return extract_date_with_pattern(date_string)[0]
+
+
+def extract_dates(date_strings):
+    """
+    Convertit une série de dates (ex: toute une archive) : chaque valeur distincte
+    n'est analysée qu'une fois. Retourne les dates AAAAMMJJ dans le même ordre.
+    """
+    converted = {}
+    hits = Counter()
+    results = []
+    for date_string in date_strings:
+        if date_string not in converted:
+            converted[date_string] = _convert_date(date_string)
+        date, pattern = converted[date_string]
+        hits[pattern] += 1
+        results.append(date)
+    
+    with _date_pattern_lock:
+        _date_pattern_hits.update(hits)
+    return results
+
+
+def date_pattern_stats():
+    """
+    Retourne le nombre de dates extraites par motif depuis le lancement
+    (clé 'year_only' : dates réduites à l'année, None : aucune date trouvée)
+    """
+    with _date_pattern_lock:
+        return dict(_date_pattern_hits)
+
+
+def take_date_pattern_stats():
+    """
+    Retourne les compteurs par motif et les remet à zéro : un processus de travail
+    renvoie ainsi ses extractions au processus principal (voir merge_date_pattern_stats)
+    """
+    with _date_pattern_lock:
+        hits = dict(_date_pattern_hits)
+        _date_pattern_hits.clear()
+        return hits
+
+
+def merge_date_pattern_stats(hits):
+    """
+    Ajoute aux compteurs du processus courant ceux renvoyés par un processus de travail
+    """
+    with _date_pattern_lock:
+        _date_pattern_hits.update(hits)
 
 
 def format_content(content):